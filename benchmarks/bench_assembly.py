@@ -0,0 +1,53 @@
+"""
+Measures the time and peak memory of assembling the sparse matrix form of a
+large, sparse LP model.
+
+Usage:
+    python benchmarks/bench_assembly.py [rows columns nonzeros_per_row]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+
+
+def sparse_model(m: int, n: int, k: int, seed: int = 0) -> Model:
+    """
+    Builds a random model with m rows, n columns and k nonzeros per row.
+    """
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {m}x{n}")
+    x = [model.add_variable(f"x{j+1}") for j in range(n)]
+    for i in range(m):
+        columns = rng.choice(n, k, replace=False)
+        model.add_constraint(LinearExpr([x[j] for j in columns], list(rng.uniform(1, 2, k))), "<=", 1.0)
+    model.set_objective(LinearExpr(list(x), [1.0] * n), "max")
+    return model
+
+
+def main(m: int, n: int, k: int):
+    start = time.perf_counter()
+    model = sparse_model(m, n, k)
+    print(f"model build:     {time.perf_counter() - start:8.3f} s")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    form = model.to_matrix_form()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"assembly:        {elapsed:8.3f} s")
+    print(f"nonzeros:        {form.A.nnz:8d}")
+    print(f"peak memory:     {peak / 2**20:8.1f} MiB")
+    print(f"dense (m x m+n): {8 * m * (m + n) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:4])) if len(sys.argv) > 3 else (20000, 50000, 5))
@@ -0,0 +1,74 @@
+"""
+Solves a burst of models with Model.solve_async under limiters of
+different sizes, and measures how long a cancelled solve takes to stop
+and how far a re-solve from its basis still has to go.
+
+Usage:
+    python benchmarks/bench_async.py [models size]
+"""
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import CancellationToken, Model, SolveLimiter
+
+
+def build(size: int, seed: int) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"async_{seed}")
+    x = model.add_variables(size, 0, 10)
+    m = size // 2
+    model.add_constraints_from_matrix(rng.uniform(0, 1, (m, size)), "<=", rng.uniform(size / 4, size / 2, m), x)
+    model.set_objective(x.dot(rng.uniform(1, 2, size)), "max")
+    return model
+
+
+async def burst(models, limit: int) -> float:
+    limiter = SolveLimiter(limit)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(model.solve_async(warm_start=False, limiter=limiter) for model in models))
+    assert all(result.status == "optimal" for result in results)
+    return time.perf_counter() - started
+
+
+async def cancelled(model: Model, after: float) -> float:
+    token = CancellationToken()
+    task = asyncio.ensure_future(model.solve_async(warm_start=False, presolve=False, cancel=token))
+    await asyncio.sleep(after)
+    task.cancel()
+    started = time.perf_counter()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return time.perf_counter() - started
+
+
+def main(count: int, size: int):
+    models = [build(size, seed) for seed in range(count)]
+    for model in models:
+        model.to_matrix_form()
+    limits = sorted({1, os.cpu_count() or 1, count})
+    for limit in limits:
+        elapsed = asyncio.run(burst(models, limit))
+        print(f"{count} solves with {limit:>3} at a time: {elapsed:8.4f}s")
+
+    full = build(size, count).solve(presolve=False)
+    model = build(size, count)
+    stopped = asyncio.run(cancelled(model, full.time / 2))
+    resumed = model.solve(presolve=False)
+    print(f"cancelled halfway through a {full.time:.4f}s solve, stopped after {stopped:.4f}s; "
+          f"the re-solve took {resumed.iterations} of {full.iterations} iterations")
+
+    limited = model.solve(warm_start=False, presolve=False, time_limit=full.time / 4)
+    print(f"time limit {full.time / 4:.4f}s: {limited.status} after {limited.iterations} iterations, "
+          f"objective {limited.objective:.6g} of {full.objective:.6g}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (16, 300))
@@ -0,0 +1,60 @@
+"""
+Compares solving a family of LPs that share the constraint matrix and
+differ in perturbed right-hand sides and objectives one by one with the
+BatchSimplexSolver, which pivots only for instances that no earlier
+optimal basis fits.
+
+Usage:
+    python benchmarks/bench_batch.py [size instances]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.core.matrix_form import MatrixForm
+from optizenith.solvers import DualSimplexSolver, BatchSimplexSolver
+
+
+def sparse_model(n: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {n}x{n}")
+    model.add_variables(n)
+    for i in range(n):
+        columns = np.append(rng.choice(n, k - 1), i)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, k), model), "<=", rng.uniform(1, 10))
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def main(n: int, instances: int):
+    model = sparse_model(n, 5)
+    form = model.to_matrix_form()
+    rng = np.random.default_rng(1)
+    print(f"{'noise':>7} {'method':>10} {'time [s]':>9} {'pivoted':>8} {'bases':>6} {'max diff':>9}")
+    for noise in (0.001, 0.01, 0.05):
+        rhs = form.b * rng.uniform(1 - noise, 1 + noise, (instances, len(form.b)))
+        costs = form.c * rng.uniform(1 - noise, 1 + noise, (instances, len(form.c)))
+
+        start = time.perf_counter()
+        reference = np.array([DualSimplexSolver(MatrixForm(form.A, rhs[k], costs[k]), max_iterations=100000).solve()[0]
+                              for k in range(instances)])
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        solver = BatchSimplexSolver(model, rhs=rhs, costs=costs, max_iterations=100000)
+        objectives, _ = solver.solve()
+        batch = time.perf_counter() - start
+
+        difference = np.max(np.abs(objectives - reference))
+        print(f"{noise:>7} {'loop':>10} {loop:>9.4f} {instances:>8} {'':>6} {'':>9}")
+        print(f"{noise:>7} {'batch':>10} {batch:>9.4f} {solver.individual_solves:>8} "
+              f"{len(solver.bases):>6} {difference:>9.2e}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (100, 50))
@@ -0,0 +1,57 @@
+"""
+Compares solving a model with boxed variables and ranged constraints,
+which the solvers handle natively, with solving the same model written
+with every bound and every side of a range as a row of its own.
+
+Usage:
+    python benchmarks/bench_bounds.py [variables constraints]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+
+
+def boxed_model(n: int, m: int, native: bool, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    lb = rng.uniform(-5, 0, n)
+    ub = rng.uniform(1, 5, n)
+    model = Model("native" if native else "rows")
+    x = model.add_variables(n, lb, ub) if native else model.add_variables(n, -np.inf, np.inf)
+    for i in range(m):
+        columns = rng.choice(n, 10, replace=False)
+        values = rng.uniform(-1, 1, 10)
+        hi = rng.uniform(5, 10)
+        expression = LinearExpr.from_arrays(columns, values, model)
+        if native:
+            model.add_constraint(expression, "<=", hi, rhs_range=hi + 5)
+        else:
+            model.add_constraint(expression, "<=", hi)
+            model.add_constraint(LinearExpr.from_arrays(columns, values, model), ">=", -5)
+    if not native:
+        for j in range(n):
+            model.add_constraint(LinearExpr.from_arrays([j], [1.0], model), ">=", lb[j])
+            model.add_constraint(LinearExpr.from_arrays([j], [1.0], model), "<=", ub[j])
+    model.set_objective(x.dot(rng.uniform(-1, 1, n)), "min")
+    return model
+
+
+def main(n: int, m: int):
+    for solver in ("simplex", "dual-simplex"):
+        for native in (True, False):
+            model = boxed_model(n, m, native)
+            rows, columns = model.to_matrix_form().shape
+            start = time.perf_counter()
+            result = model.solve(solver=solver, warm_start=False, presolve=False, max_iterations=1000000)
+            elapsed = time.perf_counter() - start
+            print(f"{solver:>13} {model.name:>6}: {rows:>5} x {columns:<5} {result.iterations:>6} iterations "
+                  f"{elapsed:>8.3f}s objective {result.objective:.6f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (300, 150))
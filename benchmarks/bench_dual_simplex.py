@@ -0,0 +1,75 @@
+"""
+Compares cold solves with warm-started dual simplex re-solves of a model
+after tightening right-hand sides and after adding cutting constraints,
+including ">=" and "=" rows.
+
+Usage:
+    python benchmarks/bench_dual_simplex.py [size resolves]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.solvers import SimplexSolver, DualSimplexSolver
+
+
+def sparse_model(n: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {n}x{n}")
+    model.add_variables(n)
+    for i in range(n):
+        columns = np.append(rng.choice(n, k - 1), i)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, k), model), "<=", rng.uniform(1, 10))
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def tighten_rhs(model: Model, rng) -> None:
+    for constraint in rng.choice(model.constraints, 5, replace=False):
+        constraint.rhs *= rng.uniform(0.8, 0.95)
+
+
+def add_cut(model: Model, rng) -> None:
+    n = len(model.variables)
+    columns = rng.choice(n, 20, replace=False)
+    expression = LinearExpr.from_arrays(columns, np.ones(20), model)
+    model.add_constraint(expression, "<=", rng.uniform(1, 5))
+    columns = rng.choice(n, 2, replace=False)
+    model.add_constraint(LinearExpr.from_arrays(columns, np.array([1.0, -1.0]), model), "=", 0)
+
+
+def resolve(solver_class, model: Model, change, warm_start: bool, resolves: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    solver = solver_class(model, max_iterations=100000)
+    solver.solve()
+    iterations = 0
+    start = time.perf_counter()
+    for _ in range(resolves):
+        change(model, rng)
+        solver = solver_class(model, max_iterations=100000, warm_start=solver.basis if warm_start else None)
+        objective, _ = solver.solve()
+        iterations += solver.iterations
+    return (time.perf_counter() - start) / resolves, iterations / resolves, objective
+
+
+def main(n: int, resolves: int):
+    print(f"{'change':>8} {'solver':>7} {'start':>6} {'time [s]':>9} {'iters':>7} {'objective':>12}")
+    runs = (
+        ("rhs", tighten_rhs, "primal", SimplexSolver),
+        ("rhs", tighten_rhs, "dual", DualSimplexSolver),
+        ("cuts", add_cut, "dual", DualSimplexSolver),
+    )
+    for label, change, name, solver_class in runs:
+        for warm_start in (False, True):
+            elapsed, iterations, objective = resolve(solver_class, sparse_model(n, 5), change, warm_start, resolves)
+            print(f"{label:>8} {name:>7} {'warm' if warm_start else 'cold':>6} {elapsed:>9.4f} "
+                  f"{iterations:>7.1f} {objective:>12.4f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (1000, 10))
@@ -0,0 +1,62 @@
+"""
+Compares building and assembling a model with about one million nonzeros
+using repeated +, in-place +=, quicksum and LinearExpr.from_arrays.
+
+Usage:
+    python benchmarks/bench_expressions.py [rows nonzeros_per_row]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr, quicksum
+
+
+def build(style: str, m: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    n = m
+    indices = rng.integers(0, n, (m, k))
+    coeffs = rng.uniform(1, 2, (m, k))
+
+    model = Model(style)
+    x = [model.add_variable(f"x{j+1}") for j in range(n)]
+    for i in range(m):
+        row_indices = indices[i]
+        row_coeffs = coeffs[i]
+        if style == "+":
+            expr = LinearExpr()
+            for j, a in zip(row_indices.tolist(), row_coeffs.tolist()):
+                expr = expr + a * x[j]
+        elif style == "+=":
+            expr = LinearExpr()
+            for j, a in zip(row_indices.tolist(), row_coeffs.tolist()):
+                expr += a * x[j]
+        elif style == "quicksum":
+            expr = quicksum(a * x[j] for j, a in zip(row_indices.tolist(), row_coeffs.tolist()))
+        elif style == "from_arrays":
+            expr = LinearExpr.from_arrays(row_indices, row_coeffs, model)
+        model.add_constraint(expr, "<=", 1.0)
+    return model
+
+
+def main(m: int, k: int):
+    print(f"{m} rows x {k} nonzeros per row")
+    print(f"{'style':>12} {'build [s]':>10} {'assembly [s]':>13} {'total [s]':>10} {'speedup':>8}")
+    baseline = None
+    for style in ("+", "+=", "quicksum", "from_arrays"):
+        start = time.perf_counter()
+        model = build(style, m, k)
+        built = time.perf_counter()
+        model.to_matrix_form()
+        done = time.perf_counter()
+        total = done - start
+        baseline = baseline or total
+        print(f"{style:>12} {built - start:>10.3f} {done - built:>13.3f} {total:>10.3f} {baseline / total:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (10000, 100))
@@ -0,0 +1,54 @@
+"""
+Measures the cost of importing optizenith in a fresh interpreter, the
+modules the import pulls in, and the extra time of the first solve, which
+imports SciPy and the solver.
+
+Usage:
+    python benchmarks/bench_import.py [repeats]
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import optizenith
+imported = time.perf_counter()
+loaded = [name for name in ("numpy", "scipy", "optizenith.solvers.simplex", "optizenith.core.presolve")
+          if name in sys.modules]
+model = optizenith.Model("import")
+x = model.add_variable("x", ub=1)
+model.add_constraint(x + 0, "<=", 2)
+model.add_constraint(x + 0, ">=", 0)
+model.set_objective(x + 0, "max")
+model.solve(presolve=False)
+solved = time.perf_counter()
+print(imported - started, solved - imported, ",".join(loaded))
+"""
+
+
+def main(repeats: int):
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+    baseline = []
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", "import time; t = time.perf_counter(); import numpy; "
+                                 "print(time.perf_counter() - t)"], capture_output=True, text=True, env=env)
+        baseline.append(float(output.stdout))
+        output = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True, env=env, check=True)
+        runs.append(output.stdout.split())
+    imports = np.array([float(run[0]) for run in runs])
+    solves = np.array([float(run[1]) for run in runs])
+    print(f"import numpy:      median {np.median(baseline) * 1000:8.1f} ms")
+    print(f"import optizenith: median {np.median(imports) * 1000:8.1f} ms, min {imports.min() * 1000:8.1f} ms")
+    print(f"first solve:       median {np.median(solves) * 1000:8.1f} ms")
+    print(f"loaded by import:  {runs[0][2] if len(runs[0]) > 2 else '-'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
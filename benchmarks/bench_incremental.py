@@ -0,0 +1,76 @@
+"""
+Measures the assembly of the matrix form after small edits of a model,
+which patch the rows kept in the constraint store, against assembling
+the whole model from its constraint expressions.
+
+Usage:
+    python benchmarks/bench_incremental.py [variables constraints]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+from optizenith.core.matrix_form import MatrixForm
+
+
+def build(n: int, m: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model("incremental")
+    x = model.add_variables(n, 0, 10)
+    for i in range(m):
+        columns = rng.choice(n, 5, replace=False)
+        expression = sum((float(value) * x[int(j)] for j, value in zip(columns, rng.uniform(0.5, 1.5, 5))), 0)
+        model.add_constraint(expression, "<=", rng.uniform(10, 25))
+    model.set_objective(x.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def timed(assemble, repeats: int = 5) -> float:
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        assemble()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n: int, m: int):
+    model = build(n, m)
+    x = model.variables
+    start = time.perf_counter()
+    model.to_matrix_form()
+    print(f"first assembly:  {time.perf_counter() - start:8.4f}s for {m} x {n}")
+
+    # The same model before its constraints are moved into the store
+    fresh = build(n, m)
+    full = timed(lambda: MatrixForm.from_model(fresh))
+    edits = {
+        "set_rhs": lambda: model.set_rhs(model.constraints[m // 2], 12.0),
+        "set_coefficient": lambda: model.set_coefficient(model.constraints[m // 3], x[n // 2], 2.0),
+        "set_bounds": lambda: model.set_bounds(x[n // 4], ub=5.0),
+        "add_constraint": lambda: model.add_constraint(x[0] + x[1], "<=", 15),
+        "remove_constraint": lambda: model.remove_constraint(model.constraints[-1]),
+    }
+    print(f"{'edit':>18} {'after edit':>11} {'from scratch':>13} {'speedup':>8}")
+    for name, edit in edits.items():
+        elapsed = timed(lambda: (edit(), model.to_matrix_form()))
+        print(f"{name:>18} {elapsed:>10.4f}s {full:>12.4f}s {full / elapsed:>7.1f}x")
+
+    reference = MatrixForm.from_model(model)
+    form = model.to_matrix_form()
+    assert (form.A != reference.A).nnz == 0 and np.array_equal(form.b, reference.b)
+
+    model.solve()
+    model.set_rhs(model.constraints[0], 11.0)
+    result = model.solve()
+    print(f"re-solve after an edit: {result.status}, assembly {result.profile.timings['assembly']:.4f}s, "
+          f"{result.iterations} iterations, total {result.time:.4f}s")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (4000, 2000))
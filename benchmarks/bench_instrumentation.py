@@ -0,0 +1,60 @@
+"""
+Measures the overhead of the solver instrumentation on a sparse LP that
+takes many cheap iterations: solving without subscribers, with a callback
+that does nothing and with a callback that keeps every event, and prints
+the profile of the solve.
+
+Usage:
+    python benchmarks/bench_instrumentation.py [variables constraints]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+
+
+def sparse_model(n: int, m: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model("sparse")
+    x = model.add_variables(n, 0, 10)
+    for i in range(m):
+        columns = rng.choice(n, 5, replace=False)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, 5), model), "<=", rng.uniform(1, 10))
+    model.set_objective(x.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def best_of(model: Model, repeats: int = 5, **kwargs):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = model.solve(warm_start=False, presolve=False, max_iterations=1000000, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(n: int, m: int):
+    model = sparse_model(n, m)
+    events = []
+    best_of(model, 1)
+    baseline, result = best_of(model)
+    for label, kwargs in (("no subscribers", {}), ("no-op callback", {"callbacks": lambda event: None}),
+                          ("collecting events", {"callbacks": events.append})):
+        elapsed, _ = (baseline, result) if not kwargs else best_of(model, **kwargs)
+        print(f"{label:>18}: {elapsed:8.3f}s {elapsed / baseline - 1:>+7.1%} "
+              f"({result.iterations} iterations, {elapsed / result.iterations * 1e6:.1f} us each)")
+
+    timings, counters = result.profile
+    print("phase timings:")
+    for phase, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {phase:>16} {seconds:8.4f}s {seconds / result.time:>6.1%}")
+    print("counters:", ", ".join(f"{name}={count}" for name, count in sorted(counters.items())))
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (2000, 1000))
@@ -0,0 +1,50 @@
+"""
+Compares the iteration counts and run times of the interior point method
+and the simplex method on dense random LPs of growing size.
+
+Usage:
+    python benchmarks/bench_interior_point.py [size ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+from optizenith.solvers import InteriorPointSolver, SimplexSolver
+
+
+def dense_model(m: int, n: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"dense {m}x{n}")
+    model.add_variables(n)
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(n / 4, n / 2, m)
+    for i in range(m):
+        model.add_constraint(model.variables.dot(A[i]), "<=", b[i])
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def run(solver):
+    start = time.perf_counter()
+    objective, _ = solver.solve()
+    return time.perf_counter() - start, solver.iterations, objective
+
+
+def main(sizes):
+    print(f"{'rows':>6} {'cols':>6} {'solver':>8} {'time [s]':>9} {'iters':>6} {'objective':>14}")
+    for m in sizes:
+        model = dense_model(m, 4 * m // 3)
+        n = len(model.variables)
+        for name, solver in (("ipm", InteriorPointSolver(model)),
+                             ("simplex", SimplexSolver(model, max_iterations=1000000))):
+            elapsed, iterations, objective = run(solver)
+            print(f"{m:>6} {n:>6} {name:>8} {elapsed:>9.3f} {iterations:>6} {objective:>14.6f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [150, 300, 600, 1200])
@@ -0,0 +1,63 @@
+"""
+Compares adding the rows of a sparse matrix as constraints one at a time,
+with an expression per row, against adding them in one call with
+Model.add_constraints_from_matrix and with A @ x <= b.
+
+Usage:
+    python benchmarks/bench_matrix_constraints.py [variables constraints]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+
+
+def per_row(A: sp.csr_matrix, b: np.ndarray) -> Model:
+    model = Model("per_row")
+    model.add_variables(A.shape[1])
+    for i in range(A.shape[0]):
+        start, stop = A.indptr[i], A.indptr[i + 1]
+        model.add_constraint(LinearExpr.from_arrays(A.indices[start:stop], A.data[start:stop], model), "<=", b[i])
+    return model
+
+
+def from_matrix(A: sp.csr_matrix, b: np.ndarray) -> Model:
+    model = Model("from_matrix")
+    x = model.add_variables(A.shape[1])
+    model.add_constraints_from_matrix(A, "<=", b, x)
+    return model
+
+
+def matmul(A: sp.csr_matrix, b: np.ndarray) -> Model:
+    model = Model("matmul")
+    x = model.add_variables(A.shape[1])
+    model.add_constraints(A @ x <= b)
+    return model
+
+
+def main(n: int, m: int):
+    rng = np.random.default_rng(0)
+    A = sp.random(m, n, density=min(1.0, 10 / n), format="csr", random_state=rng)
+    b = rng.uniform(1, 10, m)
+    reference = None
+    for build in (per_row, from_matrix, matmul):
+        start = time.perf_counter()
+        model = build(A, b)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        form = model.to_matrix_form()
+        assembled = time.perf_counter() - start
+        if reference is None:
+            reference = form
+        assert (form.A != reference.A).nnz == 0 and np.array_equal(form.b, reference.b)
+        print(f"{build.__name__:>12}: {m} rows added in {built:8.4f}s, assembled in {assembled:8.4f}s")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (20000, 50000))
@@ -0,0 +1,45 @@
+"""
+Solves a random multi-dimensional knapsack problem with general integer
+variables by branch and bound and prints the progress log, with the node
+throughput and the gap over time, for one worker and for several.
+
+Usage:
+    python benchmarks/bench_mip.py [variables constraints]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+
+
+def knapsack(n: int, m: int) -> Model:
+    rng = np.random.default_rng(0)
+    model = Model("knapsack")
+    x = model.add_variables(n, 0, 5, "integer")
+    weights = rng.uniform(1, 10, (m, n))
+    for i in range(m):
+        model.add_constraint(x.dot(weights[i]), "<=", weights[i].sum())
+    model.set_objective(x.dot(rng.uniform(1, 10, n)), "max")
+    return model
+
+
+def main(n: int, m: int):
+    model = knapsack(n, m)
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        result = model.solve(solver="dual-simplex", warm_start=False, workers=workers, time_limit=10,
+                             log_interval=1.0)
+        print(f"workers={workers}: {result.status}, objective {result.objective:.4f}, "
+              f"{result.mip.nodes} nodes, gap {result.mip.gap:.2%}, {result.time:.2f} s")
+        print(f"{'time [s]':>9} {'nodes':>8} {'open':>6} {'incumbent':>11} {'bound':>11} {'gap':>8} {'nodes/s':>8}")
+        for entry in result.mip.log:
+            incumbent = entry.incumbent if entry.incumbent is not None else float("nan")
+            print(f"{entry.time:>9.2f} {entry.nodes:>8} {entry.open_nodes:>6} {incumbent:>11.4f} "
+                  f"{entry.bound:>11.4f} {entry.gap:>8.2%} {entry.nodes_per_second:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (30, 10))
@@ -0,0 +1,64 @@
+"""
+Writes a synthetic sparse model to MPS and LP files, plain and gzipped, and
+measures the time and the peak memory of writing and reading them back.
+The peak memory of reading is reported per nonzero and should stay flat as
+the model grows.
+
+Usage:
+    python benchmarks/bench_mps.py [variables constraints]
+"""
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+
+
+def synthetic_model(n: int, m: int, density: float = 0.001) -> Model:
+    rng = np.random.default_rng(0)
+    model = Model("synthetic")
+    model.add_variables(n, 0, rng.uniform(1, 10, n), name="x")
+    A = sp.random(m, n, density=density, format="csr", random_state=rng, data_rvs=lambda k: rng.uniform(1, 5, k))
+    model._extend_constraints(A, np.full(m, "<=", dtype=object), rng.uniform(10, 100, m),
+                              [f"r{i}" for i in range(m)])
+    model.set_objective(model.variables.dot(rng.uniform(0, 1, n)), "max")
+    return model
+
+
+def measured(function):
+    # Timed without tracing, which slows allocations down severalfold
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(n: int, m: int):
+    model = synthetic_model(n, m)
+    nnz = model.to_matrix_form().A.nnz
+    print(f"{n} variables, {m} constraints, {nnz} nonzeros")
+    print(f"{'file':>12} {'size [MB]':>10} {'write [s]':>10} {'read [s]':>10} {'read peak [MB]':>15} {'bytes/nnz':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("model.mps", "model.mps.gz", "model.lp", "model.lp.gz"):
+            path = os.path.join(directory, name)
+            write, read = (model.write_mps, Model.read_mps) if ".mps" in name else (model.write_lp, Model.read_lp)
+            _, write_time, _ = measured(lambda: write(path))
+            copy, read_time, peak = measured(lambda: read(path))
+            assert copy.to_matrix_form().A.nnz == nnz
+            print(f"{name:>12} {os.path.getsize(path) / 1e6:>10.1f} {write_time:>10.3f} {read_time:>10.3f} "
+                  f"{peak / 1e6:>15.1f} {peak / nnz:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (20000, 10000))
@@ -0,0 +1,59 @@
+"""
+Compares a parametric right-hand side sweep, which pivots from the optimal
+basis through the breakpoints of the optimal value, with re-solving the
+model on a grid of parameter values.
+
+Usage:
+    python benchmarks/bench_parametric.py [size grid]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.core.matrix_form import MatrixForm
+from optizenith.solvers import DualSimplexSolver
+
+
+def sparse_model(n: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {n}x{n}")
+    model.add_variables(n)
+    for i in range(n):
+        columns = np.append(rng.choice(n, k - 1), i)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, k), model), "<=", rng.uniform(1, 10))
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def main(n: int, grid: int):
+    model = sparse_model(n, 5)
+    form = model.to_matrix_form()
+    direction = np.random.default_rng(1).uniform(0, 1, n)
+
+    start = time.perf_counter()
+    solver = DualSimplexSolver(model, max_iterations=100000)
+    solver.solve()
+    path = solver.parametric_solve(direction, (0, 5))
+    sweep = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for t in np.linspace(0, 5, grid):
+        DualSimplexSolver(MatrixForm(form.A, form.b + t * direction, form.c), max_iterations=100000).solve()
+    resolves = time.perf_counter() - start
+
+    # The sweep's objective is exact at the breakpoints and linear in between
+    t = path.t[len(path.t) // 2]
+    check, _ = DualSimplexSolver(MatrixForm(form.A, form.b + t * direction, form.c), max_iterations=100000).solve()
+    print(f"{'method':>10} {'time [s]':>9} {'points':>7}")
+    print(f"{'sweep':>10} {sweep:>9.4f} {len(path.t):>7}")
+    print(f"{'re-solve':>10} {resolves:>9.4f} {grid:>7}")
+    print(f"difference at a breakpoint: {abs(check - path.objectives[len(path.t) // 2]):.2e}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (200, 30))
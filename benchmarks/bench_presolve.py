@@ -0,0 +1,65 @@
+"""
+Measures presolve on sparse models with the redundancy of generated
+models: fixed variables (as singleton equality rows), empty, singleton and
+duplicate rows and dominated columns, and compares solving them with and
+without presolve.
+
+Usage:
+    python benchmarks/bench_presolve.py [size]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.core.presolve import Presolve
+
+
+def redundant_model(n: int, k: int = 5, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"redundant {n}x{n}")
+    model.add_variables(n)
+    c = rng.uniform(1, 2, n)
+    c[rng.random(n) < 0.05] = -1
+    for i in range(n):
+        columns = np.unique(np.append(rng.choice(n, k - 1), i))
+        values = rng.uniform(1, 2, len(columns))
+        model.add_constraint(LinearExpr.from_arrays(columns, values, model), "<=", rng.uniform(5, 10))
+        kind = rng.random()
+        if kind < 0.05:
+            model.add_constraint(LinearExpr.from_arrays(columns, 2 * values, model), "<=", rng.uniform(10, 20))
+        elif kind < 0.10:
+            model.add_constraint(LinearExpr.from_arrays([i], [rng.uniform(1, 2)], model), "<=", rng.uniform(1, 5))
+        elif kind < 0.12:
+            model.add_constraint(LinearExpr(), "<=", 1)
+        elif kind < 0.22:
+            model.add_constraint(LinearExpr.from_arrays([i], [1.0], model), "=", rng.uniform(0, 0.1))
+    model.set_objective(model.variables.dot(c), "max")
+    return model
+
+
+def main(n: int):
+    model = redundant_model(n)
+    form = model.to_matrix_form()
+    start = time.perf_counter()
+    presolved = Presolve(form)
+    elapsed = time.perf_counter() - start
+    m, n = form.shape
+    print(f"original {m} x {n}, {form.A.nnz} nonzeros; presolve took {elapsed:.3f}s")
+    print(f"removed {presolved.report.rows} rows, {presolved.report.columns} columns, "
+          f"{presolved.report.nonzeros} nonzeros")
+
+    for solver in ("dual-simplex", "interior-point"):
+        for presolve in (False, True):
+            start = time.perf_counter()
+            result = model.solve(solver=solver, warm_start=False, presolve=presolve, max_iterations=1000000)
+            elapsed = time.perf_counter() - start
+            print(f"{solver:>15} presolve={str(presolve):<5} {elapsed:>8.3f}s objective {result.objective:.6f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
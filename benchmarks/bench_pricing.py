@@ -0,0 +1,84 @@
+"""
+Compares iteration counts and wall time of the simplex pricing rules on a
+small set of generated LPs, including degenerate scheduling-style models.
+
+Usage:
+    python benchmarks/bench_pricing.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.solvers import SimplexSolver
+
+RULES = ("dantzig", "partial", "devex", "steepest-edge")
+
+
+def dense_model(m: int, n: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"dense {m}x{n}")
+    x = model.add_variables(n)
+    for i in range(m):
+        model.add_constraint(x.dot(rng.uniform(0, 1, n)), "<=", rng.uniform(n / 4, n / 2))
+    model.set_objective(x.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def sparse_model(m: int, n: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {m}x{n}")
+    model.add_variables(n)
+    for i in range(m):
+        # Row i always covers column i % n so that no column is unbounded
+        columns = np.append(rng.choice(n, k - 1), i % n)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, k), model), "<=", rng.uniform(1, 10))
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def scheduling_model(jobs: int, resources: int, seed: int = 0) -> Model:
+    """
+    A degenerate LP relaxation of a scheduling problem: select jobs (x_j <= 1)
+    subject to precedences x_i <= x_j, which all have a zero right-hand side,
+    and resource capacities.
+    """
+    rng = np.random.default_rng(seed)
+    model = Model(f"scheduling {jobs}x{resources}")
+    model.add_variables(jobs)
+    for j in range(jobs):
+        model.add_constraint(LinearExpr.from_arrays([j], [1.0], model), "<=", 1)
+    for _ in range(2 * jobs):
+        i, j = rng.choice(jobs, 2, replace=False)
+        model.add_constraint(LinearExpr.from_arrays([i, j], [1.0, -1.0], model), "<=", 0)
+    for _ in range(resources):
+        members = rng.choice(jobs, jobs // 4, replace=False)
+        usage = rng.integers(1, 5, len(members)).astype(float)
+        model.add_constraint(LinearExpr.from_arrays(members, usage, model), "<=", usage.sum() / 3)
+    model.set_objective(model.variables.dot(rng.uniform(1, 10, jobs)), "max")
+    return model
+
+
+def main():
+    models = [
+        dense_model(200, 200),
+        sparse_model(1000, 1000, 5),
+        scheduling_model(200, 20),
+        scheduling_model(400, 40, seed=1),
+    ]
+    print(f"{'model':>22} {'pricing':>14} {'iters':>6} {'time [s]':>9} {'objective':>12}")
+    for model in models:
+        for rule in RULES:
+            solver = SimplexSolver(model, pricing=rule, max_iterations=100000)
+            start = time.perf_counter()
+            obj, _ = solver.solve()
+            elapsed = time.perf_counter() - start
+            print(f"{model.name:>22} {rule:>14} {solver.iterations:>6} {elapsed:>9.3f} {obj:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares the per-iteration cost of the revised (LU + eta updates) simplex
+against the dense-inverse basis representation on random dense LPs.
+
+Usage:
+    python benchmarks/bench_simplex.py [size ...]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.solvers import SimplexSolver
+
+
+def random_model(m: int, n: int, seed: int = 0) -> Model:
+    """
+    Builds a random bounded and feasible LP: max c^T x, A x <= b, x >= 0.
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(n / 4, n / 2, m)
+    c = rng.uniform(1, 2, n)
+
+    model = Model(f"random {m}x{n}")
+    x = [model.add_variable(f"x{j+1}") for j in range(n)]
+    for i in range(m):
+        model.add_constraint(LinearExpr(list(x), list(A[i])), "<=", b[i])
+    model.set_objective(LinearExpr(list(x), list(c)), "max")
+    return model
+
+
+def run(model: Model, method: str):
+    solver = SimplexSolver(model, method=method, max_iterations=100000)
+    start = time.perf_counter()
+    obj, _ = solver.solve()
+    elapsed = time.perf_counter() - start
+    return obj, solver.iterations, elapsed
+
+
+def main(sizes):
+    print(f"{'size':>6} {'method':>8} {'iters':>6} {'total [s]':>10} {'per iter [ms]':>14}")
+    for size in sizes:
+        model = random_model(size, size)
+        objectives = []
+        for method in ("dense", "revised"):
+            obj, iterations, elapsed = run(model, method)
+            objectives.append(obj)
+            per_iter = 1000 * elapsed / max(iterations, 1)
+            print(f"{size:>6} {method:>8} {iterations:>6} {elapsed:>10.3f} {per_iter:>14.3f}")
+        assert np.isclose(objectives[0], objectives[1])
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 400])
@@ -0,0 +1,58 @@
+"""
+Saves a synthetic sparse model as a binary snapshot and compares loading it,
+memory-mapped and read into memory, with unpickling the model and reading
+it from an MPS file.
+
+Usage:
+    python benchmarks/bench_snapshot.py [constraints nonzeros_per_row]
+"""
+import os
+import sys
+import time
+import pickle
+import tempfile
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+
+
+def synthetic_model(m: int, k: int) -> Model:
+    rng = np.random.default_rng(0)
+    n = 2 * m
+    model = Model("synthetic")
+    model.add_variables(n, 0, rng.uniform(1, 10, n))
+    indptr = np.arange(0, m * k + 1, k, dtype=np.int64)
+    A = sp.csr_matrix((rng.uniform(1, 5, m * k), rng.integers(0, n, m * k), indptr), shape=(m, n))
+    model._extend_constraints(A, np.full(m, "<=", dtype=object), rng.uniform(10, 100, m))
+    model.set_objective(model.variables.dot(rng.uniform(0, 1, n)), "max")
+    return model
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(m: int, k: int):
+    model = synthetic_model(m, k)
+    print(f"{2 * m} variables, {m} constraints, {m * k} nonzeros")
+    print(f"{'operation':>20} {'time [s]':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.ozm")
+        print(f"{'save':>20} {timed(lambda: model.save(path)):>10.3f}")
+        print(f"{'load (mmap)':>20} {timed(lambda: Model.load(path)):>10.3f}")
+        print(f"{'load (read)':>20} {timed(lambda: Model.load(path, mmap=False)):>10.3f}")
+        pickled = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"{'unpickle':>20} {timed(lambda: pickle.loads(pickled)):>10.3f}")
+        mps = os.path.join(directory, "model.mps")
+        model.write_mps(mps)
+        print(f"{'read_mps':>20} {timed(lambda: Model.read_mps(mps)):>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (500000, 20))
@@ -0,0 +1,48 @@
+"""
+Compares building a Solution, which wraps the arrays of a solve, with
+building the dictionary keyed by positional names that the solvers used to
+return, and measures lookups and to_dict().
+
+Usage:
+    python benchmarks/bench_solution.py [variables constraints]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith.solvers import Solution
+
+
+def timed(function, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(n: int, m: int):
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 1, n + m)
+    names = np.array([f"v{j}" for j in range(n)], dtype=object)
+
+    def build_dict():
+        return {f"x{i+1}": values[i] for i in range(n + m)}
+
+    def build_solution():
+        return Solution(1.0, values[:n], values[n:], names=names)
+
+    solution = build_solution()
+    keys = [f"x{i+1}" for i in rng.choice(n + m, 1000)]
+    print(f"{'operation':>18} {'time [s]':>10}")
+    print(f"{'dict':>18} {timed(build_dict):>10.5f}")
+    print(f"{'Solution':>18} {timed(build_solution):>10.5f}")
+    print(f"{'1000 lookups':>18} {timed(lambda: [solution[key] for key in keys]):>10.5f}")
+    print(f"{'to_dict':>18} {timed(solution.to_dict):>10.5f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (100000, 50000))
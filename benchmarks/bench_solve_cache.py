@@ -0,0 +1,61 @@
+"""
+Measures a SolveCache on a stream of requests in which models are sent
+again byte for byte or with a perturbed right-hand side: solving every
+request, answering exact repeats from the cache and warm starting the
+others from the nearest cached basis.
+
+Usage:
+    python benchmarks/bench_solve_cache.py [variables requests]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, SolveCache
+
+
+def build(n: int, variant: int) -> Model:
+    rng = np.random.default_rng(0)
+    m = n // 2
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(n / 4, n / 2, m)
+    # Variant 0 is the base model, the others perturb its right-hand side
+    b *= 1 + 0.02 * np.random.default_rng(variant).uniform(-1, 1, m) * (variant > 0)
+    model = Model(f"request_{variant}")
+    x = model.add_variables(n, 0, 10)
+    model.add_constraints_from_matrix(A, "<=", b, x)
+    model.set_objective(x.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def main(n: int, requests: int):
+    rng = np.random.default_rng(1)
+    # Half of the requests repeat one of a few models, the rest are perturbed
+    variants = np.where(rng.uniform(size=requests) < 0.5, rng.integers(0, 4, requests), np.arange(requests) + 4)
+    models = [build(n, int(variant)) for variant in variants]
+    for model in models:
+        model.to_matrix_form()
+
+    results = {}
+    for label, cache in (("no cache", None), ("cache", SolveCache())):
+        started = time.perf_counter()
+        iterations = 0
+        objectives = []
+        for model in models:
+            result = model.solve(warm_start=False, cache=cache)
+            iterations += result.iterations
+            objectives.append(result.objective)
+        results[label] = objectives
+        elapsed = time.perf_counter() - started
+        print(f"{label:>9}: {requests} requests in {elapsed:8.4f}s, {iterations} iterations")
+        if cache is not None:
+            print(f"           {cache}, {cache.warm_starts} warm starts")
+    assert np.allclose(results["no cache"], results["cache"])
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (200, 100))
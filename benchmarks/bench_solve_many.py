@@ -0,0 +1,57 @@
+"""
+Measures the throughput of solve_many on many small independent LPs of the
+same structure with an increasing number of worker processes, reusing one
+pool per worker count so that worker startup is not timed.
+
+Usage:
+    python benchmarks/bench_solve_many.py [models rows cols]
+"""
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, solve_many
+
+
+def small_model(m: int, n: int, seed: int) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"small {seed}")
+    model.add_variables(n)
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(n / 4, n / 2, m)
+    for i in range(m):
+        model.add_constraint(model.variables.dot(A[i]), "<=", b[i])
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def main(count: int, m: int, n: int):
+    models = [small_model(m, n, seed) for seed in range(count)]
+
+    start = time.perf_counter()
+    serial = [model.solve(warm_start=False).objective for model in models]
+    baseline = time.perf_counter() - start
+    print(f"{count} models of {m}x{n} on {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'time [s]':>9} {'models/s':>9} {'speedup':>8}")
+    print(f"{'serial':>7} {baseline:>9.3f} {count / baseline:>9.1f} {1.0:>8.2f}")
+
+    workers = 1
+    while workers <= os.cpu_count():
+        with multiprocessing.Pool(workers) as pool:
+            list(solve_many(models[:workers], pool=pool, workers=workers, warm_start=False))
+            start = time.perf_counter()
+            objectives = [result.objective for result in
+                          solve_many(models, pool=pool, workers=workers, warm_start=False)]
+            elapsed = time.perf_counter() - start
+        assert np.allclose(objectives, serial)
+        print(f"{workers:>7} {elapsed:>9.3f} {count / elapsed:>9.1f} {baseline / elapsed:>8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:4])) if len(sys.argv) > 3 else (2000, 20, 30))
@@ -0,0 +1,50 @@
+"""
+Measures the time and the memory retained by a model when adding one
+million variables, one at a time with Model.add_variable and in bulk with
+Model.add_variables. The handles returned by add_variable are discarded.
+
+Usage:
+    python benchmarks/bench_variables.py [n]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model
+
+
+def measure(label: str, build) -> None:
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    model = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n = len(model.variables)
+    print(f"{label:>28} {elapsed:8.3f} s {current / 2**20:8.1f} MiB {current / n:8.1f} B/var")
+
+
+def main(n: int):
+    print(f"{n} variables")
+    def one_at_a_time():
+        model = Model()
+        for j in range(n):
+            model.add_variable(f"x{j}")
+        return model
+
+    def block(name=None):
+        model = Model()
+        model.add_variables(n, name=name)
+        return model
+
+    measure("add_variable, named", one_at_a_time)
+    measure("add_variables, named", lambda: block("x"))
+    measure("add_variables, unnamed", block)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
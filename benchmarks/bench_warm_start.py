@@ -0,0 +1,65 @@
+"""
+Compares cold and warm-started re-solves of a model after small changes of
+the right-hand side and of the objective.
+
+Usage:
+    python benchmarks/bench_warm_start.py [size resolves]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from optizenith import Model, LinearExpr
+from optizenith.solvers import SimplexSolver
+
+
+def sparse_model(n: int, k: int, seed: int = 0) -> Model:
+    rng = np.random.default_rng(seed)
+    model = Model(f"sparse {n}x{n}")
+    model.add_variables(n)
+    for i in range(n):
+        columns = np.append(rng.choice(n, k - 1), i)
+        model.add_constraint(LinearExpr.from_arrays(columns, rng.uniform(1, 2, k), model), "<=", rng.uniform(1, 10))
+    model.set_objective(model.variables.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def resolve(model: Model, change, warm_start: bool, resolves: int, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    solver = SimplexSolver(model, max_iterations=100000)
+    solver.solve()
+    iterations = 0
+    start = time.perf_counter()
+    for _ in range(resolves):
+        change(model, rng)
+        solver = SimplexSolver(model, max_iterations=100000, warm_start=solver.basis if warm_start else None)
+        objective, _ = solver.solve()
+        iterations += solver.iterations
+    return (time.perf_counter() - start) / resolves, iterations / resolves, objective
+
+
+def change_rhs(model: Model, rng) -> None:
+    for constraint in rng.choice(model.constraints, 5, replace=False):
+        constraint.rhs *= rng.uniform(0.9, 1.1)
+
+
+def change_objective(model: Model, rng) -> None:
+    expression = model.objective.expression
+    for variable in rng.choice(len(model.variables), 5, replace=False):
+        expression[model.variables[int(variable)]] = rng.uniform(1, 2)
+
+
+def main(n: int, resolves: int):
+    print(f"{'change':>10} {'start':>6} {'time [s]':>9} {'iters':>7} {'objective':>12}")
+    for label, change in (("rhs", change_rhs), ("objective", change_objective)):
+        for warm_start in (False, True):
+            elapsed, iterations, objective = resolve(sparse_model(n, 5), change, warm_start, resolves)
+            print(f"{label:>10} {'warm' if warm_start else 'cold':>6} {elapsed:>9.4f} {iterations:>7.1f} {objective:>12.4f}")
+
+
+if __name__ == "__main__":
+    main(*(map(int, sys.argv[1:3])) if len(sys.argv) > 2 else (1000, 10))
@@ -0,0 +1,38 @@
+NAME          BLEND
+ROWS
+ N  COST
+ E  TOTAL
+ G  PROTEIN
+ L  FIBER
+ L  SUGAR
+ E  MOIST
+COLUMNS
+    I1        COST           20.0   TOTAL          1.0
+    I1        PROTEIN        10.0   FIBER          2.0
+    I1        SUGAR          12.0   MOIST         12.0
+    I2        COST           35.0   TOTAL          1.0
+    I2        PROTEIN        25.0   FIBER          6.0
+    I2        SUGAR           5.0   MOIST         10.0
+    I3        COST           28.0   TOTAL          1.0
+    I3        PROTEIN        18.0   FIBER          4.0
+    I3        SUGAR           9.0   MOIST         14.0
+    I4        COST           15.0   TOTAL          1.0
+    I4        PROTEIN         8.0   FIBER          8.0
+    I4        SUGAR          14.0   MOIST         11.0
+    I5        COST           40.0   TOTAL          1.0
+    I5        PROTEIN        30.0   FIBER          3.0
+    I5        SUGAR           2.0   MOIST         13.0
+    I6        COST           22.0   TOTAL          1.0
+    I6        PROTEIN        12.0   FIBER          5.0
+    I6        SUGAR           7.0   MOIST         15.0
+RHS
+    RHS       TOTAL         100.0   PROTEIN     1500.0
+    RHS       FIBER         500.0   SUGAR        900.0
+    RHS       MOIST        1250.0
+RANGES
+    RNG       MOIST         -50.0
+BOUNDS
+ LO BND       I2              5.0
+ UP BND       I4             40.0
+ UP BND       I5             20.0
+ENDATA
@@ -0,0 +1,37 @@
+NAME          DIET
+ROWS
+ N  COST
+ G  CALORIES
+ G  PROTEIN
+ G  CALCIUM
+ L  FAT
+COLUMNS
+    BREAD     COST           0.25   CALORIES      80.0
+    BREAD     PROTEIN         3.0   CALCIUM       30.0
+    BREAD     FAT             1.0
+    MILK      COST           0.30   CALORIES     120.0
+    MILK      PROTEIN         8.0   CALCIUM      300.0
+    MILK      FAT             5.0
+    CHEESE    COST           0.60   CALORIES     110.0
+    CHEESE    PROTEIN         7.0   CALCIUM      200.0
+    CHEESE    FAT             9.0
+    POTATO    COST           0.15   CALORIES     160.0
+    POTATO    PROTEIN         4.0   CALCIUM       20.0
+    POTATO    FAT             0.2
+    FISH      COST           1.10   CALORIES     200.0
+    FISH      PROTEIN        40.0   CALCIUM       50.0
+    FISH      FAT             8.0
+    YOGURT    COST           0.45   CALORIES     150.0
+    YOGURT    PROTEIN        13.0   CALCIUM      450.0
+    YOGURT    FAT             4.0
+RHS
+    RHS       CALORIES     2000.0   PROTEIN       55.0
+    RHS       CALCIUM       800.0   FAT           80.0
+BOUNDS
+ UP BND       BREAD          10.0
+ UP BND       MILK            8.0
+ UP BND       CHEESE          4.0
+ UP BND       POTATO          6.0
+ UP BND       FISH            3.0
+ UP BND       YOGURT          4.0
+ENDATA
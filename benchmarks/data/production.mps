@@ -0,0 +1,42 @@
+NAME          PRODUCTION
+OBJSENSE
+    MAX
+ROWS
+ N  PROFIT
+ L  MACHINE
+ L  LABOR
+ L  MATERIAL
+ E  BALANCE
+ G  MIX
+ E  TOTAL
+ L  CAP
+COLUMNS
+    P1        PROFIT         12.0   MACHINE        2.0
+    P1        LABOR           3.0   MATERIAL       5.0
+    P1        BALANCE         1.0   TOTAL          1.0
+    P2        PROFIT         10.0   MACHINE        3.0
+    P2        LABOR           2.0   MATERIAL       4.0
+    P2        BALANCE         1.0   TOTAL          1.0
+    P3        PROFIT          9.0   MACHINE        1.5
+    P3        LABOR           2.0   MATERIAL       6.0
+    P3        MIX             1.0   TOTAL          1.0
+    P4        PROFIT         14.0   MACHINE        4.0
+    P4        LABOR           3.0   MATERIAL       7.0
+    P4        MIX            -0.5   TOTAL          1.0
+    P5        PROFIT         11.0   MACHINE        2.5
+    P5        LABOR           1.0   MATERIAL       3.0
+    P5        TOTAL           1.0
+    SHIP      PROFIT         -2.0   BALANCE       -1.0
+    ADJ       TOTAL          -1.0   CAP            1.0
+RHS
+    RHS       MACHINE       480.0   LABOR        400.0
+    RHS       MATERIAL     1000.0   CAP          150.0
+RANGES
+    RNG       LABOR         100.0   MIX           20.0
+BOUNDS
+ LO BND       SHIP           10.0
+ UP BND       SHIP           60.0
+ LO BND       P5              5.0
+ UP BND       P5             40.0
+ FR BND       ADJ
+ENDATA
@@ -0,0 +1,181 @@
+"""
+Reproducible instance families for the benchmark suite: random sparse LPs,
+random sparse LPs with mixed row types, transportation problems,
+multicommodity flows, degenerate assignment problems and the small MPS
+files in benchmarks/data. Every generator is
+seeded, so a family and a scale always give the same models.
+"""
+import glob
+import os
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from optizenith import Model, LinearExpr
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+SCALES = ("small", "medium", "large")
+
+
+def random_sparse(m: int, n: int, k: int = 5, seed: int = 0) -> Model:
+    """
+    max c^T x with k nonzeros per row, one row in ten a ">=" row, and 0 <= x <= 10.
+    All ones is feasible.
+    """
+    rng = np.random.default_rng(seed)
+    model = Model(f"random_sparse_{m}x{n}")
+    x = model.add_variables(n, 0, 10)
+    for i in range(m):
+        columns = rng.choice(n, k, replace=False)
+        values = rng.uniform(0.5, 1.5, k)
+        if i % 10 == 9:
+            model.add_constraint(LinearExpr.from_arrays(columns, values, model), ">=", rng.uniform(1, 2))
+        else:
+            model.add_constraint(LinearExpr.from_arrays(columns, values, model), "<=", rng.uniform(2 * k, 5 * k))
+    model.set_objective(x.dot(rng.uniform(1, 2, n)), "max")
+    return model
+
+
+def mixed_sparse(m: int, n: int, k: int = 15, seed: int = 0) -> Model:
+    """
+    min c^T x with k normally distributed nonzeros per row, about a quarter
+    of the rows ">=" rows and a tenth "=" rows, and 0 <= x <= 10. A random
+    point in [0, 1]^n is feasible, but the slack basis is not, so the
+    simplex methods need phase one.
+    """
+    rng = np.random.default_rng(seed)
+    model = Model(f"mixed_sparse_{m}x{n}")
+    x = model.add_variables(n, 0, 10)
+    point = rng.uniform(0, 1, n)
+    for _ in range(m):
+        columns = rng.choice(n, k, replace=False)
+        values = rng.standard_normal(k)
+        expression = LinearExpr.from_arrays(columns, values, model)
+        activity = values @ point[columns]
+        kind = rng.uniform()
+        if kind < 0.25:
+            model.add_constraint(expression, ">=", activity - rng.uniform(0, 1))
+        elif kind < 0.35:
+            model.add_constraint(expression, "=", activity)
+        else:
+            model.add_constraint(expression, "<=", activity + rng.uniform(0, 1))
+    model.set_objective(x.dot(rng.standard_normal(n)), "min")
+    return model
+
+
+def transportation(suppliers: int, customers: int, seed: int = 0) -> Model:
+    """
+    min sum c_ij x_ij with the shipments of each supplier at most its supply
+    and those to each customer at least its demand, 90% of the total supply.
+    """
+    rng = np.random.default_rng(seed)
+    supply = rng.uniform(50, 100, suppliers)
+    share = rng.uniform(0.5, 1.5, customers)
+    demand = 0.9 * supply.sum() * share / share.sum()
+    model = Model(f"transportation_{suppliers}x{customers}")
+    x = model.add_variables(suppliers * customers)
+    columns = np.arange(suppliers * customers).reshape(suppliers, customers)
+    for i in range(suppliers):
+        model.add_constraint(LinearExpr.from_arrays(columns[i], np.ones(customers), model), "<=", supply[i])
+    for j in range(customers):
+        model.add_constraint(LinearExpr.from_arrays(columns[:, j], np.ones(suppliers), model), ">=", demand[j])
+    model.set_objective(x.dot(rng.uniform(1, 20, suppliers * customers)), "min")
+    return model
+
+
+def multicommodity_flow(nodes: int, commodities: int, chords: int = 2, seed: int = 0) -> Model:
+    """
+    min-cost multicommodity flow on a bidirected ring with random chords.
+    The ring arcs can carry the total demand, so every instance is feasible;
+    the chords are cheaper but have a smaller shared capacity. The
+    conservation row of each sink is implied by the others and left out.
+    """
+    rng = np.random.default_rng(seed)
+    ring = [(v, (v + 1) % nodes) for v in range(nodes)] + [((v + 1) % nodes, v) for v in range(nodes)]
+    extra = {(int(u), int(v)) for u, v in rng.integers(0, nodes, (chords * nodes, 2)) if u != v}
+    arcs = np.array(ring + sorted(extra - set(ring)))
+    n_arcs = len(arcs)
+    sources = rng.integers(0, nodes, commodities)
+    sinks = (sources + rng.integers(1, nodes, commodities)) % nodes
+    demand = rng.uniform(5, 20, commodities)
+    capacity = np.where(np.arange(n_arcs) < len(ring), demand.sum(), rng.uniform(5, 30, n_arcs))
+    cost = np.where(np.arange(n_arcs) < len(ring), rng.uniform(5, 10, n_arcs), rng.uniform(1, 5, n_arcs))
+
+    model = Model(f"multicommodity_{nodes}x{commodities}")
+    x = model.add_variables(commodities * n_arcs)
+    for k in range(commodities):
+        offset = k * n_arcs
+        for v in range(nodes):
+            if v == sinks[k]:
+                continue
+            out_arcs = np.flatnonzero(arcs[:, 0] == v)
+            in_arcs = np.flatnonzero(arcs[:, 1] == v)
+            columns = offset + np.concatenate([out_arcs, in_arcs])
+            values = np.concatenate([np.ones(len(out_arcs)), -np.ones(len(in_arcs))])
+            model.add_constraint(LinearExpr.from_arrays(columns, values, model), "=",
+                                 demand[k] if v == sources[k] else 0.0)
+    for a in range(n_arcs):
+        columns = a + n_arcs * np.arange(commodities)
+        model.add_constraint(LinearExpr.from_arrays(columns, np.ones(commodities), model), "<=", capacity[a])
+    model.set_objective(x.dot(np.tile(cost, commodities)), "min")
+    return model
+
+
+def assignment(n: int, seed: int = 0) -> Model:
+    """
+    min-cost assignment with costs 1, 2 or 3, so that many assignments tie
+    and every basis is highly degenerate. The last column constraint is
+    implied by the others and left out.
+    """
+    rng = np.random.default_rng(seed)
+    model = Model(f"assignment_{n}")
+    x = model.add_variables(n * n, 0, 1)
+    columns = np.arange(n * n).reshape(n, n)
+    for i in range(n):
+        model.add_constraint(LinearExpr.from_arrays(columns[i], np.ones(n), model), "=", 1)
+    for j in range(n - 1):
+        model.add_constraint(LinearExpr.from_arrays(columns[:, j], np.ones(n), model), "=", 1)
+    model.set_objective(x.dot(rng.integers(1, 4, n * n).astype(float)), "min")
+    return model
+
+
+# The arguments of each generated family per scale
+FAMILIES = {
+    "random_sparse": (random_sparse, {"small": (150, 200), "medium": (600, 800), "large": (2000, 3000)}),
+    "mixed_sparse": (mixed_sparse, {"small": (100, 150, 8), "medium": (300, 450, 22), "large": (800, 1200, 60)}),
+    "transportation": (transportation, {"small": (15, 20), "medium": (40, 60), "large": (80, 120)}),
+    "multicommodity": (multicommodity_flow, {"small": (10, 3), "medium": (25, 6), "large": (50, 10)}),
+    "assignment": (assignment, {"small": (15,), "medium": (40,), "large": (80,)}),
+}
+
+
+def instances(families=None, scale: str = "small") -> List[Tuple[str, str, Callable[[], Model]]]:
+    """
+    Lists the instances of the given families at a scale.
+
+    Args:
+        families (Iterable[str]): The families, from FAMILIES and "mps" for the
+            bundled MPS files. Defaults to None for all of them.
+        scale (str): "small", "medium" or "large". The MPS files have a single size.
+
+    Returns:
+        list: (family, name, build) triples, where build() returns a new Model.
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale: {scale}")
+    families = list(FAMILIES) + ["mps"] if families is None else list(families)
+    result = []
+    for family in families:
+        if family == "mps":
+            for path in sorted(glob.glob(os.path.join(DATA, "*.mps"))):
+                name = os.path.splitext(os.path.basename(path))[0]
+                result.append((family, name, lambda path=path: Model.read_mps(path)))
+        elif family in FAMILIES:
+            generator, sizes = FAMILIES[family]
+            args = sizes[scale]
+            name = f"{family}_{'x'.join(map(str, args))}"
+            result.append((family, name, lambda generator=generator, args=args: generator(*args)))
+        else:
+            raise ValueError(f"Unknown instance family: {family}")
+    return result
@@ -0,0 +1,180 @@
+"""
+Runs the benchmark suite: builds every instance of the chosen families,
+and measures the time to build the model and to assemble its matrix form
+and, for each solver, the solve time, the iterations and the peak memory
+of the solve. The exit status is 1 if any solve does not finish with the
+status "optimal". The results are written as JSON and can be compared
+against a stored baseline, in which case the exit status is also 1 if any
+instance got slower, used more iterations or memory, or changed its
+optimal value beyond the tolerances.
+
+Usage:
+    python run_benchmarks.py [--scale small] [--families random_sparse,mps] [--solvers simplex]
+                             [--repeats 3] [--output results.json] [--baseline baseline.json]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.instances import FAMILIES, SCALES, instances
+from optizenith.core.model import solve_matrix_form
+from optizenith.solvers import get_solver
+
+SOLVERS = ("simplex", "dual-simplex", "interior-point")
+
+
+def measure(family: str, name: str, build, solvers=SOLVERS, repeats: int = 3) -> List[dict]:
+    """
+    Benchmarks one instance with each solver. Times are the best of `repeats`
+    runs; the peak memory is taken in a separate run, since tracing
+    allocations slows the solve down.
+
+    Returns:
+        list: One result per solver.
+    """
+    started = time.perf_counter()
+    model = build()
+    build_time = time.perf_counter() - started
+    assembly_times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        form = model.to_matrix_form()
+        assembly_times.append(time.perf_counter() - started)
+
+    results = []
+    for solver in solvers:
+        record = {"family": family, "instance": name, "solver": solver, "rows": form.shape[0],
+                  "columns": form.shape[1], "nonzeros": int(form.A.nnz), "build_time": build_time,
+                  "assembly_time": min(assembly_times)}
+        try:
+            solve_times = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                solution = solve_matrix_form(form, solver)
+                solve_times.append(time.perf_counter() - started)
+            tracemalloc.start()
+            try:
+                solve_matrix_form(form, solver)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        except ValueError as error:
+            record.update(status=f"error: {error}", objective=None, solve_time=None, iterations=None,
+                          peak_memory=None)
+        else:
+            record.update(status=solution.status, objective=solution.objective, solve_time=min(solve_times),
+                          iterations=solution.iterations, peak_memory=peak)
+        results.append(record)
+    return results
+
+
+def compare(results: List[dict], baseline: List[dict], time_tolerance: float = 0.25,
+            memory_tolerance: float = 0.25, iteration_tolerance: float = 0.1, min_time: float = 0.01,
+            objective_tolerance: float = 1e-6) -> List[str]:
+    """
+    Compares results against a baseline run, matching them by instance and solver.
+
+    A solve regresses if it is more than `time_tolerance` slower and at
+    least `min_time` seconds slower, which keeps the timer noise of tiny
+    instances out, if it takes more than `iteration_tolerance` more
+    iterations or `memory_tolerance` more peak memory, if its optimal value
+    changed by more than `objective_tolerance` relative to its size, or if
+    it failed where the baseline did not.
+
+    Returns:
+        list: A description of each regression.
+    """
+    reference = {(entry["instance"], entry["solver"]): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        key = (entry["instance"], entry["solver"])
+        if key not in reference:
+            continue
+        old = reference[key]
+        label = f"{entry['instance']} / {entry['solver']}"
+        if entry["objective"] is None or old["objective"] is None:
+            if entry["objective"] is None and old["objective"] is not None:
+                regressions.append(f"{label}: {entry['status']}, the baseline was {old['status']}")
+            continue
+        if abs(entry["objective"] - old["objective"]) > objective_tolerance * max(1.0, abs(old["objective"])):
+            regressions.append(f"{label}: objective {entry['objective']:.10g}, the baseline was {old['objective']:.10g}")
+        slower = entry["solve_time"] - old["solve_time"]
+        if slower > min_time and slower > time_tolerance * old["solve_time"]:
+            regressions.append(f"{label}: solve time {entry['solve_time']:.4f}s, "
+                               f"the baseline was {old['solve_time']:.4f}s")
+        if entry["iterations"] > (1 + iteration_tolerance) * old["iterations"]:
+            regressions.append(f"{label}: {entry['iterations']} iterations, the baseline was {old['iterations']}")
+        if entry["peak_memory"] > (1 + memory_tolerance) * old["peak_memory"]:
+            regressions.append(f"{label}: peak memory {entry['peak_memory']} bytes, "
+                               f"the baseline was {old['peak_memory']}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Runs the OptiZenith benchmark suite.")
+    parser.add_argument("--scale", default="small", choices=SCALES)
+    parser.add_argument("--families", default=",".join(list(FAMILIES) + ["mps"]),
+                        help="comma-separated instance families")
+    parser.add_argument("--solvers", default=",".join(SOLVERS), help="comma-separated solvers")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="the JSON file to write the results to")
+    parser.add_argument("--baseline", help="a JSON file of an earlier run to compare against")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--iteration-tolerance", type=float, default=0.1)
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="the seconds a solve must slow down by to count as a regression")
+    args = parser.parse_args(argv)
+
+    solvers = args.solvers.split(",")
+    # Import the solvers up front, so that the first instance does not pay for it
+    for solver in solvers:
+        get_solver(solver)
+
+    results = []
+    print(f"{'instance':<28} {'solver':<15} {'rows':>6} {'cols':>6} {'build':>8} {'assembly':>9} "
+          f"{'solve':>9} {'iters':>7} {'peak MB':>8} {'objective':>16}")
+    for family, name, build in instances(args.families.split(","), args.scale):
+        for record in measure(family, name, build, solvers, args.repeats):
+            results.append(record)
+            if record["objective"] is None:
+                print(f"{name:<28} {record['solver']:<15} {record['status']}")
+                continue
+            print(f"{name:<28} {record['solver']:<15} {record['rows']:>6} {record['columns']:>6} "
+                  f"{record['build_time']:>8.4f} {record['assembly_time']:>9.4f} {record['solve_time']:>9.4f} "
+                  f"{record['iterations']:>7} {record['peak_memory'] / 2 ** 20:>8.2f} {record['objective']:>16.8g}")
+
+    if args.output:
+        metadata = {"created": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(), "numpy": np.__version__,
+                    "platform": platform.platform(), "scale": args.scale, "repeats": args.repeats}
+        with open(args.output, "w") as file:
+            json.dump({"metadata": metadata, "results": results}, file, indent=1)
+
+    failures = [record for record in results if record["status"] != "optimal"]
+    for record in failures:
+        print(f"FAILED {record['instance']} / {record['solver']}: {record['status']}")
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance,
+                              args.iteration_tolerance, args.min_time)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        print(f"{len(regressions)} regressions against {args.baseline}")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,14 @@
 from .core.model import Model
 from .core.constraint import Constraint
 from .core.objective import Objective
-from .core.linear_expr import LinearExpr, Variable
+from .core.linear_expr import LinearExpr, Variable, quicksum
+from .core.batch import SolveLimiter, solve_many
+from .core.solve_cache import SolveCache
+from .solvers.cancellation import CancellationToken
+from .solvers.solution import Solution
 
 __version__ = "0.1.0"
 
-__all__ = ["Model", "Variable", "Constraint", "Objective", "LinearExpr"]
+__all__ = ["Model", "Variable", "Constraint", "Objective", "LinearExpr", "quicksum", "solve_many", "Solution",
+           "SolveLimiter", "SolveCache", "CancellationToken"]
 
@@ -1,6 +1,9 @@
 from .model import Model
 from .constraint import Constraint
 from .objective import Objective
-from .linear_expr import LinearExpr, Variable
+from .linear_expr import LinearExpr, Variable, quicksum
+from .batch import SolveLimiter, solve_many
+from .solve_cache import SolveCache
 
-__all__ = ["Model", "Variable", "Constraint", "Objective", "LinearExpr"]
+__all__ = ["Model", "Variable", "Constraint", "Objective", "LinearExpr", "quicksum", "solve_many",
+           "SolveLimiter", "SolveCache"]
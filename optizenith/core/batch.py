@@ -0,0 +1,160 @@
+import os
+import weakref
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import multiprocessing.pool
+
+from .model import Model, solve_matrix_form
+
+
+def _solve_task(task: tuple) -> tuple:
+    """
+    Solves one matrix form in a worker process. Exceptions are returned
+    instead of raised so that one failing model does not abort the batch.
+    """
+    index, form, warm_start, solver, presolve, kwargs = task
+    try:
+        return index, solve_matrix_form(form, solver, warm_start, presolve, **kwargs)
+    except Exception as error:
+        return index, error
+
+
+def solve_many(models: Iterable[Model], solver: str = "simplex", workers: Optional[int] = None,
+               ordered: bool = True, errors: str = "raise", chunksize: Optional[int] = None,
+               pool: Optional["multiprocessing.pool.Pool"] = None, warm_start: bool = True,
+               presolve: bool = True, **kwargs) -> Iterator:
+    """
+    Solves many independent models on a pool of worker processes.
+
+    Only the matrix form of each model, together with its cached basis, is
+    sent to the workers, and the results are streamed back as they are
+    solved. The final basis of each solve is cached on its model as by
+    Model.solve. Tasks are sent in chunks so that the cost of a round trip
+    to a worker is shared by several models, and a pool passed as `pool`
+    can be reused across calls to avoid starting new workers.
+
+    Args:
+        models (Iterable[Model]): The models to solve.
+        solver (str): The solver to use. Defaults to "simplex".
+        workers (int): The number of worker processes. Defaults to the number
+            of CPUs. With a single worker and no pool the models are solved in
+            the calling process.
+        ordered (bool): Whether to yield the results in the order of the models.
+            Otherwise they are yielded as they complete, as (index, result)
+            pairs. Defaults to True.
+        errors (str): "raise" to raise the exception of a model that cannot be
+            solved, or "return" to yield the exception in place of its result.
+            Defaults to "raise".
+        chunksize (int): The number of models sent to a worker at a time.
+            Defaults to a quarter of the models per worker, at most 64.
+        pool (multiprocessing.pool.Pool): A pool to use instead of starting one.
+        warm_start (bool): Whether to start from the cached basis of each model.
+            Defaults to True.
+        presolve (bool): Whether to presolve the models. Defaults to True.
+        **kwargs: Additional keyword arguments to pass to the solver.
+
+    Yields:
+        Solution | tuple[int, Solution]: The result of each model, or its
+            exception if errors is "return".
+    """
+    if errors not in ("raise", "return"):
+        raise ValueError(f"Unknown errors mode: {errors}")
+    models = list(models)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, min(64, len(models) // (4 * workers)))
+
+    tasks = ((index, model.to_matrix_form(), model._basis if warm_start else None, solver, presolve, kwargs)
+             for index, model in enumerate(models))
+
+    owned = pool is None and workers > 1
+    if owned:
+        import multiprocessing
+
+        pool = multiprocessing.Pool(workers)
+    try:
+        if pool is None:
+            results = map(_solve_task, tasks)
+        elif ordered:
+            results = pool.imap(_solve_task, tasks, chunksize)
+        else:
+            results = pool.imap_unordered(_solve_task, tasks, chunksize)
+
+        for index, result in results:
+            if isinstance(result, Exception):
+                if errors == "raise":
+                    raise result
+                solution = result
+            else:
+                solution = result
+                solution.names = models[index]._variable_store.names.copy()
+                if solution.basis is not None:
+                    models[index]._basis = solution.basis
+            yield solution if ordered else (index, solution)
+    finally:
+        if owned:
+            pool.terminate()
+
+
+class SolveLimiter:
+    """
+    Bounds the number of solves that run at the same time, so that a burst
+    of Model.solve_async calls does not oversubscribe the cores. It is used
+    as an async context manager; the solves above the limit wait for a slot
+    in the order they arrived. Each event loop gets its own slots, since an
+    asyncio semaphore is bound to one loop.
+
+    Attributes:
+        limit (int): The number of solves that may run at a time.
+        running (int): The number of solves holding a slot.
+        waiting (int): The number of solves waiting for a slot.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Initializes a new SolveLimiter instance.
+
+        Args:
+            limit (int): The number of solves that may run at a time. Defaults
+                to the number of CPUs.
+
+        Raises:
+            ValueError: If the limit is less than 1.
+        """
+        self.limit = limit if limit is not None else os.cpu_count() or 1
+        if self.limit < 1:
+            raise ValueError("The limit must be at least 1")
+        self.running = 0
+        self.waiting = 0
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+    async def __aenter__(self) -> "SolveLimiter":
+        semaphore = self._semaphore()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.running -= 1
+        self._semaphore().release()
+
+    def __repr__(self) -> str:
+        return f"SolveLimiter(limit={self.limit}, running={self.running}, waiting={self.waiting})"
+
+
+# The limiter shared by the solves that are not given one
+default_limiter = SolveLimiter()
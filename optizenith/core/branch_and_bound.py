@@ -0,0 +1,359 @@
+import time
+import heapq
+import itertools
+import multiprocessing
+
+import numpy as np
+from collections import namedtuple
+from typing import Callable, List, Optional
+
+from .matrix_form import MatrixForm
+from ..solvers.basis import Basis
+from ..solvers.solution import Solution
+
+MIPReport = namedtuple("MIPReport", ["nodes", "bound", "gap", "log"])
+MIPLogEntry = namedtuple("MIPLogEntry", ["time", "nodes", "open_nodes", "incumbent", "bound", "gap",
+                                         "nodes_per_second"])
+
+# A node holds the bounds of the integer variables and the basis of its parent
+_Node = namedtuple("_Node", ["bound", "depth", "lb", "ub", "basis"])
+
+# The problem, the indices of its integer variables and the relaxation solver of a worker process
+_worker = None
+
+
+def _solve_relaxation(form: MatrixForm, integer: np.ndarray, relax: Callable, lb: np.ndarray,
+                      ub: np.ndarray, basis: Optional[Basis]) -> Optional[Solution]:
+    """
+    Solves the LP relaxation of a node, whose integer variables have the
+    bounds lb and ub, starting from the basis of its parent.
+
+    Returns:
+        Solution: The solution of the relaxation, or None if it is infeasible.
+    """
+    node_lb = form.lb.copy()
+    node_ub = form.ub.copy()
+    node_lb[integer] = lb
+    node_ub[integer] = ub
+    node = MatrixForm(form.A, form.b, form.c, form.objective_constant, form.senses, node_lb, node_ub,
+                      sense=form.sense, ranges=form.ranges)
+    try:
+        return relax(node, warm_start=basis)
+    except ValueError as error:
+        # Presolve and the solvers report infeasibility with a ValueError
+        if "infeasible" in str(error):
+            return None
+        raise
+
+
+def _init_worker(form: MatrixForm, integer: np.ndarray, relax: Callable) -> None:
+    global _worker
+    _worker = (form, integer, relax)
+
+
+def _solve_task(task: tuple):
+    """
+    Solves the relaxation of a node in a worker process. Exceptions are
+    returned instead of raised so that they reach the main process intact.
+    """
+    try:
+        return _solve_relaxation(*_worker, *task)
+    except Exception as error:
+        return error
+
+
+class BranchAndBound:
+    """
+    Solves a mixed integer program by LP-based branch and bound.
+
+    Every node is an LP relaxation in which the integer variables have
+    tightened bounds, solved by the `relax` function, e.g. solve_matrix_form
+    with the solver options bound, from the basis of its parent node. As a
+    branching only changes one bound, the parent basis stays dual feasible
+    and the child is re-optimized in a few dual simplex pivots.
+
+    Nodes are selected by a best-bound/depth-first hybrid: after branching on
+    the most fractional variable, the search dives into the child on the
+    side the variable rounds to and puts the other child in a queue ordered
+    by bound. When a dive ends, by pruning, infeasibility or an integer
+    solution, the search continues at the open node with the best bound.
+    Once an incumbent is known, the reduced costs of each node fix the
+    bounds of integer variables that cannot change without the bound of
+    the node falling below the incumbent.
+
+    With `workers` > 1, that many open nodes are solved at a time on a pool
+    of worker processes, which receive the problem once and then only the
+    bounds and bases of the nodes.
+
+    Internally the search maximizes, with the objective negated for a
+    minimization, and bounds and incumbents are reported in the sense of
+    the problem. The search stops when
+    the relative gap between the best bound and the incumbent is at most
+    `gap`, at the `time_limit` in seconds or the `node_limit`, once the
+    CancellationToken passed as `cancel` is cancelled, or when a relaxation
+    stops before its optimum, e.g. at the iteration limit of the solver, with
+    the status of that relaxation. Progress
+    is logged every `log_interval` seconds and whenever the incumbent
+    improves, and printed if `verbose` is set.
+
+    Attributes:
+        nodes (int): The number of nodes solved.
+        iterations (int): The number of simplex iterations over all nodes.
+        log (list[MIPLogEntry]): The progress of the search over time.
+    """
+
+    def __init__(self, form: MatrixForm, relax: Callable, warm_start: Optional[Basis] = None, **kwargs):
+        """
+        Initializes a new BranchAndBound instance.
+
+        Args:
+            form (MatrixForm): The problem, with a mask of its integer variables.
+            relax (Callable): Solves an LP given as a MatrixForm and a `warm_start`
+                basis and returns its Solution.
+            warm_start (Basis): The basis to start the root node from. Defaults to None.
+            kwargs (dict): A dictionary of keyword arguments.
+        """
+        self.form = form
+        self._relax = relax
+        self._warm_start = warm_start
+        self._integer = np.flatnonzero(form.integer) if form.integer is not None else np.zeros(0, dtype=int)
+        self._gap = kwargs.get("gap", 1e-6)
+        self._time_limit = kwargs.get("time_limit", None)
+        self._node_limit = kwargs.get("node_limit", None)
+        self._cancel = kwargs.get("cancel", None)
+        self._integrality_tolerance = kwargs.get("integrality_tolerance", 1e-6)
+        self._bound_tightening = kwargs.get("bound_tightening", True)
+        self._workers = kwargs.get("workers", 1)
+        self._log_interval = kwargs.get("log_interval", 1.0)
+        self._verbose = kwargs.get("verbose", False)
+        self.nodes = 0
+        self.iterations = 0
+        self.log = []
+        self._sign = -1.0 if form.sense == "min" else 1.0
+        self._incumbent = None
+        self._objective = -np.inf
+
+    def solve(self) -> Solution:
+        """
+        Runs the search.
+
+        Returns:
+            Solution: The best integer solution found, with the basis of the root
+                relaxation and a MIPReport with the nodes, the best bound, the gap
+                and the log. Duals and reduced costs are not defined.
+
+        Raises:
+            ValueError: If the problem is infeasible or no integer solution was
+                found within the limits.
+        """
+        started = time.perf_counter()
+        tolerance = self._integrality_tolerance
+        lb = np.ceil(self.form.lb[self._integer] - tolerance)
+        ub = np.floor(self.form.ub[self._integer] + tolerance)
+        if np.any(lb > ub):
+            raise ValueError("The problem is infeasible.")
+
+        queue = []
+        counter = itertools.count()
+        dive = _Node(np.inf, 0, lb, ub, self._warm_start)
+        root_basis = None
+        status = "optimal"
+        last_log = started
+        pool = None
+        if self._workers > 1:
+            pool = multiprocessing.Pool(self._workers, _init_worker, (self.form, self._integer, self._relax))
+        try:
+            while True:
+                elapsed = time.perf_counter() - started
+                if self._time_limit is not None and elapsed >= self._time_limit:
+                    status = "time_limit"
+                    break
+                if self._node_limit is not None and self.nodes >= self._node_limit:
+                    status = "node_limit"
+                    break
+                if self._cancel is not None and self._cancel.cancelled:
+                    status = "cancelled"
+                    break
+                if self._incumbent is not None and self._relative_gap(self._best_bound(queue, dive)) <= self._gap:
+                    break
+
+                batch = []
+                if dive is not None and not self._prunable(dive.bound):
+                    batch.append(dive)
+                dive = None
+                while queue and len(batch) < self._workers:
+                    node = heapq.heappop(queue)[-1]
+                    if not self._prunable(node.bound):
+                        batch.append(node)
+                if not batch:
+                    break
+
+                tasks = [(node.lb, node.ub, node.basis) for node in batch]
+                if pool is None:
+                    results = [_solve_relaxation(self.form, self._integer, self._relax, *task) for task in tasks]
+                else:
+                    results = pool.map(_solve_task, tasks)
+
+                interrupted = next((result.status for result in results if isinstance(result, Solution)
+                                    and result.status != "optimal"), None)
+                if interrupted is not None:
+                    # A relaxation stopped before its optimum gives no valid bound
+                    status = interrupted
+                    break
+                for node, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        raise result
+                    self.nodes += 1
+                    if result is None:
+                        continue
+                    self.iterations += result.iterations
+                    if root_basis is None:
+                        root_basis = result.basis
+                    improved = self._objective
+                    for child in self._branch(node, result):
+                        if dive is None:
+                            dive = child
+                        else:
+                            heapq.heappush(queue, (-child.bound, -child.depth, next(counter), child))
+                    if self._objective > improved:
+                        last_log = self._log(started, queue, dive)
+
+                if time.perf_counter() - last_log >= self._log_interval:
+                    last_log = self._log(started, queue, dive)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        if self._incumbent is None:
+            if status == "optimal":
+                raise ValueError("The problem is infeasible.")
+            if status == "cancelled":
+                raise ValueError("The search was cancelled before an integer solution was found.")
+            raise ValueError(f"No integer solution was found within the {status.replace('_', ' ')}.")
+
+        self._log(started, queue, dive)
+        bound = self._best_bound(queue, dive)
+        x = self._incumbent
+        A, b, senses = self.form.A, self.form.b, self.form.senses
+        slacks = b - A @ x
+        slacks[senses == ">="] *= -1
+        slacks[(senses == "=") | (senses == "==")] = 0
+        return Solution(self._sign * self._objective, x, slacks, status=status, iterations=self.iterations,
+                        time=time.perf_counter() - started, basis=root_basis,
+                        mip=MIPReport(self.nodes, self._sign * bound, self._relative_gap(bound), self.log))
+
+    def _prunable(self, bound: float) -> bool:
+        """
+        Whether a node with the given bound cannot improve the incumbent by more than the gap.
+        """
+        return self._incumbent is not None and self._relative_gap(bound) <= self._gap
+
+    def _relative_gap(self, bound: float) -> float:
+        if self._incumbent is None:
+            return np.inf
+        return max(bound - self._objective, 0.0) / max(1.0, abs(self._objective))
+
+    def _best_bound(self, queue: list, dive: Optional[_Node]) -> float:
+        bounds = [self._objective]
+        if queue:
+            bounds.append(-queue[0][0])
+        if dive is not None:
+            bounds.append(dive.bound)
+        return max(bounds)
+
+    def _branch(self, node: _Node, solution: Solution) -> List[_Node]:
+        """
+        Processes the solved relaxation of a node: prunes it by its bound,
+        records an integer solution as the incumbent, or branches on the
+        most fractional variable.
+
+        Returns:
+            list[_Node]: The children, the one to dive into first.
+        """
+        bound = self._sign * solution.objective
+        if self._prunable(bound):
+            return []
+        values = solution.x[self._integer]
+        fractional = values - np.floor(values)
+        distance = np.minimum(fractional, 1 - fractional)
+        k = int(np.argmax(distance)) if len(distance) else 0
+        if len(distance) == 0 or distance[k] <= self._integrality_tolerance:
+            if bound > self._objective:
+                x = solution.x.copy()
+                x[self._integer] = np.round(values) + 0.0
+                self._incumbent = x
+                self._objective = self._sign * float(self.form.c @ x + self.form.objective_constant)
+            return []
+
+        lb, ub = node.lb, node.ub
+        if self._bound_tightening and self._incumbent is not None:
+            lb, ub = self._tighten(solution, lb, ub)
+        down_ub = ub.copy()
+        down_ub[k] = np.floor(values[k])
+        up_lb = lb.copy()
+        up_lb[k] = np.ceil(values[k])
+        down = _Node(bound, node.depth + 1, lb, down_ub, solution.basis)
+        up = _Node(bound, node.depth + 1, up_lb, ub, solution.basis)
+        return [up, down] if fractional[k] >= 0.5 else [down, up]
+
+    def _tighten(self, solution: Solution, lb: np.ndarray, ub: np.ndarray):
+        """
+        Tightens the bounds of the integer variables by reduced cost fixing.
+
+        In terms of the maximized objective, for duals y and reduced costs
+        z = A^T y - c that are complementary to the solution x* of the node,
+        with y_i > 0 only for rows at their upper limit and y_i < 0 only for
+        rows at their lower limit, every x in the node satisfies
+        c^T x <= c^T x* - z_j (x_j - x*_j) for each j. An integer
+        variable at its lower bound with z_j > 0 can therefore increase by at
+        most (c^T x* - incumbent) / z_j, and likewise at its upper bound. The
+        conditions are checked first, as the duals come through postsolve,
+        and the bounds are left as they are if they do not hold.
+        """
+        y, z, x = solution.duals, solution.reduced_costs, solution.x
+        if y is None or z is None:
+            return lb, ub
+        form = self.form
+        y, z = self._sign * y, self._sign * z
+        tolerance = 1e-7
+        activity = form.A @ x
+        row_lo, row_hi = form.row_bounds()
+        row_scale = tolerance * (1 + np.abs(activity))
+        if (np.any((y > tolerance) & ~(np.abs(activity - row_hi) <= row_scale))
+                or np.any((y < -tolerance) & ~(np.abs(activity - row_lo) <= row_scale))):
+            return lb, ub
+        node_lb = form.lb.copy()
+        node_ub = form.ub.copy()
+        node_lb[self._integer] = lb
+        node_ub[self._integer] = ub
+        scale = tolerance * (1 + np.abs(x))
+        at_lower = np.abs(x - node_lb) <= scale
+        at_upper = np.abs(x - node_ub) <= scale
+        if np.any((z > tolerance) & ~at_lower) or np.any((z < -tolerance) & ~at_upper):
+            return lb, ub
+
+        slack = self._sign * solution.objective - self._objective
+        zi = z[self._integer]
+        lb, ub = lb.copy(), ub.copy()
+        fix_upper = (zi > tolerance) & at_lower[self._integer]
+        ub[fix_upper] = np.minimum(ub[fix_upper], lb[fix_upper] + np.floor(slack / zi[fix_upper] + tolerance))
+        fix_lower = (zi < -tolerance) & at_upper[self._integer]
+        lb[fix_lower] = np.maximum(lb[fix_lower], ub[fix_lower] - np.floor(slack / -zi[fix_lower] + tolerance))
+        return lb, ub
+
+    def _log(self, started: float, queue: list, dive: Optional[_Node]) -> float:
+        """
+        Appends the progress of the search to the log and returns the time.
+        """
+        now = time.perf_counter()
+        elapsed = now - started
+        bound = self._best_bound(queue, dive)
+        incumbent = self._sign * self._objective if self._incumbent is not None else None
+        entry = MIPLogEntry(elapsed, self.nodes, len(queue) + (dive is not None), incumbent, self._sign * bound,
+                            self._relative_gap(bound), self.nodes / elapsed if elapsed > 0 else 0.0)
+        self.log.append(entry)
+        if self._verbose:
+            print(f"{entry.time:8.2f}s {entry.nodes:8d} nodes {entry.open_nodes:8d} open "
+                  f"incumbent {entry.incumbent if incumbent is not None else float('nan'):.6g} "
+                  f"bound {entry.bound:.6g} gap {entry.gap:.2%} {entry.nodes_per_second:.1f} nodes/s")
+        return now
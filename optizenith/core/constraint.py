@@ -1,16 +1,44 @@
+import gc
+import weakref
+import numpy as np
+from typing import TYPE_CHECKING
+
 from .linear_expr import LinearExpr
 
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+
 class Constraint:
     """
     Represents a constraint in an LP model.
 
+    A constraint of a model is a lightweight handle to a row of the model's
+    constraint store, which knows the index of its row: its type, range and
+    name read and write through to the store. Constraints added in bulk, e.g.
+    by a file reader, are handles from the start, and their expression is
+    built from the stored row the first time it is read. Those added one at a
+    time become handles when the model is next assembled and keep their
+    expression and right-hand side, while the store holds the right-hand side
+    less the constant of the expression. Changing the expression in place or
+    assigning another one marks the row as changed, and it is assembled again
+    the next time the model is.
+
     Attributes:
         expression (LinearExpr): The expression of the constraint.
         constrain_type (str): The type of the constraint ("<=", ">=", "=")
         rhs (float): The right-hand side value of the constraint.
+        name (str): The name of the constraint, or None.
+        rhs_range (float): The width R of a ranged constraint, or None. A ranged
+            "<=" constraint holds rhs - R <= expression <= rhs, a ranged ">="
+            constraint rhs <= expression <= rhs + R.
+        index (int): The index of the row of a handle, or None.
     """
 
-    def __init__(self, expression: LinearExpr, constrain_type: str, rhs: float):
+    __slots__ = ("_store", "_index", "_expression", "_constrain_type", "_rhs", "_name", "_rhs_range", "_offset",
+                 "__weakref__")
+
+    def __init__(self, expression: LinearExpr, constrain_type: str, rhs: float, name: str = None,
+                 rhs_range: float = None):
         """
         Initializes a new constraint instance.
 
@@ -18,11 +46,180 @@ class Constraint:
             expression (LinearExpr): The expression of the constraint.
             constrain_type (str): The type of the constraint ("<=", ">=", "=")
             rhs (float): The right-hand side value of the constraint.
+            name (str): The name of the constraint. Defaults to None.
+            rhs_range (float): The width of a ranged constraint. Defaults to None.
         """
-        
-        self.expression = expression
-        self.constrain_type = constrain_type
-        self.rhs = rhs
+
+        self._store = None
+        self._index = None
+        self._expression = expression
+        self._constrain_type = constrain_type
+        self._rhs = rhs
+        self._name = name
+        self._rhs_range = rhs_range
+        self._offset = 0.0
+
+    @classmethod
+    def _handle(cls, store: "ConstraintStore", index: int) -> "Constraint":
+        """
+        Creates a handle to a row of a constraint store.
+
+        Args:
+            store (ConstraintStore): The store the row lives in.
+            index (int): The index of the row in the store.
+        """
+
+        constraint = cls.__new__(cls)
+        constraint._store = store
+        constraint._index = index
+        constraint._expression = None
+        return constraint
+
+    @classmethod
+    def _handles(cls, store: "ConstraintStore", start: int, stop: int) -> list:
+        """
+        Creates handles to a range of rows of a constraint store.
+
+        The garbage collector is paused meanwhile, as the many new objects
+        would otherwise trigger repeated collections that dominate the time.
+
+        Args:
+            store (ConstraintStore): The store the rows live in.
+            start (int): The index of the first row.
+            stop (int): The index after the last row.
+        """
+
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [cls._handle(store, index) for index in range(start, stop)]
+        finally:
+            if enabled:
+                gc.enable()
+
+    def _attach(self, store: "ConstraintStore", index: int) -> None:
+        """
+        Turns the constraint into a handle to a row of a constraint store
+        that holds its expression, type, right-hand side, range and name.
+        The constraint keeps its expression, which tells it when it changes.
+        """
+        self._store = store
+        self._index = index
+        if self._expression is not None:
+            self._offset = self._expression.constant
+            self._own(self._expression)
+
+    def _own(self, expression: LinearExpr) -> None:
+        # Weak references, so that a constraint and its expression form no cycle
+        owners = expression._owners
+        if owners is None:
+            expression._owners = [weakref.ref(self)]
+        elif not any(owner() is self for owner in owners):
+            owners.append(weakref.ref(self))
+
+    def _disown(self, expression: LinearExpr) -> None:
+        if expression._owners:
+            expression._owners = [owner for owner in expression._owners if owner() is not self] or None
+
+    def _expression_changed(self, expression: LinearExpr) -> None:
+        """
+        Marks the row of a handle as changed when its expression is changed in place.
+        """
+        if self._store is not None and self._expression is expression:
+            self._store.dirty.add(self)
+
+    def _detach(self) -> None:
+        """
+        Copies the row of a handle out of its constraint store, so that the
+        constraint no longer depends on it.
+        """
+        self._expression = self.expression
+        self._disown(self._expression)
+        self._constrain_type, self._rhs, self._name = self.constrain_type, self.rhs, self.name
+        self._rhs_range = self.rhs_range
+        self._store.dirty.discard(self)
+        self._store.detached += 1
+        self._store = None
+        self._index = None
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def expression(self) -> LinearExpr:
+        if self._expression is None:
+            indices, coefficients = self._store.row(self._index)
+            self._expression = LinearExpr.from_arrays(indices.copy(), coefficients.copy(), self._store.model)
+            self._rhs = float(self._store.rhs[self._index])
+            self._offset = 0.0
+            self._own(self._expression)
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression: LinearExpr) -> None:
+        if self._store is None:
+            self._expression = expression
+            return
+        rhs = self.rhs
+        if self._expression is not None:
+            self._disown(self._expression)
+        self._expression = expression
+        self._rhs = rhs
+        self._own(expression)
+        self._store.dirty.add(self)
+
+    @property
+    def constrain_type(self) -> str:
+        return self._constrain_type if self._store is None else self._store.senses[self._index]
+
+    @constrain_type.setter
+    def constrain_type(self, constrain_type: str) -> None:
+        if self._store is None:
+            self._constrain_type = constrain_type
+        else:
+            self._store.senses[self._index] = constrain_type
+
+    @property
+    def rhs(self) -> float:
+        if self._store is None or self._expression is not None:
+            return self._rhs
+        return float(self._store.rhs[self._index])
+
+    @rhs.setter
+    def rhs(self, rhs: float) -> None:
+        if self._store is None:
+            self._rhs = rhs
+        elif self._expression is None:
+            self._store.rhs[self._index] = rhs
+        else:
+            self._rhs = rhs
+            self._store.rhs[self._index] = rhs - self._offset
+
+    @property
+    def rhs_range(self) -> float:
+        if self._store is None:
+            return self._rhs_range
+        rhs_range = float(self._store.ranges[self._index])
+        return rhs_range if rhs_range != float("inf") else None
+
+    @rhs_range.setter
+    def rhs_range(self, rhs_range: float) -> None:
+        if self._store is None:
+            self._rhs_range = rhs_range
+        else:
+            self._store.ranges[self._index] = float("inf") if rhs_range is None else rhs_range
+
+    @property
+    def name(self) -> str:
+        return self._name if self._store is None else self._store.names[self._index]
+
+    @name.setter
+    def name(self, name: str) -> None:
+        if self._store is None:
+            self._name = name
+        else:
+            self._store.names[self._index] = name
 
     def __str__(self) -> str:
         """
@@ -31,4 +228,44 @@ class Constraint:
         """
 
         constraint_str = f"{self.expression} {self.constrain_type} {self.rhs}"
+        if self.rhs_range is not None:
+            constraint_str += f" (range {self.rhs_range})"
         return constraint_str
+
+    def __bool__(self) -> bool:
+        raise TypeError("A constraint has no truth value; add it to a model, or compare variables with 'is'")
+
+
+class MatrixConstraint:
+    """
+    The rows A x <= rhs, A x >= rhs or A x = rhs, as created by comparing a
+    MatrixExpr, e.g. A @ x <= b. Model.add_constraints adds them to the
+    model's constraint store in one call.
+
+    Attributes:
+        model (Model): The model the variables belong to.
+        A (scipy.sparse.csr_matrix): The coefficients over the variables of the model.
+        sense (str): The type of the rows ("<=", ">=" or "=").
+        rhs (np.ndarray): The right-hand side of each row.
+    """
+
+    def __init__(self, model: "Model", A: "sp.csr_matrix", sense: str, rhs: np.ndarray):
+        """
+        Initializes a new MatrixConstraint instance.
+
+        Args:
+            model (Model): The model the variables belong to.
+            A (scipy.sparse.csr_matrix): The coefficients over the variables of the model.
+            sense (str): The type of the rows.
+            rhs (np.ndarray): The right-hand side of each row.
+        """
+        self.model = model
+        self.A = A
+        self.sense = sense
+        self.rhs = rhs
+
+    def __len__(self) -> int:
+        return self.A.shape[0]
+
+    def __bool__(self) -> bool:
+        raise TypeError("Matrix constraints have no truth value; add them to a model with Model.add_constraints")
@@ -0,0 +1,251 @@
+import numpy as np
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+
+
+class ConstraintStore:
+    """
+    Stores the rows of constraints added in bulk, e.g. by a file reader, as
+    CSR arrays together with their types, right-hand sides, ranges and names.
+    Constraints are referred to by their index into the arrays, and the
+    model holds a lightweight Constraint handle per row. Constraints added
+    one at a time are moved into the store when the model is next assembled,
+    so that the store holds the rows of the model in order and doubles as
+    its cached constraint matrix, which single coefficients and rows are
+    patched in place.
+
+    Attributes:
+        model (Model): The model the rows belong to.
+        senses (np.ndarray): The type of each row ("<=", ">=" or "=").
+        rhs (np.ndarray): The right-hand side of each row.
+        ranges (np.ndarray): The width of each ranged row, inf for ordinary rows.
+        names (np.ndarray): The names of the rows, None for unnamed ones.
+        detached (int): The number of handles detached from the store, which
+            tells the model that a row no longer matches its constraint.
+        dirty (set): The handles whose expression changed since their row
+            was assembled.
+    """
+
+    def __init__(self, model: "Model", capacity: int = 16):
+        """
+        Initializes a new, empty ConstraintStore instance.
+
+        Args:
+            model (Model): The model the rows belong to.
+            capacity (int): The number of rows and nonzeros to allocate room for.
+                Defaults to 16.
+        """
+        self.model = model
+        self._size = 0
+        self._nnz = 0
+        self._indptr = np.zeros(capacity + 1, dtype=np.int64)
+        self._indices = np.zeros(capacity, dtype=np.int64)
+        self._data = np.zeros(capacity)
+        self._senses = np.empty(capacity, dtype=object)
+        self._rhs = np.zeros(capacity)
+        self._ranges = np.zeros(capacity)
+        self._names = np.empty(capacity, dtype=object)
+        self.detached = 0
+        self.dirty = set()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def senses(self) -> np.ndarray:
+        return self._senses[:self._size]
+
+    @property
+    def rhs(self) -> np.ndarray:
+        return self._rhs[:self._size]
+
+    @property
+    def ranges(self) -> np.ndarray:
+        return self._ranges[:self._size]
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names[:self._size]
+
+    def _reserve(self, rows: int, nnz: int) -> None:
+        if rows > len(self._rhs):
+            capacity = max(rows, 2 * len(self._rhs))
+            for attribute in ("_senses", "_rhs", "_ranges", "_names"):
+                old = getattr(self, attribute)
+                new = np.empty(capacity, dtype=object) if old.dtype == object else np.zeros(capacity)
+                new[:self._size] = old[:self._size]
+                setattr(self, attribute, new)
+            indptr = np.zeros(capacity + 1, dtype=np.int64)
+            indptr[:self._size + 1] = self._indptr[:self._size + 1]
+            self._indptr = indptr
+        if nnz > len(self._data):
+            capacity = max(nnz, 2 * len(self._data))
+            for attribute in ("_indices", "_data"):
+                old = getattr(self, attribute)
+                new = np.zeros(capacity, dtype=old.dtype)
+                new[:self._nnz] = old[:self._nnz]
+                setattr(self, attribute, new)
+
+    def adopt(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, senses: np.ndarray,
+              rhs: np.ndarray, names: np.ndarray, ranges: Optional[np.ndarray] = None) -> None:
+        """
+        Replaces the contents of the store with the given CSR arrays, which
+        are used as they are without copying, e.g. arrays memory-mapped from
+        a snapshot. They are copied once the store grows.
+
+        Args:
+            indptr (np.ndarray): The row pointers, of length rows + 1.
+            indices (np.ndarray): The column index of each nonzero.
+            data (np.ndarray): The value of each nonzero.
+            senses (np.ndarray): The type of each row.
+            rhs (np.ndarray): The right-hand side of each row.
+            names (np.ndarray): The names of the rows, None for unnamed ones.
+            ranges (np.ndarray): The width of each ranged row. Defaults to None
+                for no ranged rows.
+        """
+        self._indptr, self._indices, self._data = indptr, indices, data
+        self._senses, self._rhs, self._names = senses, rhs, names
+        self._ranges = np.full(len(rhs), np.inf) if ranges is None else ranges
+        self._size = len(rhs)
+        self._nnz = len(data)
+
+    def extend(self, A: "sp.csr_matrix", senses: Sequence[str], rhs: np.ndarray,
+               names: Optional[Sequence[str]] = None, ranges: Optional[np.ndarray] = None) -> int:
+        """
+        Adds the rows of a sparse matrix to the store.
+
+        Args:
+            A (sp.csr_matrix): The coefficients of the rows, with one column per variable.
+            senses (Sequence[str]): The type of each row.
+            rhs (np.ndarray): The right-hand side of each row.
+            names (Sequence[str]): The names of the rows. Defaults to None.
+            ranges (np.ndarray): The width of each ranged row, inf for ordinary
+                rows. Defaults to None for no ranged rows.
+
+        Returns:
+            int: The index of the first new row.
+        """
+        import scipy.sparse as sp
+
+        A = sp.csr_matrix(A)
+        A.sum_duplicates()
+        k = A.shape[0]
+        start = self._size
+        self._reserve(start + k, self._nnz + A.nnz)
+        self._indptr[start + 1:start + k + 1] = self._nnz + A.indptr[1:]
+        self._indices[self._nnz:self._nnz + A.nnz] = A.indices
+        self._data[self._nnz:self._nnz + A.nnz] = A.data
+        self._senses[start:start + k] = senses
+        self._rhs[start:start + k] = rhs
+        self._ranges[start:start + k] = np.inf if ranges is None else ranges
+        if names is not None:
+            self._names[start:start + k] = np.fromiter(names, dtype=object, count=k)
+        self._size = start + k
+        self._nnz += A.nnz
+        return start
+
+    def set_coefficient(self, index: int, column: int, value: float) -> None:
+        """
+        Sets the coefficient of a variable in a row. The nonzeros of the
+        following rows are shifted if the coefficient is added or removed.
+
+        Args:
+            index (int): The index of the row.
+            column (int): The index of the variable.
+            value (float): The coefficient, 0 to remove the term.
+        """
+        start, stop = self._indptr[index], self._indptr[index + 1]
+        k = start + int(np.searchsorted(self._indices[start:stop], column))
+        if k < stop and self._indices[k] == column:
+            if value != 0:
+                self._data[k] = value
+                return
+            self._indices[k:self._nnz - 1] = self._indices[k + 1:self._nnz]
+            self._data[k:self._nnz - 1] = self._data[k + 1:self._nnz]
+            self._indptr[index + 1:self._size + 1] -= 1
+            self._nnz -= 1
+        elif value != 0:
+            self._reserve(self._size, self._nnz + 1)
+            self._indices[k + 1:self._nnz + 1] = self._indices[k:self._nnz]
+            self._data[k + 1:self._nnz + 1] = self._data[k:self._nnz]
+            self._indices[k] = column
+            self._data[k] = value
+            self._indptr[index + 1:self._size + 1] += 1
+            self._nnz += 1
+
+    def set_row(self, index: int, columns: np.ndarray, values: np.ndarray) -> None:
+        """
+        Replaces the terms of a row. The nonzeros of the following rows are
+        shifted if the number of terms changes.
+
+        Args:
+            index (int): The index of the row.
+            columns (np.ndarray): The sorted indices of the variables.
+            values (np.ndarray): The coefficients.
+        """
+        start, stop = self._indptr[index], self._indptr[index + 1]
+        shift = len(columns) - (stop - start)
+        if shift:
+            self._reserve(self._size, self._nnz + shift)
+            self._indices[stop + shift:self._nnz + shift] = self._indices[stop:self._nnz].copy()
+            self._data[stop + shift:self._nnz + shift] = self._data[stop:self._nnz].copy()
+            self._indptr[index + 1:self._size + 1] += shift
+            self._nnz += shift
+        self._indices[start:start + len(columns)] = columns
+        self._data[start:start + len(columns)] = values
+
+    def delete(self, index: int) -> None:
+        """
+        Removes a row, shifting the following rows up by one.
+
+        Args:
+            index (int): The index of the row.
+        """
+        start, stop = self._indptr[index], self._indptr[index + 1]
+        k = stop - start
+        self._indices[start:self._nnz - k] = self._indices[stop:self._nnz]
+        self._data[start:self._nnz - k] = self._data[stop:self._nnz]
+        self._indptr[index + 1:self._size] = self._indptr[index + 2:self._size + 1] - k
+        for attribute in ("_senses", "_rhs", "_ranges", "_names"):
+            array = getattr(self, attribute)
+            array[index:self._size - 1] = array[index + 1:self._size]
+        self._size -= 1
+        self._nnz -= k
+
+    def clear(self) -> None:
+        """
+        Removes all rows, keeping the allocated room.
+        """
+        self._size = 0
+        self._nnz = 0
+
+    def row(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the column indices and coefficients of a row.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The column indices and the coefficients.
+        """
+        start, stop = self._indptr[index], self._indptr[index + 1]
+        return self._indices[start:stop], self._data[start:stop]
+
+    def matrix(self, n: int) -> "sp.csr_matrix":
+        """
+        Returns the stored rows as a CSR matrix with n columns, sharing the
+        arrays of the store.
+
+        Args:
+            n (int): The number of variables.
+
+        Returns:
+            sp.csr_matrix: The coefficient matrix of the rows.
+        """
+        import scipy.sparse as sp
+
+        return sp.csr_matrix((self._data[:self._nnz], self._indices[:self._nnz],
+                              self._indptr[:self._size + 1]), shape=(self._size, n))
@@ -0,0 +1,647 @@
+import os
+import re
+import gzip
+from array import array
+
+import numpy as np
+import scipy.sparse as sp
+from typing import IO, Dict, List, Optional
+
+from .linear_expr import LinearExpr
+from .objective import Objective
+from .variable_store import VariableStore
+
+MPS_SECTIONS = ("NAME", "OBJSENSE", "OBJSENCE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA")
+MPS_SENSES = {"L": "<=", "G": ">=", "E": "="}
+MPS_ROW_TYPES = {"<=": "L", ">=": "G", "=": "E", "==": "E"}
+
+LP_SECTIONS = {
+    "maximize": "max", "maximise": "max", "maximum": "max", "max": "max",
+    "minimize": "min", "minimise": "min", "minimum": "min", "min": "min",
+    "subject to": "rows", "such that": "rows", "st": "rows", "s.t.": "rows", "st.": "rows",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "integer", "generals": "integer", "gen": "integer",
+    "integer": "integer", "integers": "integer",
+    "binary": "binary", "binaries": "binary", "bin": "binary",
+    "end": "end",
+}
+LP_SENSES = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+LP_TOKENS = re.compile(r"\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(<=|>=|=<|=>|<|>|=|[+\-:])|([^\s<>=+\-:]+))")
+INFINITY = {"inf": np.inf, "infinity": np.inf}
+
+
+def _open(path, mode: str) -> IO:
+    """
+    Opens a text file for reading or writing, through gzip if it is
+    compressed or, for writing, if its name ends in .gz.
+    """
+    path = os.fspath(path)
+    if mode == "r":
+        with open(path, "rb") as file:
+            compressed = file.read(2) == b"\x1f\x8b"
+        return gzip.open(path, "rt") if compressed else open(path, "r")
+    return gzip.open(path, "wt", compresslevel=6) if path.endswith(".gz") else open(path, "w")
+
+
+class _Triplets:
+    """
+    Collects the nonzeros of a sparse matrix as COO triplets in compact
+    arrays, so that memory grows by 24 bytes per nonzero.
+    """
+
+    def __init__(self):
+        self.rows = array("q")
+        self.cols = array("q")
+        self.vals = array("d")
+
+    def matrix(self, m: int, n: int, offset: int = 0) -> sp.csr_matrix:
+        rows = np.frombuffer(self.rows, dtype=np.int64)
+        cols = np.frombuffer(self.cols, dtype=np.int64) + offset
+        A = sp.csr_matrix((np.frombuffer(self.vals), (rows, cols)), shape=(m, n))
+        A.eliminate_zeros()
+        return A
+
+
+def _add_columns(model: "Model", names: List[str], lb: np.ndarray, ub: np.ndarray, integer: array) -> int:
+    """
+    Adds the variables read from a file to a model and returns the index of the first one.
+    """
+    store = model._variable_store
+    start = store.extend(len(names), lb, ub, "continuous", names)
+    store.vtype[start + np.unique(np.frombuffer(integer, dtype=np.int64))] = VariableStore.type_code("integer")
+    return start
+
+
+def _set_objective(model: "Model", cols: array, vals: array, offset: int, constant: float, sense: str) -> None:
+    cols, vals = np.frombuffer(cols, dtype=np.int64), np.frombuffer(vals)
+    expression = LinearExpr.from_arrays(cols[vals != 0] + offset, vals[vals != 0], model)
+    expression.constant = constant
+    model.objective = Objective(expression, sense)
+
+
+def read_mps(path, model: "Model") -> "Model":
+    """
+    Reads a model in free MPS format into a model.
+
+    The file is read line by line and the coefficients are collected in
+    compact arrays and added to the model's constraint store in one block,
+    so memory stays proportional to the number of nonzeros and no
+    LinearExpr is created per row. Gzip-compressed files are detected and
+    decompressed on the fly. Names may not contain spaces.
+
+    The OBJSENSE, RHS, RANGES and BOUNDS sections and integer markers are
+    supported. A ranged row becomes a ranged constraint; a ranged "E" row
+    becomes a ranged ">=" or "<=" constraint by the sign of its range.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+        model (Model): The model to add the variables, constraints and objective to.
+
+    Returns:
+        Model: The model.
+
+    Raises:
+        ValueError: If the file is not valid MPS.
+    """
+    rows: Dict[str, int] = {}
+    row_names: List[str] = []
+    senses: List[str] = []
+    columns: Dict[str, int] = {}
+    column_names: List[str] = []
+    triplets = _Triplets()
+    objective_cols, objective_vals = array("q"), array("d")
+    integer = array("q")
+    objective_row = None
+    sense = "min"
+    constant = 0.0
+    ranges: Dict[int, float] = {}
+    rhs = lb = ub = None
+    section = None
+    in_integer = False
+
+    with _open(path, "r") as file:
+        for line_number, line in enumerate(file, 1):
+            fields = line.split()
+            if not fields or line[0] == "*":
+                continue
+            if not line[0].isspace() and fields[0].upper() in MPS_SECTIONS:
+                section = fields[0].upper()
+                if section == "NAME" and len(fields) > 1 and not model.name:
+                    model.name = fields[1]
+                elif section in ("OBJSENSE", "OBJSENCE") and len(fields) > 1:
+                    sense = "max" if fields[1].upper().startswith("MAX") else "min"
+                elif section == "COLUMNS":
+                    rhs = np.zeros(len(row_names))
+                elif section == "BOUNDS" or (section in ("RHS", "RANGES") and lb is None):
+                    lb = np.zeros(len(column_names)) if lb is None else lb
+                    ub = np.full(len(column_names), np.inf) if ub is None else ub
+                elif section == "ENDATA":
+                    break
+                continue
+
+            try:
+                if section == "COLUMNS":
+                    if len(fields) >= 3 and fields[1] == "'MARKER'":
+                        in_integer = fields[2] == "'INTORG'"
+                        continue
+                    j = columns.get(fields[0])
+                    if j is None:
+                        j = columns[fields[0]] = len(column_names)
+                        column_names.append(fields[0])
+                        if in_integer:
+                            integer.append(j)
+                    for k in range(1, len(fields) - 1, 2):
+                        row, value = fields[k], float(fields[k + 1])
+                        if row == objective_row:
+                            objective_cols.append(j)
+                            objective_vals.append(value)
+                        else:
+                            triplets.rows.append(rows[row])
+                            triplets.cols.append(j)
+                            triplets.vals.append(value)
+                elif section in ("RHS", "RANGES"):
+                    pairs = fields[len(fields) % 2:]
+                    for k in range(0, len(pairs), 2):
+                        row, value = pairs[k], float(pairs[k + 1])
+                        if section == "RANGES":
+                            ranges[rows[row]] = value
+                        elif row == objective_row:
+                            constant = -value
+                        else:
+                            rhs[rows[row]] = value
+                elif section == "BOUNDS":
+                    kind = fields[0].upper()
+                    if kind in ("FR", "MI", "PL", "BV"):
+                        j = columns[fields[2] if len(fields) >= 3 and fields[2] in columns else fields[1]]
+                        value = None
+                    else:
+                        j, value = columns[fields[-2]], float(fields[-1])
+                    if kind == "UP" or kind == "UI":
+                        ub[j] = value
+                        if value < 0 and lb[j] == 0:
+                            lb[j] = -np.inf
+                    elif kind == "LO" or kind == "LI":
+                        lb[j] = value
+                    elif kind == "FX":
+                        lb[j] = ub[j] = value
+                    elif kind == "FR":
+                        lb[j], ub[j] = -np.inf, np.inf
+                    elif kind == "MI":
+                        lb[j] = -np.inf
+                    elif kind == "PL":
+                        ub[j] = np.inf
+                    elif kind == "BV":
+                        lb[j], ub[j] = 0, 1
+                    else:
+                        raise ValueError(f"Unsupported bound type {kind}")
+                    if kind in ("BV", "LI", "UI"):
+                        integer.append(j)
+                elif section == "ROWS":
+                    kind, name = fields[0].upper(), fields[1]
+                    if kind == "N":
+                        if objective_row is None:
+                            objective_row = name
+                        continue
+                    rows[name] = len(row_names)
+                    row_names.append(name)
+                    senses.append(MPS_SENSES[kind])
+                elif section in ("OBJSENSE", "OBJSENCE"):
+                    sense = "max" if fields[0].upper().startswith("MAX") else "min"
+                elif section != "NAME":
+                    raise ValueError("Data outside of a section")
+            except (KeyError, IndexError, ValueError) as error:
+                raise ValueError(f"Invalid MPS data on line {line_number}: {line.strip()!r} ({error})") from None
+
+    m, n = len(row_names), len(column_names)
+    if rhs is None:
+        rhs = np.zeros(m)
+    if lb is None:
+        lb, ub = np.zeros(n), np.full(n, np.inf)
+    start = _add_columns(model, column_names, lb, ub, integer)
+    A = triplets.matrix(m, start + n, start)
+    senses = np.array(senses, dtype=object)
+
+    widths = None
+    if ranges:
+        ranged = np.fromiter(ranges.keys(), dtype=np.int64, count=len(ranges))
+        values = np.fromiter(ranges.values(), dtype=float, count=len(ranges))
+        equality = senses[ranged] == "="
+        senses[ranged[equality & (values > 0)]] = ">="
+        senses[ranged[equality & (values < 0)]] = "<="
+        widths = np.full(m, np.inf)
+        widths[ranged] = np.where(equality & (values == 0), np.inf, np.abs(values))
+
+    model._extend_constraints(A, senses, rhs, row_names, widths)
+    _set_objective(model, objective_cols, objective_vals, start, constant, sense)
+    return model
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if np.isfinite(value) else ("inf" if value > 0 else "-inf")
+
+
+def _variable_names(model: "Model") -> List[str]:
+    store = model._variable_store
+    return [store.name(j) for j in range(len(store))]
+
+
+def _constraint_names(model: "Model") -> List[str]:
+    return [f"c{i+1}" if constraint.name is None else constraint.name
+            for i, constraint in enumerate(model.constraints)]
+
+
+def _ranged_rows(form: "MatrixForm") -> np.ndarray:
+    if form.ranges is None:
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(np.isfinite(form.ranges) & (form.senses != "=") & (form.senses != "=="))
+
+
+def _maximize(model: "Model") -> bool:
+    return model.objective is not None and model.objective.sense.lower().startswith("max")
+
+
+def write_mps(model: "Model", path) -> None:
+    """
+    Writes a model in free MPS format, column by column from the matrix
+    form of the model. The file is gzip-compressed if its name ends in .gz.
+
+    Args:
+        model (Model): The model to write.
+        path (str | os.PathLike): The path of the file.
+    """
+    form = model.to_matrix_form()
+    m, n = form.shape
+    A = form.A.tocsc()
+    A.sort_indices()
+    columns = _variable_names(model)
+    rows = _constraint_names(model)
+    objective = "obj"
+    while objective in rows:
+        objective += "_"
+    integer = model._variable_store.vtype == VariableStore.type_code("integer")
+
+    with _open(path, "w") as file:
+        file.write(f"NAME {model.name.replace(' ', '_') or 'model'}\n")
+        if _maximize(model):
+            file.write("OBJSENSE\n    MAX\n")
+        file.write(f"ROWS\n N  {objective}\n")
+        file.writelines(f" {MPS_ROW_TYPES[sense]}  {row}\n" for sense, row in zip(form.senses, rows))
+
+        file.write("COLUMNS\n")
+        in_integer = False
+        indptr, indices, data = A.indptr, A.indices, A.data
+        for j in range(n):
+            if integer[j] != in_integer:
+                in_integer = bool(integer[j])
+                file.write(f"    MARKER  'MARKER'  '{'INTORG' if in_integer else 'INTEND'}'\n")
+            column = columns[j]
+            start, stop = indptr[j], indptr[j + 1]
+            if form.c[j] != 0 or start == stop:
+                file.write(f"    {column}  {objective}  {_format(form.c[j])}\n")
+            file.writelines(f"    {column}  {rows[i]}  {value!r}\n"
+                            for i, value in zip(indices[start:stop].tolist(), data[start:stop].tolist()))
+        if in_integer:
+            file.write("    MARKER  'MARKER'  'INTEND'\n")
+
+        file.write("RHS\n")
+        if form.objective_constant != 0:
+            file.write(f"    RHS  {objective}  {_format(-form.objective_constant)}\n")
+        file.writelines(f"    RHS  {rows[i]}  {_format(form.b[i])}\n" for i in np.flatnonzero(form.b).tolist())
+
+        ranged = _ranged_rows(form)
+        if len(ranged) > 0:
+            file.write("RANGES\n")
+            file.writelines(f"    RNG  {rows[i]}  {_format(form.ranges[i])}\n" for i in ranged.tolist())
+
+        file.write("BOUNDS\n")
+        for j in np.flatnonzero((form.lb != 0) | (form.ub != np.inf)).tolist():
+            lower, upper, column = form.lb[j], form.ub[j], columns[j]
+            if lower == upper:
+                file.write(f" FX BND  {column}  {_format(lower)}\n")
+                continue
+            if lower == -np.inf and upper == np.inf:
+                file.write(f" FR BND  {column}\n")
+                continue
+            if lower == -np.inf:
+                file.write(f" MI BND  {column}\n")
+            elif lower != 0:
+                file.write(f" LO BND  {column}  {_format(lower)}\n")
+            if upper != np.inf:
+                file.write(f" UP BND  {column}  {_format(upper)}\n")
+        file.write("ENDATA\n")
+
+
+def _lp_tokens(line: str) -> List[str]:
+    """
+    Splits a line of an LP file into numbers, operators and names.
+    """
+    return [number or operator or name for number, operator, name in LP_TOKENS.findall(line)]
+
+
+def _is_number(token: str) -> bool:
+    return token[0].isdigit() or token[0] == "." or token.lower() in INFINITY
+
+
+def _number(token: str) -> float:
+    return INFINITY.get(token.lower(), None) or float(token)
+
+
+class _LPReader:
+    """
+    Parses the statements of an LP file, keeping only the coefficient
+    arrays, the variable names and the tokens of the current statement.
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, int] = {}
+        self.column_names: List[str] = []
+        self.triplets = _Triplets()
+        self.row_names: List[Optional[str]] = []
+        self.senses: List[str] = []
+        self.rhs = array("d")
+        self.ranges = array("d")
+        self.objective_cols, self.objective_vals = array("q"), array("d")
+        self.constant = 0.0
+        self.lb: Dict[int, float] = {}
+        self.ub: Dict[int, float] = {}
+        self.integer = array("q")
+
+    def column(self, name: str) -> int:
+        j = self.columns.get(name)
+        if j is None:
+            j = self.columns[name] = len(self.column_names)
+            self.column_names.append(name)
+        return j
+
+    def linear(self, tokens: List[str], cols: array, vals: array) -> float:
+        """
+        Appends the terms of a linear expression to cols and vals and returns its constant.
+        """
+        constant = 0.0
+        sign = 1.0
+        coefficient = None
+        for token in tokens:
+            if token == "+":
+                continue
+            if token == "-":
+                sign = -sign
+            elif _is_number(token):
+                coefficient = _number(token) if coefficient is None else coefficient * _number(token)
+            else:
+                cols.append(self.column(token))
+                vals.append(sign * (1.0 if coefficient is None else coefficient))
+                sign, coefficient = 1.0, None
+        if coefficient is not None:
+            constant += sign * coefficient
+        return constant
+
+    @staticmethod
+    def label(tokens: List[str]) -> Optional[str]:
+        return tokens[0] if len(tokens) > 1 and tokens[1] == ":" else None
+
+    @staticmethod
+    def value(tokens: List[str]) -> float:
+        """
+        Returns the number that ends the tokens, with the signs before it.
+        """
+        return _number(tokens[-1]) * (-1.0 if tokens.count("-") % 2 else 1.0)
+
+    def complete(self, tokens: List[str], sense_at: int) -> bool:
+        """
+        Returns whether a row statement that ends in a number is complete,
+        which a ranged row lower <= expression <= upper only is after its
+        second sense.
+        """
+        left = tokens[2 if self.label(tokens) is not None else 0:sense_at]
+        if left and all(token in ("+", "-") or _is_number(token) for token in left):
+            return any(token in LP_SENSES for token in tokens[sense_at + 1:-1])
+        return True
+
+    def objective(self, tokens: List[str]) -> None:
+        if self.label(tokens) is not None:
+            tokens = tokens[2:]
+        self.constant += self.linear(tokens, self.objective_cols, self.objective_vals)
+
+    def row(self, tokens: List[str], sense_at: int) -> None:
+        name = self.label(tokens)
+        start = 2 if name is not None else 0
+        second = next((k for k in range(sense_at + 1, len(tokens)) if tokens[k] in LP_SENSES), None)
+        left = None
+        if second is not None:
+            left, first_sense = self.value(tokens[start:sense_at]), LP_SENSES[tokens[sense_at]]
+            start, sense_at = sense_at + 1, second
+        i = len(self.row_names)
+        count = len(self.triplets.cols)
+        constant = self.linear(tokens[start:sense_at], self.triplets.cols, self.triplets.vals)
+        self.triplets.rows.extend([i] * (len(self.triplets.cols) - count))
+        value = self.value(tokens[sense_at + 1:])
+        sense = LP_SENSES[tokens[sense_at]]
+        self.row_names.append(name)
+        if left is None:
+            self.senses.append(sense)
+            self.rhs.append(value - constant)
+            self.ranges.append(np.inf)
+            return
+        if sense != first_sense or sense == "=":
+            raise ValueError("Invalid ranged row")
+        lower, upper = (left, value) if sense == "<=" else (value, left)
+        if lower > upper:
+            raise ValueError("Invalid ranged row")
+        self.senses.append("<=")
+        self.rhs.append(upper - constant)
+        self.ranges.append(upper - lower)
+
+    def bound(self, tokens: List[str]) -> None:
+        if len(tokens) == 2 and tokens[1].lower() == "free":
+            j = self.column(tokens[0])
+            self.lb[j], self.ub[j] = -np.inf, np.inf
+            return
+        # Merge signs into the numbers that follow them
+        items = []
+        sign = 1.0
+        for token in tokens:
+            if token in ("+", "-"):
+                sign = -sign if token == "-" else sign
+            elif token in LP_SENSES:
+                items.append(LP_SENSES[token])
+            elif _is_number(token):
+                items.append(sign * _number(token))
+                sign = 1.0
+            else:
+                items.append(token)
+        if len(items) == 5:
+            j = self.column(items[2])
+            self.lb[j], self.ub[j] = items[0], items[4]
+            return
+        if len(items) != 3:
+            raise ValueError("Invalid bound")
+        if isinstance(items[0], str):
+            name, sense, value = items
+        else:
+            value, sense, name = items
+            sense = {"<=": ">=", ">=": "<=", "=": "="}[sense]
+        j = self.column(name)
+        if sense in ("=", ">="):
+            self.lb[j] = value
+        if sense in ("=", "<="):
+            self.ub[j] = value
+
+
+def read_lp(path, model: "Model") -> "Model":
+    """
+    Reads a model in CPLEX LP format into a model.
+
+    The file is read line by line, and statements may span lines. As for
+    MPS files, the coefficients are collected in compact arrays and added to
+    the model's constraint store in one block, and gzip-compressed files are
+    detected. The objective, Subject To, Bounds, General and Binary sections
+    are supported, and ranged rows written as lower <= expression <= upper.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+        model (Model): The model to add the variables, constraints and objective to.
+
+    Returns:
+        Model: The model.
+
+    Raises:
+        ValueError: If the file is not valid LP or uses unsupported sections.
+    """
+    reader = _LPReader()
+    section = None
+    sense = "min"
+    statement: List[str] = []
+    sense_at = None
+
+    with _open(path, "r") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.split("\\", 1)[0]
+            keyword = " ".join(line.lower().split())
+            if not keyword:
+                continue
+            if keyword in LP_SECTIONS or keyword.startswith(("semi", "sos", "lazy", "user", "general", "pwl")):
+                if keyword not in LP_SECTIONS:
+                    raise ValueError(f"Unsupported LP section on line {line_number}: {line.strip()!r}")
+                if section in ("max", "min"):
+                    reader.objective(statement)
+                elif statement:
+                    raise ValueError(f"Incomplete statement before line {line_number}")
+                statement, sense_at = [], None
+                section = LP_SECTIONS[keyword]
+                if section in ("max", "min"):
+                    sense = section
+                if section == "end":
+                    break
+                continue
+
+            try:
+                tokens = _lp_tokens(line)
+                if section in ("max", "min"):
+                    statement.extend(tokens)
+                elif section == "rows":
+                    for token in tokens:
+                        statement.append(token)
+                        if token in LP_SENSES and sense_at is None:
+                            sense_at = len(statement) - 1
+                        elif sense_at is not None and _is_number(token) and reader.complete(statement, sense_at):
+                            reader.row(statement, sense_at)
+                            statement, sense_at = [], None
+                elif section == "bounds":
+                    reader.bound(tokens)
+                elif section in ("integer", "binary"):
+                    for name in tokens:
+                        j = reader.column(name)
+                        reader.integer.append(j)
+                        if section == "binary":
+                            reader.lb[j], reader.ub[j] = 0.0, 1.0
+                else:
+                    raise ValueError("Data outside of a section")
+            except (KeyError, IndexError, ValueError) as error:
+                raise ValueError(f"Invalid LP data on line {line_number}: {line.strip()!r} ({error})") from None
+        if section in ("max", "min"):
+            reader.objective(statement)
+        elif statement:
+            raise ValueError("Incomplete statement at the end of the file")
+
+    m, n = len(reader.row_names), len(reader.column_names)
+    lb, ub = np.zeros(n), np.full(n, np.inf)
+    lb[list(reader.lb)] = list(reader.lb.values())
+    ub[list(reader.ub)] = list(reader.ub.values())
+    start = _add_columns(model, reader.column_names, lb, ub, reader.integer)
+    ranges = np.frombuffer(reader.ranges)
+    model._extend_constraints(reader.triplets.matrix(m, start + n, start), reader.senses,
+                              np.frombuffer(reader.rhs), reader.row_names,
+                              ranges if np.isfinite(ranges).any() else None)
+    _set_objective(model, reader.objective_cols, reader.objective_vals, start, reader.constant, sense)
+    return model
+
+
+def _lp_terms(names: List[str], indices: List[int], values: List[float]) -> str:
+    """
+    Formats linear terms for an LP file, with a line break every eight terms.
+    """
+    parts = []
+    for k, (j, value) in enumerate(zip(indices, values)):
+        if k and k % 8 == 0:
+            parts.append("\n   ")
+        parts.append(f" {'-' if value < 0 else '+'} {abs(value)!r} {names[j]}")
+    return "".join(parts)
+
+
+def write_lp(model: "Model", path) -> None:
+    """
+    Writes a model in CPLEX LP format, row by row from the matrix form of
+    the model, with ranged rows as lower <= expression <= upper. The file is
+    gzip-compressed if its name ends in .gz.
+
+    As a reader numbers the variables in the order in which they first
+    appear, the objective lists every variable in order, with a zero
+    coefficient if it has none.
+
+    Args:
+        model (Model): The model to write.
+        path (str | os.PathLike): The path of the file.
+    """
+    form = model.to_matrix_form()
+    m, n = form.shape
+    A = form.A.tocsr()
+    A.sort_indices()
+    columns = _variable_names(model)
+    rows = _constraint_names(model)
+    integer = np.flatnonzero(model._variable_store.vtype == VariableStore.type_code("integer"))
+
+    with _open(path, "w") as file:
+        file.write(f"\\ {model.name}\n")
+        file.write("Maximize\n" if _maximize(model) else "Minimize\n")
+        file.write(f" obj:{_lp_terms(columns, list(range(n)), form.c.tolist())}")
+        if form.objective_constant != 0 or n == 0:
+            file.write(f" {'-' if form.objective_constant < 0 else '+'} {abs(float(form.objective_constant))!r}")
+        file.write("\nSubject To\n")
+        indptr, indices, data = A.indptr, A.indices, A.data
+        ranged = np.zeros(m, dtype=bool)
+        ranged[_ranged_rows(form)] = True
+        for i in range(m):
+            start, stop = indptr[i], indptr[i + 1]
+            terms = _lp_terms(columns, indices[start:stop].tolist(), data[start:stop].tolist()) if stop > start \
+                else f" 0 {columns[0]}"
+            if ranged[i]:
+                lower, upper = (form.b[i] - form.ranges[i], form.b[i]) if form.senses[i] == "<=" \
+                    else (form.b[i], form.b[i] + form.ranges[i])
+                file.write(f" {rows[i]}: {_format(lower)} <={terms} <= {_format(upper)}\n")
+                continue
+            file.write(f" {rows[i]}:{terms} {LP_SENSES[form.senses[i]] if form.senses[i] != '==' else '='} "
+                       f"{_format(form.b[i])}\n")
+
+        file.write("Bounds\n")
+        for j in np.flatnonzero((form.lb != 0) | (form.ub != np.inf)).tolist():
+            lower, upper, column = form.lb[j], form.ub[j], columns[j]
+            if lower == upper:
+                file.write(f" {column} = {_format(lower)}\n")
+            elif lower == -np.inf and upper == np.inf:
+                file.write(f" {column} free\n")
+            else:
+                file.write(f" {_format(lower)} <= {column} <= {_format(upper)}\n")
+        if len(integer) > 0:
+            file.write("General\n")
+            file.writelines(f" {columns[j]}\n" for j in integer.tolist())
+        file.write("End\n")
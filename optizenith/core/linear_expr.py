@@ -1,9 +1,25 @@
-from typing import Dict, Union, Tuple, List
+import numpy as np
+from collections import abc
+from numbers import Real
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Union, Tuple, List, Mapping, Iterable, Iterator
+
+from .variable_store import VariableStore, VAR_TYPES
+
+if TYPE_CHECKING:
+    import scipy.sparse as sp
 
 class Variable:
     """
     Represents a decision variable in an LP model.
 
+    A Variable is a lightweight handle holding the variable store it lives in
+    and its index there. The attributes below read and write through to the
+    store's arrays, and two handles with the same store and index are equal.
+    Comparing a variable with <=, >= or with == to a number or an expression
+    gives a Constraint, while == between two variables compares the handles,
+    so that variables work as dictionary keys; x - y == 0 is the constraint.
+
     Attributes:
         name (str): The name of the variable.
         lb (float): The lower bound of the variable.
@@ -11,9 +27,11 @@ class Variable:
         var_type (str): The type of the variable.
     """
 
+    __slots__ = ("_store", "_index")
+
     def __init__(self, name: str, lb: float=0, ub: float=float("inf"), var_type: str="continuous"):
         """
-        Initializes a new Variable instance.
+        Initializes a new Variable instance that is not part of a model.
 
         Args:
             name (str): The name of the variable.
@@ -22,42 +40,75 @@ class Variable:
             var_type (str): The type of the variable. Defaults to "continuous".
         """
 
-        self._name = name
-        self._lb = lb
-        self._ub = ub
-        self._var_type = var_type
+        self._store = VariableStore(capacity=1)
+        self._index = self._store.append(name, lb, ub, var_type)
+
+    @classmethod
+    def _handle(cls, store: VariableStore, index: int) -> "Variable":
+        """
+        Creates a handle to an existing variable in a store.
+
+        Args:
+            store (VariableStore): The store the variable lives in.
+            index (int): The index of the variable in the store.
+        """
+
+        variable = cls.__new__(cls)
+        variable._store = store
+        variable._index = index
+        return variable
+
+    @property
+    def index(self) -> int:
+        return self._index
 
     @property
     def lb(self) -> float:
-        return self._lb
+        return float(self._store._lb[self._index])
 
     @lb.setter
     def lb(self, lb: float) -> None:
-        self._lb = lb
+        self._store._lb[self._index] = lb
 
     @property
     def ub(self) -> float:
-        return self._ub
+        return float(self._store._ub[self._index])
 
     @ub.setter
     def ub(self, ub: float) -> None:
-        self._ub = ub
+        self._store._ub[self._index] = ub
 
     @property
     def name(self) -> str:
-        return self._name
+        return self._store.name(self._index)
 
     @name.setter
     def name(self, name: str) -> None:
-        self._name = name
+        self._store._names[self._index] = name
 
     @property
     def var_type(self) -> str:
-        return self._var_type
+        return VAR_TYPES[self._store._vtype[self._index]]
 
     @var_type.setter
     def var_type(self, var_type: str) -> None:
-        self._var_type = var_type
+        self._store._vtype[self._index] = VariableStore.type_code(var_type)
+
+    def __eq__(self, other: object) -> Union[bool, "Constraint"]:
+        if isinstance(other, Variable):
+            return self._store is other._store and self._index == other._index
+        if isinstance(other, (LinearExpr, Real)):
+            return LinearExpr.from_variable(self) == other
+        return NotImplemented
+
+    def __le__(self, other: Union["LinearExpr", "Variable", int, float]) -> "Constraint":
+        return LinearExpr.from_variable(self) <= other
+
+    def __ge__(self, other: Union["LinearExpr", "Variable", int, float]) -> "Constraint":
+        return LinearExpr.from_variable(self) >= other
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._index))
 
     def __str__(self) -> str:
         return f"{self.name} ({self.var_type}): [{self.lb}, {self.ub}]"
@@ -65,15 +116,184 @@ class Variable:
     def __repr__(self) -> str:
         return f"Variable({self.name}, {self.lb}, {self.ub}, {self.var_type})"
 
+    def __add__(self, other: Union["LinearExpr", "Variable", int, float]) -> "LinearExpr":
+        return LinearExpr.from_variable(self) + other
+
+    def __radd__(self, other: Union["LinearExpr", "Variable", int, float]) -> "LinearExpr":
+        return LinearExpr.from_variable(self) + other
+
+    def __sub__(self, other: Union["LinearExpr", "Variable", int, float]) -> "LinearExpr":
+        return LinearExpr.from_variable(self) - other
+
+    def __rsub__(self, other: Union["LinearExpr", "Variable", int, float]) -> "LinearExpr":
+        return LinearExpr.from_variable(self) * -1 + other
+
+    def __mul__(self, scalar: Union[int, float]) -> "LinearExpr":
+        if not isinstance(scalar, Real):
+            raise TypeError("Scalar multiplication is only supported with int or float values")
+        expression = LinearExpr()
+        expression._terms[self] = scalar
+        return expression
+
+    def __rmul__(self, scalar: Union[int, float]) -> "LinearExpr":
+        return self * scalar
+
+    def __neg__(self) -> "LinearExpr":
+        return LinearExpr.from_variable(self) * -1
+
+
+class VariableBlock(abc.Sequence):
+    """
+    A contiguous block of variables in a model, as returned by
+    Model.add_variables. Handles are created only when individual
+    variables are accessed. For a NumPy array or SciPy sparse matrix A,
+    A @ x gives the MatrixExpr of the rows of A, or the LinearExpr of a
+    vector A.
+
+    Attributes:
+        model (Model): The model the variables belong to.
+        indices (np.ndarray): The indices of the variables in the model.
+        lb (np.ndarray): The lower bounds of the variables.
+        ub (np.ndarray): The upper bounds of the variables.
+    """
+
+    # NumPy defers A @ x to __rmatmul__ instead of converting the block
+    __array_ufunc__ = None
+
+    def __init__(self, model: "Model", start: int, stop: int):
+        """
+        Initializes a new VariableBlock instance.
+
+        Args:
+            model (Model): The model the variables belong to.
+            start (int): The index of the first variable.
+            stop (int): One past the index of the last variable.
+        """
+        self.model = model
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Variable, "VariableBlock", List[Variable]]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return VariableBlock(self.model, self._start + start, self._start + max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("VariableBlock index out of range")
+        return Variable._handle(self.model._variable_store, self._start + key)
+
+    def __iter__(self) -> Iterator[Variable]:
+        store = self.model._variable_store
+        for index in range(self._start, self._stop):
+            yield Variable._handle(store, index)
+
+    def __contains__(self, variable: object) -> bool:
+        return (isinstance(variable, Variable) and variable._store is self.model._variable_store
+                and self._start <= variable._index < self._stop)
+
+    @property
+    def indices(self) -> np.ndarray:
+        return np.arange(self._start, self._stop)
+
+    @property
+    def lb(self) -> np.ndarray:
+        return self.model._variable_store.lb[self._start:self._stop]
+
+    @lb.setter
+    def lb(self, lb: Union[float, np.ndarray]) -> None:
+        self.model._variable_store.lb[self._start:self._stop] = lb
+
+    @property
+    def ub(self) -> np.ndarray:
+        return self.model._variable_store.ub[self._start:self._stop]
+
+    @ub.setter
+    def ub(self, ub: Union[float, np.ndarray]) -> None:
+        self.model._variable_store.ub[self._start:self._stop] = ub
+
+    def dot(self, coeffs: np.ndarray) -> "LinearExpr":
+        """
+        Creates the linear expression sum_i coeffs[i] * self[i] without
+        creating per-variable objects.
+
+        Args:
+            coeffs (np.ndarray): The coefficients, one per variable in the block.
+
+        Returns:
+            LinearExpr: The linear expression.
+        """
+        return LinearExpr.from_arrays(self.indices, coeffs, self.model)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        # SciPy defers A @ x to __rmatmul__ only for operands that convert to
+        # a 0-d object array
+        wrapped = np.empty((), dtype=object)
+        wrapped[()] = self
+        return wrapped
+
+    def __rmatmul__(self, A) -> Union["MatrixExpr", "LinearExpr"]:
+        if getattr(A, "ndim", None) == 1 or np.ndim(A) == 1:
+            return self.dot(np.asarray(A, dtype=float))
+        return MatrixExpr.from_block(A, self)
+
+    def __repr__(self) -> str:
+        return f"VariableBlock({self._start}:{self._stop})"
+
+
+class _ArrayTerms:
+    """
+    Terms given as arrays of column indices into a model's variables and
+    their coefficients. Used as a leaf of a pending sum so that matrix
+    assembly can consume the arrays without creating per-term objects.
+    """
+
+    __slots__ = ("model", "indices", "coefficients")
+
+    def __init__(self, model: "Model", indices: np.ndarray, coefficients: np.ndarray):
+        self.model = model
+        self.indices = indices
+        self.coefficients = coefficients
+
+    def items(self) -> Iterator[Tuple[Variable, float]]:
+        variables = self.model.variables
+        return zip([variables[j] for j in self.indices.tolist()], self.coefficients.tolist())
+
 
 class LinearExpr:
     """
     Represents a linear expression.
 
+    The terms are stored in a dictionary keyed by variable, so adding a term
+    or looking up a coefficient takes constant time. The arithmetic operators
+    do not copy their operands: they record an unevaluated sum that refers to
+    the operands' term dictionaries, which is evaluated in a single pass the
+    first time the terms are read. Operands whose dictionaries are referenced
+    this way copy them before their next in-place change. This keeps chains
+    such as sum() over many expressions linear in the total number of terms.
+    The in-place operators += and -= merge into the expression's own
+    dictionary, and expressions created with from_arrays keep their terms as
+    arrays until they are read term by term.
+
+    Comparing an expression with <=, >= or == gives a Constraint, with the
+    difference of two expressions on the left-hand side, except that an
+    expression is equal to itself. An expression that
+    is the left-hand side of constraints of a model tells them when it is
+    changed in place, so that their rows are updated at the next assembly.
+
     Attributes:
-        terms (dict[Variable, float]): The terms of the linear expression.
+        terms (Mapping[Variable, float]): The terms of the linear expression (read-only).
+        constant (float): The constant term of the linear expression.
     """
 
+    # == builds a constraint, so expressions keep hashing by identity
+    __hash__ = object.__hash__
+
     @classmethod
     def from_variable(cls, variable: Variable) -> "LinearExpr":
         """
@@ -83,7 +303,9 @@ class LinearExpr:
             variable (Variable): The variable to create the linear expression from.
         """
 
-        return cls([variable], [1])
+        expression = cls()
+        expression._terms[variable] = 1
+        return expression
 
     @classmethod
     def from_constant(cls, constant: float) -> "LinearExpr":
@@ -94,15 +316,187 @@ class LinearExpr:
             constant (float): The constant to create the linear expression from.
         """
 
-        return cls([Variable("constant", 0, 0)], [constant])
+        return cls(constant=constant)
+
+    @classmethod
+    def from_arrays(cls, var_indices: np.ndarray, coeffs: np.ndarray, model: "Model") -> "LinearExpr":
+        """
+        Creates a linear expression from arrays of column indices and coefficients.
+
+        The arrays are kept as they are and are read directly when the model's
+        matrix form is assembled. Repeated indices are summed.
+
+        Args:
+            var_indices (np.ndarray): The indices of the variables in model.variables.
+            coeffs (np.ndarray): The coefficients of the terms.
+            model (Model): The model the variables belong to.
+        """
+
+        var_indices = np.asarray(var_indices, dtype=np.int64)
+        coeffs = np.asarray(coeffs, dtype=float)
+        if var_indices.shape != coeffs.shape or var_indices.ndim != 1:
+            raise ValueError("var_indices and coeffs must be one-dimensional arrays of equal length")
+        expression = cls()
+        expression._pending = _ArrayTerms(model, var_indices, coeffs)
+        return expression
+
+    def __init__(self, variables: List[Variable]=None, coefficients: List[float]=None, constant: float=0):
+        """
+        Initializes a new linear expression.
 
-    def __init__(self, variables: List[Variable]=None, coefficients: List[float]=None):
-        if variables is None:
-            self.variables = []
-            self.coefficients = []
+        Args:
+            variables (list[Variable]): The variables of the terms.
+            coefficients (list[float]): The coefficients of the terms.
+            constant (float): The constant term. Defaults to 0.
+        """
+        self._terms = {}
+        self._pending = None
+        self._shared = False
+        self._constant = constant
+        # The constraints of models whose rows are assembled from the expression
+        self._owners = None
+        if variables is not None:
+            for variable, coefficient in zip(variables, coefficients):
+                self.add_term(variable, coefficient)
+
+    @property
+    def constant(self) -> float:
+        return self._constant
+
+    @constant.setter
+    def constant(self, constant: float) -> None:
+        self._constant = constant
+        if self._owners:
+            self._changed()
+
+    def _changed(self) -> None:
+        """
+        Tells the constraints that own the expression that it has changed.
+        """
+        if self._owners:
+            for owner in self._owners:
+                constraint = owner()
+                if constraint is not None:
+                    constraint._expression_changed(self)
+
+    @property
+    def terms(self) -> Mapping[Variable, float]:
+        return MappingProxyType(self._evaluated())
+
+    @property
+    def variables(self) -> List[Variable]:
+        return list(self._evaluated())
+
+    @property
+    def coefficients(self) -> List[float]:
+        return list(self._evaluated().values())
+
+    def _evaluated(self) -> Dict[Variable, float]:
+        """
+        Returns:
+            dict[Variable, float]: The term dictionary, evaluating a pending sum first.
+        """
+        if self._pending is not None:
+            self._terms = self._evaluate(self._pending)
+            self._pending = None
+            self._shared = False
+        return self._terms
+
+    def _owned(self) -> Dict[Variable, float]:
+        """
+        Returns:
+            dict[Variable, float]: The term dictionary, copied first if another
+                                   expression still refers to it.
+        """
+        terms = self._evaluated()
+        if self._shared:
+            terms = self._terms = terms.copy()
+            self._shared = False
+        return terms
+
+    def _node(self):
+        """
+        Returns an immutable reference to the terms for use in a pending sum.
+
+        Returns:
+            dict | tuple: The term dictionary or the pending sum of the expression.
+        """
+        if self._pending is not None:
+            return self._pending
+        self._shared = True
+        return self._terms
+
+    @staticmethod
+    def _evaluate(node) -> Dict[Variable, float]:
+        """
+        Evaluates a pending sum.
+
+        A node is either a term dictionary, array terms or a tuple
+        (left, right, scale) representing left + scale * right, where left
+        may be None.
+
+        Args:
+            node (dict | tuple): The root of the pending sum.
+
+        Returns:
+            dict[Variable, float]: The summed terms.
+        """
+        terms = None
+        for leaf, scale in LinearExpr._walk(node):
+            if terms is None and scale == 1 and isinstance(leaf, dict):
+                terms = leaf.copy()
+            else:
+                if terms is None:
+                    terms = {}
+                for variable, coefficient in leaf.items():
+                    terms[variable] = terms.get(variable, 0) + scale * coefficient
+        return {} if terms is None else terms
+
+    @staticmethod
+    def _walk(node) -> Iterator[Tuple[Union[dict, _ArrayTerms], float]]:
+        """
+        Yields the leaves of a pending sum from left to right.
+
+        Args:
+            node (dict | _ArrayTerms | tuple): The root of the pending sum.
+
+        Yields:
+            tuple[dict | _ArrayTerms, float]: A leaf and the factor it is scaled by.
+        """
+        stack = [(node, 1)]
+        while stack:
+            node, scale = stack.pop()
+            if node is None:
+                continue
+            if isinstance(node, tuple):
+                left, right, right_scale = node
+                stack.append((right, scale * right_scale))
+                stack.append((left, scale))
+            else:
+                yield node, scale
+
+    def _leaves(self) -> Iterator[Tuple[Union[dict, _ArrayTerms], float]]:
+        """
+        Yields the term dictionaries and array terms that make up the
+        expression without evaluating a pending sum. Variables may repeat
+        across leaves, in which case their coefficients are to be summed.
+
+        Yields:
+            tuple[dict | _ArrayTerms, float]: A leaf and the factor it is scaled by.
+        """
+        if self._pending is None:
+            yield self._terms, 1
         else:
-            self.variables = variables
-            self.coefficients = coefficients
+            yield from self._walk(self._pending)
+
+    def copy(self) -> "LinearExpr":
+        """
+        Returns:
+            LinearExpr: A copy of the linear expression.
+        """
+        result = LinearExpr(constant=self.constant)
+        result._pending = self._node()
+        return result
 
     def add_term(self, variable: Variable, coefficient: float) -> None:
         """
@@ -112,33 +506,72 @@ class LinearExpr:
             variable (Variable): The variable of the term.
             coefficient (float): The coefficient of the term.
         """
-        if variable in self.variables:
-            self.coefficients[self.variables.index(variable)] += coefficient
+        terms = self._owned()
+        terms[variable] = terms.get(variable, 0) + coefficient
+        if self._owners:
+            self._changed()
+
+    def _add(self, other: Union["LinearExpr", Variable, int, float], sign: int) -> "LinearExpr":
+        if isinstance(other, LinearExpr):
+            result = LinearExpr(constant=self.constant + sign * other.constant)
+            result._pending = (self._node(), other._node(), sign)
+        elif isinstance(other, Variable):
+            result = LinearExpr(constant=self.constant)
+            result._pending = (self._node(), {other: 1}, sign)
+        elif isinstance(other, Real):
+            result = LinearExpr(constant=self.constant + sign * other)
+            result._pending = self._node()
         else:
-            self.variables.append(variable)
-            self.coefficients.append(coefficient)
+            return NotImplemented
+        return result
 
     def __add__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return self._add(other, 1)
+
+    def __radd__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return self._add(other, 1)
+
+    def __sub__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return self._add(other, -1)
+
+    def __rsub__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return (self * -1)._add(other, 1)
+
+    def _iadd(self, other: Union["LinearExpr", Variable, int, float], sign: int) -> "LinearExpr":
         if isinstance(other, LinearExpr):
-            result = LinearExpr(self.variables, self.coefficients)
-            for variable, coefficient in zip(other.variables, other.coefficients):
-                result.add_term(variable, coefficient)
-            return result
+            self._constant += sign * other._constant
+            if self._pending is None and other._pending is None:
+                terms = self._owned()
+                for variable, coefficient in other._terms.items():
+                    terms[variable] = terms.get(variable, 0) + sign * coefficient
+            else:
+                self._pending = (self._node(), other._node(), sign)
         elif isinstance(other, Variable):
-            return self + LinearExpr.from_variable(other)
-        elif isinstance(other, (int, float)):
-            return self + LinearExpr.from_constant(other)
+            if self._pending is None:
+                self.add_term(other, sign)
+            else:
+                self._pending = (self._pending, {other: 1}, sign)
+        elif isinstance(other, Real):
+            self._constant += sign * other
         else:
-            raise TypeError("Unsupported operand type(s) for +: 'LinearExpr' and '{}'".format(type(other)))
+            return NotImplemented
+        if self._owners:
+            self._changed()
+        return self
 
-    def __sub__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
-        return self + (-other)
+    def __iadd__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return self._iadd(other, 1)
+
+    def __isub__(self, other: Union["LinearExpr", Variable, int, float]) -> "LinearExpr":
+        return self._iadd(other, -1)
 
     def __mul__(self, scalar: Union[int,float]) -> "LinearExpr":
-        if isinstance(scalar, (int, float)):
-            result = LinearExpr()
-            for variable, coefficient in zip(self.variables, self.coefficients):
-                result.add_term(variable, coefficient * scalar)
+        if isinstance(scalar, Real):
+            result = LinearExpr(constant=self.constant * scalar)
+            if self._pending is None:
+                result._terms = {variable: coefficient * scalar for variable, coefficient in self._terms.items()}
+            else:
+                result._pending = (None, self._pending, scalar)
             return result
         else:
             raise TypeError("Scalar multiplication is only supported with int or float values")
@@ -146,16 +579,200 @@ class LinearExpr:
     def __rmul__(self, scalar: Union[int,float]) -> "LinearExpr":
         return self * scalar
 
+    def __neg__(self) -> "LinearExpr":
+        return self * -1
+
+    def _compare(self, other: Union["LinearExpr", Variable, int, float], sense: str) -> "Constraint":
+        from .constraint import Constraint
+
+        if isinstance(other, Real):
+            return Constraint(self, sense, other)
+        if isinstance(other, (LinearExpr, Variable)):
+            return Constraint(self - other, sense, 0)
+        return NotImplemented
+
+    def __le__(self, other: Union["LinearExpr", Variable, int, float]) -> "Constraint":
+        return self._compare(other, "<=")
+
+    def __ge__(self, other: Union["LinearExpr", Variable, int, float]) -> "Constraint":
+        return self._compare(other, ">=")
+
+    def __eq__(self, other: Union["LinearExpr", Variable, int, float]) -> Union[bool, "Constraint"]:
+        if other is self:
+            # Lookups in containers and assertEqual rely on identity meaning equality
+            return True
+        return self._compare(other, "=")
+
+    def __len__(self) -> int:
+        return len(self._evaluated())
+
     def __getitem__(self, variable: Variable) -> float:
-        return self.coefficients[self.variables.index(variable)]
+        return self._evaluated()[variable]
 
     def __setitem__(self, variable: Variable, coefficient: float) -> None:
-        if variable in self.variables:
-            self.coefficients[self.variables.index(variable)] = coefficient
-        else:
-            self.add_term(variable, coefficient)
+        self._owned()[variable] = coefficient
+        if self._owners:
+            self._changed()
 
     def __str__(self) -> str:
-        return " + ".join([f"{coefficient:.2f} * {variable.name}" for variable, coefficient in zip(self.variables, self.coefficients)])
+        expression_str = " + ".join([f"{coefficient:.2f} * {variable.name}" for variable, coefficient in self._evaluated().items()])
+        if self.constant:
+            expression_str = f"{expression_str} + {self.constant:.2f}" if expression_str else f"{self.constant:.2f}"
+        return expression_str
+
+
+def quicksum(iterable: Iterable[Union[LinearExpr, Variable, int, float]]) -> LinearExpr:
+    """
+    Sums linear expressions, variables and constants into a single expression.
 
+    The terms are accumulated into one dictionary, so the cost is linear in
+    the total number of terms. Unevaluated operands, such as expressions
+    created with LinearExpr.from_arrays, are kept unevaluated.
+
+    Args:
+        iterable (Iterable[LinearExpr | Variable | int | float]): The items to sum.
+
+    Returns:
+        LinearExpr: The sum of the items.
+    """
+
+    result = LinearExpr()
+    terms = result._terms
+    pending = None
+    constant = 0
+    for item in iterable:
+        if isinstance(item, LinearExpr):
+            constant += item._constant
+            if item._pending is None:
+                for variable, coefficient in item._terms.items():
+                    terms[variable] = terms.get(variable, 0) + coefficient
+            else:
+                pending = (pending, item._pending, 1)
+        elif isinstance(item, Variable):
+            terms[item] = terms.get(item, 0) + 1
+        elif isinstance(item, Real):
+            constant += item
+        else:
+            raise TypeError(f"Unsupported operand type for quicksum: '{type(item).__name__}'")
+    result._constant = constant
+    if pending is not None:
+        result._pending = (terms, pending, 1)
+    return result
+
+
+class MatrixExpr:
+    """
+    A vector of linear expressions A x + constant, one per row of A, as
+    created by A @ x for a NumPy array or a SciPy sparse matrix A and a
+    VariableBlock x. The rows are kept as one CSR matrix over the variables
+    of the model rather than as an expression per row. Comparing it with
+    <=, >= or == gives a MatrixConstraint, which Model.add_constraints adds
+    to the model in one call.
+
+    Attributes:
+        model (Model): The model the variables belong to.
+        A (scipy.sparse.csr_matrix): The coefficients, with one column per
+            variable of the model up to the last one used.
+        constant (np.ndarray): The constant term of each row.
+    """
 
+    # NumPy defers b <= A @ x and b + A @ x to the operators below
+    __array_ufunc__ = None
+
+    def __init__(self, model: "Model", A: "sp.csr_matrix", constant: Union[float, np.ndarray] = 0.0):
+        """
+        Initializes a new MatrixExpr instance.
+
+        Args:
+            model (Model): The model the variables belong to.
+            A (scipy.sparse.csr_matrix): The coefficients over the variables of the model.
+            constant (float | np.ndarray): The constant term of each row. Defaults to 0.
+        """
+        self.model = model
+        self.A = A
+        self.constant = np.broadcast_to(np.asarray(constant, dtype=float), A.shape[0]).copy()
+
+    @classmethod
+    def from_block(cls, A, variables: VariableBlock) -> "MatrixExpr":
+        """
+        Creates the expressions A x for a block of variables x.
+
+        Args:
+            A (np.ndarray | scipy.sparse.spmatrix): The coefficients, with one column per variable of the block.
+            variables (VariableBlock): The variables.
+
+        Raises:
+            ValueError: If A does not have a column per variable.
+        """
+        import scipy.sparse as sp
+
+        A = sp.csr_matrix(A, dtype=float)
+        if A.shape[1] != len(variables):
+            raise ValueError(f"The matrix has {A.shape[1]} columns for {len(variables)} variables")
+        columns = variables.indices[A.indices]
+        return cls(variables.model, sp.csr_matrix((A.data, columns, A.indptr), shape=(A.shape[0], variables._stop)))
+
+    def __len__(self) -> int:
+        return self.A.shape[0]
+
+    def _add(self, other: Union["MatrixExpr", np.ndarray, int, float], sign: int) -> "MatrixExpr":
+        if isinstance(other, MatrixExpr):
+            if other.model is not self.model:
+                raise ValueError("The expressions refer to the variables of different models")
+            if len(other) != len(self):
+                raise ValueError(f"Cannot add expressions of {len(self)} and {len(other)} rows")
+            import scipy.sparse as sp
+
+            n = max(self.A.shape[1], other.A.shape[1])
+            A = (sp.csr_matrix((self.A.data, self.A.indices, self.A.indptr), shape=(len(self), n))
+                 + sign * sp.csr_matrix((other.A.data, other.A.indices, other.A.indptr), shape=(len(self), n)))
+            return MatrixExpr(self.model, A, self.constant + sign * other.constant)
+        if isinstance(other, (Real, np.ndarray)):
+            return MatrixExpr(self.model, self.A, self.constant + sign * np.asarray(other, dtype=float))
+        return NotImplemented
+
+    def __add__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixExpr":
+        return self._add(other, 1)
+
+    def __radd__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixExpr":
+        return self._add(other, 1)
+
+    def __sub__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixExpr":
+        return self._add(other, -1)
+
+    def __rsub__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixExpr":
+        return (self * -1)._add(other, 1)
+
+    def __mul__(self, scalar: Union[int, float]) -> "MatrixExpr":
+        if not isinstance(scalar, Real):
+            return NotImplemented
+        return MatrixExpr(self.model, self.A * scalar, self.constant * scalar)
+
+    def __rmul__(self, scalar: Union[int, float]) -> "MatrixExpr":
+        return self * scalar
+
+    def __neg__(self) -> "MatrixExpr":
+        return self * -1
+
+    def _compare(self, other: Union["MatrixExpr", np.ndarray, int, float], sense: str) -> "MatrixConstraint":
+        from .constraint import MatrixConstraint
+
+        if isinstance(other, MatrixExpr):
+            difference = self - other
+            return MatrixConstraint(self.model, difference.A, sense, -difference.constant)
+        if isinstance(other, (Real, np.ndarray, list, tuple)):
+            rhs = np.broadcast_to(np.asarray(other, dtype=float), len(self)) - self.constant
+            return MatrixConstraint(self.model, self.A, sense, rhs)
+        return NotImplemented
+
+    def __le__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixConstraint":
+        return self._compare(other, "<=")
+
+    def __ge__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixConstraint":
+        return self._compare(other, ">=")
+
+    def __eq__(self, other: Union["MatrixExpr", np.ndarray, int, float]) -> "MatrixConstraint":
+        return self._compare(other, "=")
+
+    def __repr__(self) -> str:
+        return f"MatrixExpr({self.A.shape[0]} rows, {self.A.nnz} nonzeros)"
@@ -0,0 +1,254 @@
+import numpy as np
+from typing import TYPE_CHECKING
+
+from .variable_store import VariableStore
+
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+
+
+class MatrixForm:
+    """
+    The assembled matrix form of an LP model.
+
+    Attributes:
+        A (scipy.sparse.csr_matrix): The m x n constraint matrix.
+        b (np.ndarray): The right-hand side vector of length m.
+        c (np.ndarray): The objective function coefficients of length n.
+        objective_constant (float): The constant term of the objective function.
+        senses (np.ndarray): The type of each constraint ("<=", ">=" or "=").
+        lb (np.ndarray): The lower bounds of the variables.
+        ub (np.ndarray): The upper bounds of the variables.
+        integer (np.ndarray): A mask of the integer variables, or None if all are continuous.
+        sense (str): "max" or "min", the direction in which c^T x is optimized.
+        ranges (np.ndarray): The width R_i of each ranged row, inf for ordinary rows,
+            or None if there are no ranged rows. A ranged "<=" row holds
+            b_i - R_i <= a_i x <= b_i and a ranged ">=" row b_i <= a_i x <= b_i + R_i.
+    """
+
+    def __init__(self, A: "sp.csr_matrix", b: np.ndarray, c: np.ndarray, objective_constant: float = 0.0,
+                 senses: np.ndarray = None, lb: np.ndarray = None, ub: np.ndarray = None,
+                 integer: np.ndarray = None, sense: str = "max", ranges: np.ndarray = None):
+        """
+        Initializes a new MatrixForm instance.
+
+        Args:
+            A (scipy.sparse.csr_matrix): The m x n constraint matrix.
+            b (np.ndarray): The right-hand side vector of length m.
+            c (np.ndarray): The objective function coefficients of length n.
+            objective_constant (float): The constant term of the objective function.
+            senses (np.ndarray): The type of each constraint. Defaults to "<=" for every row.
+            lb (np.ndarray): The lower bounds of the variables. Defaults to 0.
+            ub (np.ndarray): The upper bounds of the variables. Defaults to inf.
+            integer (np.ndarray): A mask of the integer variables. Defaults to None.
+            sense (str): "max" or "min". Defaults to "max".
+            ranges (np.ndarray): The widths of the ranged rows. Defaults to None.
+        """
+        self.A = A
+        self.b = b
+        self.c = c
+        self.objective_constant = objective_constant
+        self.senses = np.full(A.shape[0], "<=", dtype=object) if senses is None else senses
+        self.lb = np.zeros(A.shape[1]) if lb is None else lb
+        self.ub = np.full(A.shape[1], np.inf) if ub is None else ub
+        self.integer = integer
+        self.sense = sense
+        self.ranges = ranges
+
+    @classmethod
+    def from_model(cls, model: "Model") -> "MatrixForm":
+        """
+        Assembles the matrix form of a model in a single pass over its constraints.
+
+        Every variable handle carries its column index, and the nonzeros of
+        all constraint expressions are collected as COO triplets before being
+        converted to CSR, so memory scales with the number of nonzeros.
+        Constant terms of constraint expressions are moved to the right-hand side.
+        Rows of the model's constraint store are taken from its CSR arrays
+        in one slice rather than row by row.
+
+        Args:
+            model (Model): The model to assemble.
+
+        Returns:
+            MatrixForm: The matrix form of the model.
+        """
+        A, b, senses, ranges = cls._rows(model, model.constraints)
+        return cls._with_objective(model, A, b, senses, ranges)
+
+    @classmethod
+    def from_store(cls, model: "Model") -> "MatrixForm":
+        """
+        Builds the matrix form of a model whose constraints are, in order, the
+        rows of its constraint store by copying the arrays of the store, so
+        that nothing is assembled row by row. Only the objective is assembled.
+
+        Args:
+            model (Model): The model.
+
+        Returns:
+            MatrixForm: The matrix form of the model.
+        """
+        import scipy.sparse as sp
+
+        rows = model._constraint_store
+        m, nnz = len(rows), rows._nnz
+        A = sp.csr_matrix((rows._data[:nnz].copy(), rows._indices[:nnz].copy(), rows._indptr[:m + 1].copy()),
+                          shape=(m, len(model.variables)))
+        return cls._with_objective(model, A, rows.rhs.astype(float), rows.senses.copy(), rows.ranges.astype(float))
+
+    @classmethod
+    def _rows(cls, model: "Model", constraints: list) -> tuple:
+        """
+        Assembles constraints of a model into a CSR matrix.
+
+        Returns:
+            tuple: The matrix, the right-hand sides, the types and the ranges of the rows.
+        """
+        m = len(constraints)
+        n = len(model.variables)
+        store = model._variable_store
+
+        # Terms from dictionaries are gathered in flat lists, array terms in
+        # chunks, and both are concatenated into one COO triplet set.
+        row_lengths = np.zeros(m, dtype=np.int64)
+        cols = []
+        vals = []
+        row_chunks = []
+        col_chunks = []
+        val_chunks = []
+        b = np.zeros(m)
+        senses = np.empty(m, dtype=object)
+        ranges = np.full(m, np.inf)
+        rows_store = model._constraint_store
+        stored_positions = []
+        stored_rows = []
+        for i, constraint in enumerate(constraints):
+            if constraint._store is rows_store:
+                stored_positions.append(i)
+                stored_rows.append(constraint._index)
+                continue
+            expression = constraint.expression
+            senses[i] = constraint.constrain_type
+            if constraint._rhs_range is not None:
+                ranges[i] = constraint._rhs_range
+            if expression._pending is None:
+                terms = expression._terms
+                cols.extend(cls._columns(store, terms))
+                vals.extend(terms.values())
+                row_lengths[i] = len(terms)
+                b[i] = constraint.rhs - expression.constant
+                continue
+            for leaf, scale in expression._leaves():
+                leaf_cols, leaf_vals = cls._leaf_triplets(store, model, leaf, scale)
+                if isinstance(leaf, dict):
+                    cols.extend(leaf_cols)
+                    vals.extend(leaf_vals)
+                    row_lengths[i] += len(leaf_cols)
+                else:
+                    row_chunks.append(np.full(len(leaf_cols), i, dtype=np.int64))
+                    col_chunks.append(np.asarray(leaf_cols, dtype=np.int64))
+                    val_chunks.append(leaf_vals)
+            b[i] = constraint.rhs - expression.constant
+
+        if stored_rows:
+            positions = np.asarray(stored_positions, dtype=np.int64)
+            stored_rows = np.asarray(stored_rows, dtype=np.int64)
+            block = rows_store.matrix(n)[stored_rows]
+            row_chunks.append(np.repeat(positions, np.diff(block.indptr)))
+            col_chunks.append(block.indices.astype(np.int64))
+            val_chunks.append(block.data)
+            b[positions] = rows_store.rhs[stored_rows]
+            senses[positions] = rows_store.senses[stored_rows]
+            ranges[positions] = rows_store.ranges[stored_rows]
+
+        rows = np.concatenate([np.repeat(np.arange(m), row_lengths)] + row_chunks)
+        cols = np.concatenate([np.asarray(cols, dtype=np.int64)] + col_chunks)
+        vals = np.concatenate([np.asarray(vals, dtype=float)] + val_chunks)
+        import scipy.sparse as sp
+
+        return sp.csr_matrix((vals, (rows, cols)), shape=(m, n)), b, senses, ranges
+
+    @classmethod
+    def _with_objective(cls, model: "Model", A: "sp.csr_matrix", b: np.ndarray, senses: np.ndarray,
+                        ranges: np.ndarray) -> "MatrixForm":
+        """
+        Completes assembled rows with the objective and the variables of a model.
+        """
+        n = A.shape[1]
+        store = model._variable_store
+        c = np.zeros(n)
+        objective_constant = 0.0
+        if model.objective is not None:
+            expression = model.objective.expression
+            for leaf, scale in expression._leaves():
+                leaf_cols, leaf_vals = cls._leaf_triplets(store, model, leaf, scale)
+                np.add.at(c, np.asarray(leaf_cols, dtype=np.int64), leaf_vals)
+            objective_constant = expression.constant
+
+        integer = store.vtype == VariableStore.type_code("integer")
+        sense = "max" if model.objective is None or model.objective.sense.lower().startswith("max") else "min"
+        return cls(A, b, c, objective_constant, senses, store.lb.copy(), store.ub.copy(),
+                   integer if integer.any() else None, sense,
+                   ranges if np.isfinite(ranges).any() else None)
+
+    @staticmethod
+    def _leaf_triplets(store: "VariableStore", model: "Model", leaf, scale: float) -> tuple:
+        """
+        Returns the column indices and values of a term dictionary or of
+        array terms, the latter without creating per-term objects when they
+        refer to the model being assembled.
+        """
+        if isinstance(leaf, dict):
+            values = list(leaf.values()) if scale == 1 else [scale * value for value in leaf.values()]
+            return MatrixForm._columns(store, leaf), values
+        if leaf.model is not model:
+            raise ValueError("Array terms refer to the variables of another model")
+        return leaf.indices, scale * leaf.coefficients
+
+    @staticmethod
+    def _columns(store: "VariableStore", variables) -> list:
+        columns = [variable._index for variable in variables if variable._store is store]
+        if len(columns) != len(variables):
+            for variable in variables:
+                if variable._store is not store:
+                    raise ValueError(f"Variable {variable.name} is not part of the model")
+        return columns
+
+    def row_bounds(self) -> tuple:
+        """
+        Returns the rows as intervals lo <= A x <= hi, with infinite limits
+        for the missing side of "<=" and ">=" rows.
+
+        Returns:
+            tuple: The lower and the upper limits of the rows.
+
+        Raises:
+            ValueError: If a row has an unknown type.
+        """
+        b = self.b.astype(float)
+        ranges = np.full(len(b), np.inf) if self.ranges is None else np.abs(self.ranges)
+        equality = (self.senses == "=") | (self.senses == "==")
+        lower = self.senses == ">="
+        upper = self.senses == "<="
+        if not np.all(equality | lower | upper):
+            raise ValueError(f"Unknown constraint type: {self.senses[~(equality | lower | upper)][0]}")
+        return np.where(upper, b - ranges, b), np.where(lower, b + ranges, b)
+
+    def to_matrix_form(self) -> "MatrixForm":
+        """
+        Returns the matrix form itself, so that solvers accept a matrix form
+        in place of a model.
+
+        Returns:
+            MatrixForm: This matrix form.
+        """
+        return self
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Returns:
+            tuple: The number of rows and columns of the constraint matrix.
+        """
+        return self.A.shape
@@ -1,13 +1,126 @@
 from .objective import Objective
-from .constraint import Constraint
-from .linear_expr import LinearExpr, Variable
-from ..solvers.interior_point import InteriorPointSolver
-from ..solvers.simplex import SimplexSolver
+from .constraint import Constraint, MatrixConstraint
+from .linear_expr import LinearExpr, MatrixExpr, Variable, VariableBlock
+from .variable_store import VariableStore
+from .constraint_store import ConstraintStore
+from .matrix_form import MatrixForm
+from ..solvers.basis import Basis
+from ..solvers.registry import get_solver
+from ..solvers.solution import Solution
 
 # Third party imports
+import operator
+import time
+import numpy as np
 from math import inf
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
 from collections import namedtuple
+from functools import partial
+
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+    from .solve_cache import SolveCache
+    from ..solvers.dual_simplex import DualSimplexSolver
+
+# SciPy, presolve, branch and bound, the file formats and the solvers are
+# imported on first use, so that importing optizenith stays cheap
+
+BatchSolution = namedtuple("BatchSolution", ["objectives", "solutions"])
+
+
+def solve_matrix_form(form: MatrixForm, solver: str = "simplex", warm_start: Optional[Basis] = None,
+                      presolve: bool = True, names: Optional[np.ndarray] = None,
+                      cache: Optional["SolveCache"] = None, **kwargs) -> Solution:
+    """
+    Presolves and solves the matrix form of a model and maps the solution
+    back to the variables and constraints of the model. A form with integer
+    variables is solved by branch and bound, with this function solving
+    the relaxations.
+
+    Args:
+        form (MatrixForm): The matrix form of the model.
+        solver (str): The name of a registered solver, e.g. "simplex", "dual-simplex"
+            or "interior-point". Defaults to "simplex".
+        warm_start (Basis): The basis to start from. Defaults to None.
+        presolve (bool): Whether to presolve the model. Defaults to True.
+        names (np.ndarray): The names of the variables, for looking up values by
+            name in the solution. Defaults to None.
+        cache (SolveCache): A cache to answer repeated solves from, and to start
+            from the basis of a similar cached problem if no warm start is
+            given. Defaults to None.
+        **kwargs: Additional keyword arguments to pass to the solver and to
+            BranchAndBound, e.g. gap, time_limit, node_limit, workers or callbacks.
+
+    Returns:
+        Solution: The solution, including the final basis, the presolve report
+            and the profile of the solve with the presolve and postsolve times.
+    """
+    started = time.perf_counter()
+    if cache is not None:
+        keys, solution, basis = cache._lookup(form, solver, presolve, kwargs, warm_start is None)
+        if solution is None:
+            solution = solve_matrix_form(form, solver, warm_start or basis, presolve, names, **kwargs)
+            cache._store(keys, form, solution)
+            return solution
+        solution.time = time.perf_counter() - started
+        solution.names = names
+        return solution
+
+    if form.integer is not None and np.any(form.integer):
+        from .branch_and_bound import BranchAndBound
+
+        relax = partial(solve_matrix_form, solver=solver, presolve=presolve, **kwargs)
+        solution = BranchAndBound(form, relax, warm_start, **kwargs).solve()
+        solution.time = time.perf_counter() - started
+        solution.names = names
+        return solution
+
+    problem = form
+    presolved = None
+    if presolve:
+        from .presolve import Presolve
+
+        presolved = Presolve(form)
+        problem = presolved.form
+        warm_start = presolved.presolve_basis(warm_start)
+    presolved_at = time.perf_counter()
+
+    solver_class = get_solver(solver)
+    if problem.shape[0] == 0:
+        solution = _solve_without_rows(problem)
+    else:
+        _, solution = solver_class(problem, warm_start=warm_start, **kwargs).solve()
+
+    solved_at = time.perf_counter()
+    if presolved is not None:
+        solution = presolved.postsolve_solution(solution)
+    finished = time.perf_counter()
+    if solution.profile is not None:
+        solution.profile.timings["presolve"] = presolved_at - started
+        solution.profile.timings["postsolve"] = finished - solved_at
+    solution.time = finished - started
+    solution.names = names
+    return solution
+
+
+def _solve_without_rows(form: MatrixForm) -> Solution:
+    """
+    Solves a problem without constraints by putting every variable at the
+    bound its objective coefficient favors, or at the bound nearest to zero
+    if the coefficient is zero.
+
+    Raises:
+        ValueError: If a favored bound is infinite or a bound is inconsistent.
+    """
+    lb, ub = form.lb.astype(float), form.ub.astype(float)
+    if np.any(lb > ub):
+        raise ValueError("The problem is infeasible.")
+    c = -form.c if form.sense == "min" else form.c
+    x = np.where(c > 0, ub, np.where(c < 0, lb, np.clip(0.0, lb, ub)))
+    if not np.all(np.isfinite(x)):
+        raise ValueError("The problem is unbounded.")
+    basis = Basis.from_indices(np.zeros(0, dtype=np.int64), len(x), 0, (x == ub) & (lb < ub) & (c > 0))
+    return Solution(form.c @ x + form.objective_constant, x, np.zeros(0), np.zeros(0), -form.c, basis=basis)
 
 
 class Model:
@@ -18,7 +131,15 @@ class Model:
         name (str): The name of the model.
         objective (Objective): The objective function of the model.
         constraints (list[Constraint]): The constraints of the model.
-        variables (list[Variable]): The variables of the model.
+        variables (VariableBlock): The variables of the model. Their bounds,
+            types and names are stored in contiguous arrays.
+
+    The rows of the constraints are kept in the model's constraint store,
+    which serves as the cached constraint matrix: changes to right-hand sides,
+    coefficients and bounds are written straight to the stored arrays, new
+    constraints are appended to them and removed ones cut out, so that
+    assembling the matrix form after a small change copies the arrays
+    instead of rebuilding them from the constraint expressions.
     """
     
     def __init__(self, name: str = ""):
@@ -31,24 +152,323 @@ class Model:
         self.name = name
         self.objective = None
         self.constraints = []
-        self.variables = []
+        self._variable_store = VariableStore()
+        self._constraint_store = ConstraintStore(self)
+        self._basis = None
+        # The constraints as of the last sync with the store, and the
+        # number of handles detached from the store by then
+        self._synced = []
+        self._synced_detached = 0
+
+    @property
+    def variables(self) -> VariableBlock:
+        return VariableBlock(self, 0, len(self._variable_store))
     
-    def add_constraint(self, expression: LinearExpr, constrain_type: str, rhs: float) -> Constraint:
+    def add_constraint(self, expression: Union[LinearExpr, Constraint, MatrixConstraint],
+                       constrain_type: Optional[str] = None, rhs: Optional[float] = None,
+                       name: Optional[str] = None, rhs_range: Optional[float] = None) -> Constraint:
         """
-        Adds a constraint to the model.
+        Adds a constraint to the model, given as an expression, a type and a
+        right-hand side, or as a comparison such as x + y <= 4. The rows of a
+        comparison of a MatrixExpr, such as A @ x <= b, are passed on to
+        add_constraints.
 
         Args:
-            expression (LinearExpr): The expression of the constraint.
-            constrain_type (str): The type of the constraint.
-            rhs (float): The right-hand side value of the constraint.
+            expression (LinearExpr | Constraint | MatrixConstraint): The expression
+                of the constraint, or the constraint.
+            constrain_type (str): The type of the constraint. Defaults to None
+                for a constraint given as a comparison.
+            rhs (float): The right-hand side value of the constraint. Defaults
+                to None for a constraint given as a comparison.
+            name (str): The name of the constraint. Defaults to None.
+            rhs_range (float): The width R of a ranged constraint, which holds
+                rhs - R <= expression <= rhs for "<=" and rhs <= expression <= rhs + R
+                for ">=". Defaults to None.
 
         Returns:
-            Constraint: The constraint that was added to the model.
+            Constraint: The constraint that was added to the model, or the list
+                of constraints for a MatrixConstraint.
+
+        Raises:
+            ValueError: If the type or the right-hand side is missing, the
+                constraint is already a row of a model, or the expression is
+                the bool of a comparison x == y of two variables.
         """
-        constraint = Constraint(expression, constrain_type, rhs)
+        if isinstance(expression, MatrixConstraint):
+            return self.add_constraints(expression)
+        if isinstance(expression, Constraint):
+            constraint = expression
+            if constraint._store is not None:
+                raise ValueError("The constraint is already part of a model")
+            if name is not None:
+                constraint.name = name
+            if rhs_range is not None:
+                constraint.rhs_range = rhs_range
+        elif isinstance(expression, bool):
+            raise ValueError("x == y between two variables compares the variables; "
+                             "write x - y == 0 for the constraint")
+        elif constrain_type is None or rhs is None:
+            raise ValueError("A constraint needs a type and a right-hand side")
+        else:
+            constraint = Constraint(expression, constrain_type, rhs, name, rhs_range)
         self.constraints.append(constraint)
         return constraint
 
+    def add_constraints(self, constraints: MatrixConstraint,
+                        names: Optional[Sequence[str]] = None) -> List[Constraint]:
+        """
+        Adds the rows of a comparison of a MatrixExpr, e.g. A @ x <= b, to the
+        constraint store in one call.
+
+        Args:
+            constraints (MatrixConstraint): The rows.
+            names (Sequence[str]): The names of the rows. Defaults to None.
+
+        Returns:
+            list[Constraint]: The constraints that were added to the model.
+
+        Raises:
+            ValueError: If the rows refer to the variables of another model.
+        """
+        if constraints.model is not self:
+            raise ValueError("The rows refer to the variables of another model")
+        return self._extend_constraints(constraints.A, np.full(len(constraints), constraints.sense, dtype=object),
+                                        constraints.rhs, names)
+
+    def add_constraints_from_matrix(self, A: Union[np.ndarray, "sp.spmatrix"], sense: Union[str, Sequence[str]],
+                                    b: Union[float, np.ndarray], variables: Optional[VariableBlock] = None,
+                                    names: Optional[Sequence[str]] = None) -> List[Constraint]:
+        """
+        Adds the rows A x (sense) b in one call, without an expression per row.
+
+        Args:
+            A (np.ndarray | scipy.sparse.spmatrix): The coefficients, dense or
+                sparse, with one column per variable of `variables`.
+            sense (str | Sequence[str]): The type of every row, or of each row.
+            b (float | np.ndarray): The right-hand side of every row, or of each row.
+            variables (VariableBlock): The variables x. Defaults to None for all
+                variables of the model.
+            names (Sequence[str]): The names of the rows. Defaults to None.
+
+        Returns:
+            list[Constraint]: The constraints that were added to the model.
+
+        Raises:
+            ValueError: If the shapes do not match, a type is unknown or the
+                variables belong to another model.
+        """
+        variables = self.variables if variables is None else variables
+        if variables.model is not self:
+            raise ValueError("The variables belong to another model")
+        expression = MatrixExpr.from_block(A, variables)
+        k = len(expression)
+        senses = np.full(k, sense, dtype=object) if isinstance(sense, str) else np.asarray(sense, dtype=object)
+        if senses.shape != (k,):
+            raise ValueError(f"Expected {k} constraint types, got {len(senses)}")
+        if not np.isin(senses, ("<=", ">=", "=", "==")).all():
+            raise ValueError(f"Unknown constraint type: {senses[~np.isin(senses, ('<=', '>=', '=', '=='))][0]}")
+        return self._extend_constraints(expression.A, senses, np.broadcast_to(np.asarray(b, dtype=float), k), names)
+
+    def _extend_constraints(self, A: "sp.csr_matrix", senses: Sequence[str], rhs: np.ndarray,
+                            names: Optional[Sequence[str]] = None,
+                            ranges: Optional[np.ndarray] = None) -> List[Constraint]:
+        """
+        Adds the rows of a sparse matrix as constraints, stored as arrays in
+        the model's constraint store with one lightweight handle per row.
+        Constraints added one at a time before are moved into the store
+        first, so that the rows stay in the order of the constraints.
+
+        Args:
+            A (sp.csr_matrix): The coefficients, with one column per variable of the model.
+            senses (Sequence[str]): The type of each constraint.
+            rhs (np.ndarray): The right-hand side of each constraint.
+            names (Sequence[str]): The names of the constraints. Defaults to None.
+            ranges (np.ndarray): The width of each ranged constraint, inf for
+                ordinary ones. Defaults to None.
+
+        Returns:
+            list[Constraint]: The constraints that were added to the model.
+        """
+        synced = self._sync_constraints()
+        start = self._constraint_store.extend(A, senses, rhs, names, ranges)
+        constraints = Constraint._handles(self._constraint_store, start, start + A.shape[0])
+        self.constraints.extend(constraints)
+        if synced:
+            self._synced.extend(constraints)
+        return constraints
+
+    def _sync_constraints(self) -> bool:
+        """
+        Brings the constraint store in line with the constraints of the model,
+        so that row i of the store is constraints[i] and every constraint is
+        a handle to its row. The rows of handles whose expression changed are
+        assembled again in place, and constraints appended since the last
+        sync are assembled and appended to the store; after any other change
+        to the list, e.g. a detached or reordered constraint, the store is
+        rebuilt.
+
+        Returns:
+            bool: Whether the store is in sync, which it cannot be brought into
+                while a constraint is a handle to another model's store.
+        """
+        store = self._constraint_store
+        if store.dirty:
+            self._patch_rows(store)
+        constraints = self.constraints
+        synced = self._synced
+        start = 0
+        if (store.detached == self._synced_detached and len(constraints) >= len(synced)
+                and all(map(operator.is_, constraints, synced))):
+            start = len(synced)
+        m = len(constraints)
+        stop = min(m, len(store))
+        while start < stop and constraints[start]._store is store and constraints[start]._index == start:
+            start += 1
+        if start == m == len(store):
+            if len(synced) != m:
+                self._synced = list(constraints)
+            return True
+        pending = constraints[start:]
+        if any(constraint._store is not None and constraint._store is not store for constraint in pending):
+            return False
+
+        if start < len(store) or any(constraint._store is not None for constraint in pending):
+            start, pending = 0, constraints
+            # Handles dropped from the list keep their rows
+            listed = set(map(id, constraints))
+            for constraint in synced:
+                if constraint._store is store and id(constraint) not in listed:
+                    constraint._detach()
+        A, b, senses, ranges = MatrixForm._rows(self, pending)
+        names = [constraint.name for constraint in pending]
+        if start == 0:
+            store.clear()
+        store.extend(A, senses, b, names, ranges)
+        attached = set()
+        for index, constraint in enumerate(pending, start):
+            if id(constraint) in attached:
+                # A constraint listed twice cannot be a handle to both rows
+                constraints[index] = constraint = Constraint._handle(store, index)
+            constraint._attach(store, index)
+            attached.add(id(constraint))
+        self._synced = list(constraints)
+        self._synced_detached = store.detached
+        return True
+
+    def _patch_rows(self, store: ConstraintStore) -> None:
+        """
+        Assembles the rows of the handles whose expression changed again and
+        writes them to the constraint store.
+        """
+        changed = [constraint for constraint in store.dirty if constraint._store is store]
+        store.dirty.clear()
+        if not changed:
+            return
+        A, b, _, _ = MatrixForm._rows(self, [Constraint(constraint._expression, "<=", constraint._rhs)
+                                             for constraint in changed])
+        A.sum_duplicates()
+        for k, constraint in enumerate(changed):
+            start, stop = A.indptr[k], A.indptr[k + 1]
+            store.set_row(constraint._index, A.indices[start:stop], A.data[start:stop])
+            store.rhs[constraint._index] = b[k]
+            constraint._offset = constraint._expression.constant
+
+    def remove_constraint(self, constraint: Constraint) -> None:
+        """
+        Removes a constraint from the model. Its row is cut out of the
+        constraint store and the constraint keeps a copy of it. The cached
+        basis loses the status of the row.
+
+        Args:
+            constraint (Constraint): The constraint to remove.
+
+        Raises:
+            ValueError: If the constraint is not part of the model.
+        """
+
+        store = self._constraint_store
+        if not self._sync_constraints():
+            for index, listed in enumerate(self.constraints):
+                if listed is constraint:
+                    del self.constraints[index]
+                    return
+            raise ValueError("The constraint is not part of the model")
+        index = constraint._index
+        if constraint._store is not store or self.constraints[index] is not constraint:
+            raise ValueError("The constraint is not part of the model")
+        constraint._detach()
+        store.delete(index)
+        del self.constraints[index]
+        del self._synced[index]
+        for listed in self.constraints[index:]:
+            listed._index -= 1
+        self._synced_detached = store.detached
+        if self._basis is not None and index < len(self._basis.constraint_status):
+            self._basis = Basis(self._basis.variable_status, np.delete(self._basis.constraint_status, index))
+
+    def set_rhs(self, constraint: Constraint, rhs: float) -> None:
+        """
+        Sets the right-hand side of a constraint, which for a constraint of
+        the model is written straight to the constraint store.
+
+        Args:
+            constraint (Constraint): The constraint.
+            rhs (float): The new right-hand side.
+        """
+
+        constraint.rhs = rhs
+
+    def set_coefficient(self, constraint: Constraint, variable: Variable, coefficient: float) -> None:
+        """
+        Sets the coefficient of a variable in a constraint, patching the row
+        in the constraint store in place.
+
+        Args:
+            constraint (Constraint): The constraint.
+            variable (Variable): The variable.
+            coefficient (float): The new coefficient, 0 to remove the term.
+
+        Raises:
+            ValueError: If the variable or the constraint is not part of the model.
+        """
+
+        if variable._store is not self._variable_store:
+            raise ValueError(f"Variable {variable.name} is not part of the model")
+        self._sync_constraints()
+        if constraint._store is None:
+            constraint.expression[variable] = coefficient
+        elif constraint._store is self._constraint_store:
+            if constraint._expression is not None:
+                # Keeps the expression in line with the row, without marking it changed
+                expression, constraint._expression = constraint._expression, None
+                if coefficient == 0:
+                    expression._owned().pop(variable, None)
+                else:
+                    expression[variable] = coefficient
+                constraint._expression = expression
+            self._constraint_store.set_coefficient(constraint._index, variable._index, coefficient)
+        else:
+            raise ValueError("The constraint is not part of the model")
+
+    def set_bounds(self, variables: Union[Variable, VariableBlock], lb: Union[float, np.ndarray, None] = None,
+                   ub: Union[float, np.ndarray, None] = None) -> None:
+        """
+        Sets the bounds of a variable or a block of variables, which are
+        written straight to the variable store.
+
+        Args:
+            variables (Variable | VariableBlock): The variable or the variables.
+            lb (float | np.ndarray): The new lower bound(s), or None to keep them.
+                Defaults to None.
+            ub (float | np.ndarray): The new upper bound(s), or None to keep them.
+                Defaults to None.
+        """
+
+        if lb is not None:
+            variables.lb = lb
+        if ub is not None:
+            variables.ub = ub
+
     def add_variable(self, name: str, lb: float=0, ub: float=inf, var_type: str="continuous") -> Variable:
         """
         Adds a variable to the model.
@@ -63,9 +483,30 @@ class Model:
             Variable: The variable that was added to the model.
         """
 
-        variable = Variable(name, lb, ub, var_type)
-        self.variables.append(variable)
-        return variable
+        index = self._variable_store.append(name, lb, ub, var_type)
+        return Variable._handle(self._variable_store, index)
+
+    def add_variables(self, n: int, lb: Union[float, np.ndarray]=0, ub: Union[float, np.ndarray]=inf,
+                      var_type: str="continuous", name: Optional[str]=None) -> VariableBlock:
+        """
+        Adds a block of variables to the model without creating per-variable objects.
+
+        Args:
+            n (int): The number of variables to add.
+            lb (float | np.ndarray): The lower bound(s) of the variables. Defaults to 0.
+            ub (float | np.ndarray): The upper bound(s) of the variables. Defaults to inf.
+            var_type (str): The type of the variables. Defaults to "continuous".
+            name (str): A prefix for the names of the variables, which are then
+                named name[0], ..., name[n-1]. Unnamed variables default to
+                x<index + 1>. Defaults to None.
+
+        Returns:
+            VariableBlock: The variables that were added to the model.
+        """
+
+        names = None if name is None else [f"{name}[{k}]" for k in range(n)]
+        start = self._variable_store.extend(n, lb, ub, var_type, names)
+        return VariableBlock(self, start, start + n)
     
     def set_objective(self, expression: LinearExpr, sense: str="minimize") -> None:
         """
@@ -78,29 +519,327 @@ class Model:
 
         self.objective = Objective(expression, sense)
 
-    def solve(self, solver="simplex", **kwargs):
+    def to_matrix_form(self) -> MatrixForm:
+        """
+        Assembles the sparse matrix form of the model. Only constraints added
+        or replaced since the last call are assembled row by row; the other
+        rows are copied from the constraint store.
+
+        Returns:
+            MatrixForm: The constraint matrix, right-hand side and objective coefficients.
+        """
+
+        if self._sync_constraints():
+            return MatrixForm.from_store(self)
+        return MatrixForm.from_model(self)
+
+    @classmethod
+    def read_mps(cls, path) -> "Model":
+        """
+        Reads a model from a free MPS file, which may be gzip-compressed.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            Model: The model.
+        """
+
+        from . import file_formats
+
+        return file_formats.read_mps(path, cls())
+
+    @classmethod
+    def read_lp(cls, path) -> "Model":
+        """
+        Reads a model from a CPLEX LP file, which may be gzip-compressed.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            Model: The model.
+        """
+
+        from . import file_formats
+
+        return file_formats.read_lp(path, cls())
+
+    def write_mps(self, path) -> None:
+        """
+        Writes the model to a free MPS file, gzip-compressed if the name ends in .gz.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+
+        from . import file_formats
+
+        file_formats.write_mps(self, path)
+
+    def write_lp(self, path) -> None:
+        """
+        Writes the model to a CPLEX LP file, gzip-compressed if the name ends in .gz.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+
+        from . import file_formats
+
+        file_formats.write_lp(self, path)
+
+    def save(self, path) -> None:
+        """
+        Writes the model to a binary snapshot, which Model.load opens much
+        faster than rebuilding the model or reading an MPS file.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+
+        from . import snapshot
+
+        snapshot.save(self, path)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "Model":
+        """
+        Loads a model from a binary snapshot written by Model.save.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+            mmap (bool): Whether to memory-map the arrays copy-on-write, so that
+                processes loading the same file share its pages. Defaults to True.
+
+        Returns:
+            Model: The model.
+        """
+
+        from . import snapshot
+
+        return snapshot.load(path, cls(), mmap)
+
+    def solve(self, solver="simplex", warm_start=True, presolve=True, **kwargs):
         """
         Solves the model.
 
+        The final simplex basis is cached on the model, and by default the
+        next solve starts from it, so re-solving after a small change of the
+        objective or the right-hand side takes only a few pivots. A cached
+        basis that is still dual feasible is re-optimized with the dual
+        Simplex method by either simplex solver.
+
+        By default the model is presolved first: fixed variables, empty,
+        singleton and duplicate rows and dominated columns are removed, and
+        the solution of the reduced problem is mapped back to the variables
+        and constraints of the model.
+
         Args:
-            solver (str): The solver to use. Defaults to "simplex".
+            solver (str): The name of a registered solver: "simplex",
+                "dual-simplex", "interior-point" or one added by register_solver
+                or an "optizenith.solvers" entry point. Variable bounds, ranged constraints and the
+                objective sense are handled natively by every solver.
+                Defaults to "simplex".
+            warm_start (bool | Basis): The basis to start from, True to use the
+                basis of the previous solve or False to start from the slack
+                basis. Defaults to True.
+            presolve (bool): Whether to presolve the model. Defaults to True.
+            **kwargs: Additional keyword arguments to pass to the solver, e.g.
+                `callbacks` to follow the iterations, `verbose=True` to print them
+                or `log=True` to log them as JSON records, `time_limit` in
+                seconds and a CancellationToken as `cancel` to stop it early, or
+                a SolveCache as `cache` to answer repeated solves from.
+
+        Returns:
+            Solution: The objective value, the values of the variables and the
+                slacks, the duals of the constraints, the reduced costs z = A^T y - c
+                of the variables, the final basis, the number of rows, columns and
+                nonzeros removed by presolve, the iteration count, the solve time
+                and the profile with the time spent in each phase, including the
+                assembly of the matrix form. Values are looked up by variable, by name or by position,
+                e.g. result[x] or result["x1"].
+        """
+
+        form, warm_start, assembled = self._prepare_solve(warm_start)
+        result = solve_matrix_form(form, solver, warm_start, presolve, self._variable_store.names.copy(), **kwargs)
+        return self._finish_solve(result, assembled)
+
+    async def solve_async(self, solver="simplex", warm_start=True, presolve=True, executor=None, cancel=None,
+                          limiter=None, **kwargs):
+        """
+        Solves the model in an executor without blocking the event loop.
+
+        The matrix form is assembled on the calling thread, so the model may
+        be changed again as soon as the solve has started. The solve waits
+        for a slot of the limiter and then runs in the executor; the solver
+        checks the cancellation token and the `time_limit` once per
+        iteration and, when either stops it, returns the point and the basis
+        it has reached with the status "cancelled" or "time_limit". The basis
+        is cached on the model as by solve, so a later solve continues from
+        it. Cancelling the awaiting task cancels the token and waits for the
+        solver to stop, caching the basis it reached, before re-raising
+        asyncio.CancelledError. Only solves
+        running in threads see a token cancelled after they started; a
+        process pool receives a copy of it.
+
+        Args:
+            solver (str): The name of a registered solver, as for solve.
+                Defaults to "simplex".
+            warm_start (bool | Basis): The basis to start from, as for solve.
+                Defaults to True.
+            presolve (bool): Whether to presolve the model. Defaults to True.
+            executor (concurrent.futures.Executor): The executor to run the solve
+                in. Defaults to the default executor of the event loop.
+            cancel (CancellationToken): A token to stop the solve with. Defaults
+                to a new token.
+            limiter (SolveLimiter): Bounds the solves running at a time. Defaults
+                to a limiter shared by all models, with one slot per CPU.
+            **kwargs: Additional keyword arguments to pass to the solver, e.g.
+                `time_limit` in seconds.
+
+        Returns:
+            Solution: The solution, as returned by solve.
+        """
+        import asyncio
+        from .batch import default_limiter
+        from ..solvers.cancellation import CancellationToken
+
+        cancel = cancel if cancel is not None else CancellationToken()
+        limiter = limiter if limiter is not None else default_limiter
+        form, warm_start, assembled = self._prepare_solve(warm_start)
+        task = partial(solve_matrix_form, form, solver, warm_start, presolve, self._variable_store.names.copy(),
+                       cancel=cancel, **kwargs)
+        async with limiter:
+            future = asyncio.get_running_loop().run_in_executor(executor, task)
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                cancel.cancel()
+                await asyncio.wait([future])
+                if not future.cancelled() and future.exception() is None:
+                    self._finish_solve(future.result(), assembled)
+                raise
+        return self._finish_solve(result, assembled)
+
+    def _prepare_solve(self, warm_start):
+        """
+        Resolves the warm start of a solve and assembles the matrix form.
+
+        Returns:
+            tuple[MatrixForm, Basis, float]: The matrix form, the basis to start
+                from or None and the seconds spent assembling the form.
+        """
+        if warm_start is True:
+            warm_start = self._basis
+        elif warm_start is False:
+            warm_start = None
+
+        started = time.perf_counter()
+        form = self.to_matrix_form()
+        return form, warm_start, time.perf_counter() - started
+
+    def _finish_solve(self, result: Solution, assembled: float) -> Solution:
+        """
+        Records the assembly time in the profile of a solve and caches its basis.
+        """
+        if result.profile is not None:
+            result.profile.timings["assembly"] = assembled
+        if result.basis is not None:
+            self._basis = result.basis
+        return result
+
+    def solve_batch(self, rhs=None, costs=None, warm_start=True, **kwargs):
+        """
+        Solves a family of problems that share the constraints of the model
+        but differ in the right-hand side, the objective or both.
+
+        The instances are solved together by the BatchSimplexSolver, which
+        pivots only for instances that no earlier optimal basis fits. The
+        model is not presolved, since presolve depends on the right-hand
+        side. The last optimal basis is cached on the model.
+
+        Args:
+            rhs (np.ndarray): A k x m array with one right-hand side per row, or
+                None to use the right-hand side of the model for every instance.
+            costs (np.ndarray): A k x n array with one objective per row, or None
+                to use the objective of the model for every instance.
+            warm_start (bool | Basis): The basis to start from, as for solve.
+                Defaults to True.
             **kwargs: Additional keyword arguments to pass to the solver.
 
         Returns:
-            namedtuple[obj (float), sol (dict)]: A namedtuple with the objective value and the solution.
+            namedtuple[objectives (np.ndarray), solutions (np.ndarray)]: The k
+                objective values, NaN where an instance is infeasible or unbounded
+                or was stopped by a limit, and a k x (n + m) array with the values of the variables followed
+                by the slacks.
         """
 
-        if solver.lower() == "simplex":
-            solver_instance = SimplexSolver(self, **kwargs)
-        elif solver.lower() == "interior-point":
-            raise NotImplementedError("Interior-point solver is not implemented yet. Will hopefully be so in the future.")
-            solver_instance = InteriorPointSolver(self, **kwargs)
-        else:
-            raise ValueError(f"Unknown solver: {solver}")
+        if warm_start is True:
+            warm_start = self._basis
+        elif warm_start is False:
+            warm_start = None
+
+        from ..solvers.batch_simplex import BatchSimplexSolver
+
+        solver = BatchSimplexSolver(self.to_matrix_form(), rhs, costs, warm_start=warm_start, **kwargs)
+        objectives, solutions = solver.solve()
+        if solver.basis is not None:
+            self._basis = solver.basis
+        return BatchSolution(objectives, solutions)
+
+    def _solved_simplex(self, **kwargs) -> "DualSimplexSolver":
+        """
+        Solves the model without presolve with the DualSimplexSolver, starting
+        from the cached basis, so that the factorization of the final basis is
+        available for sensitivity analysis.
+        """
+        from ..solvers.dual_simplex import DualSimplexSolver
+
+        solver = DualSimplexSolver(self.to_matrix_form(), warm_start=self._basis, **kwargs)
+        solver.solve()
+        self._basis = solver.basis
+        return solver
+
+    def sensitivity(self, **kwargs):
+        """
+        Computes the duals, the reduced costs and the ranges of the right-hand
+        sides and the objective coefficients over which the optimal basis
+        stays optimal. Starting from the cached basis, the model is usually
+        solved again without any pivots.
+
+        Args:
+            **kwargs: Additional keyword arguments to pass to the solver.
+
+        Returns:
+            namedtuple[duals, reduced_costs, rhs_lower, rhs_upper, cost_lower, cost_upper]:
+                The duals and right-hand side ranges of the constraints, and the
+                reduced costs and objective coefficient ranges of the variables.
+        """
+
+        return self._solved_simplex(**kwargs).sensitivity()
+
+    def parametric_solve(self, direction, t_range=(0.0, 1.0), target="rhs", **kwargs):
+        """
+        Solves the model for the right-hand side b + t * direction, or the
+        objective coefficients c + t * direction, over a range of t with one
+        sequence of pivots from the optimal basis.
+
+        Args:
+            direction (np.ndarray): One entry per constraint for "rhs" or one per
+                variable for "objective".
+            t_range (Tuple[float, float]): The start and the end of the sweep.
+                Defaults to (0.0, 1.0).
+            target (str): "rhs" or "objective". Defaults to "rhs".
+            **kwargs: Additional keyword arguments to pass to the solver.
+
+        Returns:
+            namedtuple[t, objectives, solutions]: The breakpoints of the optimal
+                value, which is linear in t between them, with the optimal values
+                and solutions there.
+        """
 
-        obj, sol = solver_instance.solve()
-        Solution = namedtuple("Solution", ["objective", "solution"])
-        return Solution(obj, sol)
+        return self._solved_simplex(**kwargs).parametric_solve(direction, t_range, target)
 
     def __str__(self) -> str:
         """
@@ -111,11 +850,11 @@ class Model:
         """
 
         model_str = f"Model: {self.name}\n"
-        model_str += f"Variables:\n"
+        model_str += "Variables:\n"
         for variable in self.variables:
             model_str += f"\t{str(variable)}\n"
         model_str += f"Objective: {str(self.objective)}\n"
-        model_str += f"Constraints:\n"
+        model_str += "Constraints:\n"
         for constraint in self.constraints:
             model_str += f"\t{str(constraint)}\n"
         return model_str
@@ -0,0 +1,365 @@
+import numpy as np
+import scipy.sparse as sp
+from collections import namedtuple
+from typing import Optional
+
+from .matrix_form import MatrixForm
+from ..solvers.basis import Basis
+from ..solvers.solution import Solution
+
+PresolveReport = namedtuple("PresolveReport", ["rows", "columns", "nonzeros"])
+
+
+class Presolve:
+    """
+    Reduces the matrix form of a model before it is solved and maps the
+    solution of the reduced problem back to the original one.
+
+    The reductions are repeated until none applies:
+
+    - fixed variables (lb == ub) are substituted into the right-hand side
+      and the objective constant,
+    - empty rows are dropped after checking that they are satisfied,
+    - singleton rows a_ij x_j <= b_i are turned into bounds on x_j,
+    - duplicate rows, which are multiples of each other, are merged, into
+      a ranged row if need be, and
+    - dominated columns, whose increase cannot improve the objective and
+      only tightens the constraints, are fixed at their lower bound (and
+      the converse at a finite upper bound).
+
+    Rows are handled as intervals lo_i <= a_i x <= hi_i. The reduced form
+    keeps the bounds of the remaining variables, which the solvers handle
+    as they are, so it never has more rows or columns than the original.
+
+    Attributes:
+        form (MatrixForm): The reduced matrix form.
+        report (PresolveReport): The number of rows, columns and nonzeros removed
+            by the reductions.
+    """
+
+    def __init__(self, form: MatrixForm, tolerance: float = 1e-9, max_passes: int = 20):
+        """
+        Presolves a matrix form.
+
+        Args:
+            form (MatrixForm): The matrix form of the model.
+            tolerance (float): The tolerance used to compare bounds and coefficients.
+            max_passes (int): The maximum number of passes over the reductions.
+
+        Raises:
+            ValueError: If the reductions show that the problem is infeasible.
+        """
+        self._original = form
+        self._tolerance = tolerance
+        m, n = form.shape
+        self._A = form.A.tocsr()
+        self._A.sum_duplicates()
+        self._A.sort_indices()
+        self._csc = self._A.tocsc()
+        self._c = form.c.astype(float).copy()
+        self._sign = -1.0 if form.sense == "min" else 1.0
+        self._row_lo, self._row_hi = form.row_bounds()
+        self._lb = form.lb.astype(float).copy()
+        self._ub = form.ub.astype(float).copy()
+        self._constant = form.objective_constant
+        self._row_alive = np.ones(m, dtype=bool)
+        self._col_alive = np.ones(n, dtype=bool)
+        self._value = np.full(n, np.nan)
+        # The singleton rows turned into bounds and the merged rows, in order
+        self._removed = []
+
+        for _ in range(max_passes):
+            changed = self._fix_columns()
+            changed |= self._remove_empty_rows()
+            changed |= self._remove_singleton_rows()
+            changed |= self._fix_columns()
+            changed |= self._merge_duplicate_rows()
+            changed |= self._fix_dominated_columns()
+            if not changed:
+                break
+
+        self.form = self._reduced_form()
+        self.report = PresolveReport(m - len(self._rows), n - len(self._columns),
+                                     self._A.nnz - self._active().nnz)
+
+    def _active(self) -> sp.csr_matrix:
+        """
+        Returns the constraint matrix restricted to the remaining rows and
+        columns, with the dimensions of the original matrix.
+        """
+        active = sp.diags(self._row_alive.astype(float)) @ self._A @ sp.diags(self._col_alive.astype(float))
+        active = sp.csr_matrix(active)
+        active.eliminate_zeros()
+        active.sort_indices()
+        return active
+
+    def _fix(self, j: int, value: float) -> None:
+        start, stop = self._csc.indptr[j], self._csc.indptr[j + 1]
+        shift = self._csc.data[start:stop] * value
+        self._row_lo[self._csc.indices[start:stop]] -= shift
+        self._row_hi[self._csc.indices[start:stop]] -= shift
+        self._constant += self._c[j] * value
+        self._value[j] = value
+        self._col_alive[j] = False
+
+    def _fix_columns(self) -> bool:
+        """
+        Substitutes the variables with equal bounds.
+        """
+        fixed = np.flatnonzero(self._col_alive & (self._ub - self._lb <= self._tolerance))
+        for j in fixed:
+            if self._lb[j] > self._ub[j] + self._tolerance:
+                raise ValueError("The problem is infeasible.")
+            self._fix(j, self._lb[j])
+        return len(fixed) > 0
+
+    def _remove_empty_rows(self) -> bool:
+        """
+        Removes the rows without coefficients, which must hold for x = 0.
+        """
+        counts = np.diff(self._active().indptr)
+        empty = np.flatnonzero(self._row_alive & (counts == 0))
+        if np.any(self._row_lo[empty] > self._tolerance) or np.any(self._row_hi[empty] < -self._tolerance):
+            raise ValueError("The problem is infeasible.")
+        self._row_alive[empty] = False
+        return len(empty) > 0
+
+    def _remove_singleton_rows(self) -> bool:
+        """
+        Turns the rows with a single coefficient into bounds on its variable.
+        """
+        active = self._active()
+        singletons = np.flatnonzero(self._row_alive & (np.diff(active.indptr) == 1))
+        for i in singletons:
+            j = active.indices[active.indptr[i]]
+            a = active.data[active.indptr[i]]
+            lo, hi = self._row_lo[i] / a, self._row_hi[i] / a
+            if a < 0:
+                lo, hi = hi, lo
+            lower, upper = lo > self._lb[j], hi < self._ub[j]
+            if lower:
+                self._lb[j] = lo
+            if upper:
+                self._ub[j] = hi
+            if lower or upper:
+                self._removed.append(("singleton", i, j, lower, upper))
+            if self._lb[j] > self._ub[j] + self._tolerance:
+                raise ValueError("The problem is infeasible.")
+        self._row_alive[singletons] = False
+        return len(singletons) > 0
+
+    def _merge_duplicate_rows(self) -> bool:
+        """
+        Merges rows that are multiples of each other into one row. Candidates
+        are grouped by two random projections of the rows scaled by their
+        first coefficient and then compared exactly.
+        """
+        active = self._active()
+        counts = np.diff(active.indptr)
+        rows = np.flatnonzero(self._row_alive & (counts >= 2))
+        if len(rows) < 2:
+            return False
+        first = active.data[active.indptr[rows]]
+        normalized = sp.csr_matrix(sp.diags(1 / first) @ active[rows])
+        normalized.sort_indices()
+        rng = np.random.default_rng(0)
+        projections = normalized @ rng.uniform(1, 2, (active.shape[1], 2))
+        keys = np.column_stack([np.round(projections, 8), counts[rows]])
+        _, group, group_sizes = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+        group = group.ravel()
+
+        changed = False
+        for g in np.flatnonzero(group_sizes > 1):
+            members = np.flatnonzero(group == g)
+            kept = members[0]
+            kept_row = normalized[kept]
+            for member in members[1:]:
+                row = normalized[member]
+                if (not np.array_equal(row.indices, kept_row.indices)
+                        or not np.allclose(row.data, kept_row.data, rtol=0, atol=self._tolerance)):
+                    continue
+                changed |= self._merge(rows[kept], rows[member], first[member] / first[kept])
+        return changed
+
+    def _merge(self, i: int, k: int, ratio: float) -> bool:
+        """
+        Merges row k = ratio * row i into row i, intersecting their intervals.
+        """
+        lo, hi = self._row_lo[i], self._row_hi[i]
+        lo_k, hi_k = self._row_lo[k] / ratio, self._row_hi[k] / ratio
+        if ratio < 0:
+            lo_k, hi_k = hi_k, lo_k
+        lower_owner = k if lo_k > lo else i
+        upper_owner = k if hi_k < hi else i
+        lo, hi = max(lo, lo_k), min(hi, hi_k)
+        if lo > hi + self._tolerance:
+            raise ValueError("The problem is infeasible.")
+        self._row_lo[i], self._row_hi[i] = (hi, hi) if hi - lo <= self._tolerance else (lo, hi)
+        self._row_alive[k] = False
+        self._removed.append(("merge", i, k, ratio, lower_owner, upper_owner))
+        return True
+
+    def _fix_dominated_columns(self) -> bool:
+        """
+        Fixes the variables whose every coefficient tightens its row when the
+        variable increases and whose objective coefficient does not favor an
+        increase at their lower bound, and the converse at their upper bound.
+        """
+        active = self._active().tocsc()
+        only_upper = np.isinf(self._row_lo) & np.isfinite(self._row_hi)
+        only_lower = np.isfinite(self._row_lo) & np.isinf(self._row_hi)
+        direction = np.select([only_upper, only_lower], [1.0, -1.0], 0.0)
+        signed = direction[active.indices] * active.data
+        columns = np.repeat(np.arange(active.shape[1]), np.diff(active.indptr))
+        n = active.shape[1]
+        not_tightening = np.bincount(columns, weights=(signed <= 0), minlength=n)
+        not_relaxing = np.bincount(columns, weights=(signed >= 0), minlength=n)
+
+        c = self._sign * self._c
+        at_lower = np.flatnonzero(self._col_alive & (not_tightening == 0) & (c <= 0)
+                                  & np.isfinite(self._lb))
+        for j in at_lower:
+            self._fix(j, self._lb[j])
+        at_upper = np.flatnonzero(self._col_alive & (not_relaxing == 0) & (c >= 0)
+                                  & np.isfinite(self._ub))
+        for j in at_upper:
+            self._fix(j, self._ub[j])
+        return len(at_lower) + len(at_upper) > 0
+
+    def _reduced_form(self) -> MatrixForm:
+        """
+        Assembles the reduced problem from the remaining rows and columns,
+        with rows written back as "<=", ">=", "=" or ranged rows.
+        """
+        self._rows = np.flatnonzero(self._row_alive)
+        self._columns = np.flatnonzero(self._col_alive)
+        A = self._A[self._rows][:, self._columns].tocsc()
+        lo, hi = self._row_lo[self._rows], self._row_hi[self._rows]
+        equality = lo == hi
+        senses = np.where(equality, "=", np.where(np.isfinite(hi), "<=", ">=")).astype(object)
+        b = np.where(np.isfinite(hi), hi, lo)
+        ranges = np.where(np.isfinite(lo) & np.isfinite(hi) & ~equality, hi - lo, np.inf)
+        return MatrixForm(A, b, self._c[self._columns], self._constant, senses,
+                          self._lb[self._columns], self._ub[self._columns], sense=self._original.sense,
+                          ranges=ranges if np.isfinite(ranges).any() else None)
+
+    def postsolve(self, x: np.ndarray) -> np.ndarray:
+        """
+        Maps the values of the variables of the reduced problem back to the
+        variables of the original problem.
+
+        Args:
+            x (np.ndarray): The values of the variables of the reduced problem.
+
+        Returns:
+            np.ndarray: The values of the original variables.
+        """
+        values = self._value.copy()
+        values[self._columns] = x[:len(self._columns)]
+        return values
+
+    def postsolve_solution(self, solution: Solution) -> Solution:
+        """
+        Maps a solution of the reduced problem back to the variables and
+        slacks of the original problem, together with its duals, reduced
+        costs and basis.
+
+        Args:
+            solution (Solution): The solution of the reduced problem.
+
+        Returns:
+            Solution: The solution of the original problem.
+        """
+        x = self.postsolve(solution.x)
+        slacks = self._original.b - self._original.A @ x
+        slacks[self._original.senses == ">="] *= -1
+        slacks[(self._original.senses == "=") | (self._original.senses == "==")] = 0
+        duals = reduced_costs = None
+        if solution.duals is not None:
+            duals = self.postsolve_dual(solution.duals, x)
+            reduced_costs = self._original.A.T @ duals - self._original.c
+        return Solution(solution.objective, x, slacks, duals, reduced_costs, solution.status,
+                        solution.iterations, solution.time, self.postsolve_basis(solution.basis), self.report,
+                        profile=solution.profile)
+
+    def postsolve_dual(self, y: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Maps the duals of the rows of the reduced problem back to the rows
+        of the original problem, with the convention z = A^T y - c of the solvers.
+
+        The reductions are undone in reverse order. The dual of a merged row
+        goes to the original row that owns its active bound, which is the
+        upper bound if the dual is positive for a maximization or negative
+        for a minimization. A singleton row that was turned into a bound gets
+        the dual that makes the reduced cost of its variable zero if that
+        reduced cost asks for the bound the row gave and the variable is
+        not at the same bound of its own. All other removed rows have a
+        zero dual.
+
+        Args:
+            y (np.ndarray): The duals of the reduced problem.
+            x (np.ndarray): The values of the original variables, as returned by postsolve.
+
+        Returns:
+            np.ndarray: The duals of the original rows.
+        """
+        A = self._original.A.tocsc()
+        full = np.zeros(A.shape[0])
+        full[self._rows] = y[:len(self._rows)]
+        lb, ub = self._original.lb, self._original.ub
+        tolerance = 1e-7 * (1 + np.abs(x))
+        for removal in reversed(self._removed):
+            if removal[0] == "merge":
+                _, i, k, ratio, lower_owner, upper_owner = removal
+                owner = upper_owner if self._sign * full[i] > 0 else lower_owner
+                if owner == k:
+                    full[k] = full[i] / ratio
+                    full[i] = 0
+                continue
+
+            # A reduced cost of the objective's sign holds the variable at a
+            # lower bound, one of the opposite sign at an upper bound
+            _, i, j, lower, upper = removal
+            z = (A[:, [j]].T @ full)[0] - self._original.c[j]
+            if self._sign * z > 0:
+                active = lower and abs(x[j] - lb[j]) > tolerance[j]
+            else:
+                active = upper and abs(x[j] - ub[j]) > tolerance[j]
+            if active:
+                full[i] -= z / A[i, j]
+        return full
+
+    def presolve_basis(self, basis: Optional[Basis]) -> Optional[Basis]:
+        """
+        Restricts a basis of the original problem to the reduced problem.
+
+        Args:
+            basis (Basis): A basis of the original problem.
+
+        Returns:
+            Basis: The basis of the reduced problem.
+        """
+        if basis is None:
+            return None
+        m, n = self._original.shape
+        status = basis.status(n, m)
+        return Basis(status[self._columns], status[n + self._rows])
+
+    def postsolve_basis(self, basis: Optional[Basis]) -> Optional[Basis]:
+        """
+        Extends a basis of the reduced problem to the original problem, where
+        removed variables are nonbasic and removed rows have a basic slack.
+
+        Args:
+            basis (Basis): A basis of the reduced problem.
+
+        Returns:
+            Basis: The basis of the original problem.
+        """
+        if basis is None:
+            return None
+        m, n = self._original.shape
+        status = Basis(np.zeros(0), np.zeros(0)).status(n, m)
+        status[self._columns] = basis.variable_status[:len(self._columns)]
+        status[n + self._rows] = basis.constraint_status[:len(self._rows)]
+        return Basis(status[:n], status[n:])
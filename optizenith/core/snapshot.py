@@ -0,0 +1,143 @@
+import os
+import json
+
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from .constraint import Constraint
+from .linear_expr import LinearExpr
+from .objective import Objective
+
+MAGIC = b"OZSNAP01"
+ALIGNMENT = 64
+SENSES = np.array(["<=", ">=", "="], dtype=object)
+SENSE_CODES = {"<=": 0, ">=": 1, "=": 2, "==": 2}
+
+
+def _encode_names(names: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Joins names into one NUL-separated UTF-8 buffer, with None as the empty string.
+    """
+    return np.frombuffer("\0".join("" if name is None else name for name in names).encode(), dtype=np.uint8)
+
+
+def _decode_names(buffer: np.ndarray, count: int) -> np.ndarray:
+    names = np.empty(count, dtype=object)
+    if count:
+        names[:] = buffer.tobytes().decode().split("\0")
+        names[names == ""] = None
+    return names
+
+
+def save(model: "Model", path) -> None:
+    """
+    Writes a model to a binary snapshot.
+
+    The snapshot holds the assembled matrix form of the model, with A as
+    CSR arrays, together with the variable types and the names of the
+    variables and constraints. A JSON header describes the arrays, which
+    follow it uncompressed at 64-byte aligned offsets so that they can be
+    memory-mapped in place.
+
+    Args:
+        model (Model): The model to save.
+        path (str | os.PathLike): The path of the file.
+    """
+    form = model.to_matrix_form()
+    store = model._variable_store
+    arrays = {
+        "indptr": form.A.indptr.astype(np.int64),
+        "indices": form.A.indices.astype(np.int64),
+        "data": form.A.data,
+        "b": form.b,
+        "ranges": np.full(form.shape[0], np.inf) if form.ranges is None else form.ranges,
+        "senses": np.fromiter((SENSE_CODES[sense] for sense in form.senses), dtype=np.int8, count=len(form.senses)),
+        "c": form.c,
+        "lb": form.lb,
+        "ub": form.ub,
+        "vtype": store.vtype,
+        "variable_names": _encode_names(store.names),
+        "constraint_names": _encode_names(constraint.name for constraint in model.constraints),
+    }
+
+    layout: Dict[str, dict] = {}
+    offset = 0
+    for key, array in arrays.items():
+        layout[key] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    header = json.dumps({
+        "name": model.name,
+        "shape": list(form.shape),
+        "sense": model.objective.sense if model.objective is not None else None,
+        "objective_constant": float(form.objective_constant),
+        "arrays": layout,
+    }).encode()
+    start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(len(header).to_bytes(8, "little"))
+        file.write(header)
+        for key, array in arrays.items():
+            file.seek(start + layout[key]["offset"])
+            file.write(np.ascontiguousarray(array).tobytes())
+        file.truncate(start + offset)
+
+
+def load(path, model: "Model", mmap: bool = True) -> "Model":
+    """
+    Reads a binary snapshot into an empty model.
+
+    With mmap, the numeric arrays are memory-mapped copy-on-write: pages are
+    read from the file on first access and shared between all processes that
+    load the same file, and changes to the model stay private to the process
+    and are never written back. Only the names and the constraint handles
+    are built in memory.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+        model (Model): The empty model to load into.
+        mmap (bool): Whether to memory-map the arrays rather than read them. Defaults to True.
+
+    Returns:
+        Model: The model.
+
+    Raises:
+        ValueError: If the file is not a snapshot or the model is not empty.
+    """
+    if len(model.variables) or model.constraints:
+        raise ValueError("Snapshots can only be loaded into an empty model")
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a model snapshot")
+        header = json.loads(file.read(int.from_bytes(file.read(8), "little")))
+        start = -(-file.tell() // ALIGNMENT) * ALIGNMENT
+        size = file.seek(0, os.SEEK_END) - start
+        if not mmap or size == 0:
+            file.seek(start)
+            buffer = np.frombuffer(bytearray(file.read()), dtype=np.uint8)
+    if mmap and size > 0:
+        buffer = np.memmap(path, dtype=np.uint8, mode="c", offset=start)
+
+    arrays = {}
+    for key, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"]))
+        arrays[key] = buffer[entry["offset"]:entry["offset"] + count * dtype.itemsize].view(dtype)
+
+    m, n = header["shape"]
+    model.name = header["name"]
+    model._variable_store.adopt(arrays["lb"], arrays["ub"], arrays["vtype"],
+                                _decode_names(arrays["variable_names"], n))
+    store = model._constraint_store
+    store.adopt(arrays["indptr"], arrays["indices"], arrays["data"], SENSES[arrays["senses"]], arrays["b"],
+                _decode_names(arrays["constraint_names"], m), arrays.get("ranges"))
+    model.constraints = Constraint._handles(store, 0, m)
+    model._synced = list(model.constraints)
+
+    if header["sense"] is not None:
+        columns = np.flatnonzero(arrays["c"])
+        expression = LinearExpr.from_arrays(columns, arrays["c"][columns], model)
+        expression.constant = header["objective_constant"]
+        model.objective = Objective(expression, header["sense"])
+    return model
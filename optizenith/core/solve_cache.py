@@ -0,0 +1,200 @@
+import copy
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict, namedtuple
+from typing import Optional, Tuple
+
+from .matrix_form import MatrixForm
+from ..solvers.basis import Basis
+from ..solvers.solution import Solution
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "warm_starts", "evictions", "entries", "nbytes"])
+
+# Options that only observe or interrupt a solve and do not change its result
+_UNKEYED_OPTIONS = frozenset({"callbacks", "verbose", "log", "cancel", "time_limit", "workers", "log_interval"})
+
+# A cached solution, the structure it belongs to, the values of the problem
+# for finding the nearest one and the bytes it takes
+_Entry = namedtuple("_Entry", ["solution", "structure", "values", "nbytes"])
+
+
+def _canonical_matrix(form: MatrixForm):
+    A = form.A
+    if not A.has_canonical_format:
+        A = A.copy()
+        A.sum_duplicates()
+    return A
+
+
+def _values(form: MatrixForm, A) -> np.ndarray:
+    """
+    Collects the numbers of a problem that are not part of its structure,
+    with infinite bounds as 0, for measuring how far apart two problems are.
+    """
+    bounds = np.concatenate([form.lb, form.ub]).astype(float)
+    bounds[~np.isfinite(bounds)] = 0
+    return np.concatenate([A.data, form.b, form.c, bounds]).astype(float)
+
+
+def _nbytes(solution: Solution) -> int:
+    arrays = [solution.x, solution.slacks, solution.duals, solution.reduced_costs]
+    if solution.basis is not None:
+        arrays += [solution.basis.variable_status, solution.basis.constraint_status]
+    return sum(array.nbytes for array in arrays if array is not None)
+
+
+class SolveCache:
+    """
+    Caches the solutions of solves by the content of the problem.
+
+    A solve is identified by a hash of the canonical matrix form of the
+    model, i.e. the CSR arrays of A, b, c, the senses, bounds, ranges and
+    integer variables and the objective sense, together with the solver,
+    presolve and the solver options that affect the result. Solving a
+    problem that was solved before returns a copy of the cached Solution
+    without running the solver. A problem that is not cached but has the
+    same structure as cached ones, that is the same shape, sparsity
+    pattern, senses and integer variables, starts from the basis of the
+    one whose coefficients, right-hand side, objective and bounds are
+    nearest, unless a warm start is given.
+
+    Only solves that finished with the status "optimal" are cached, never
+    those stopped by the iteration or time limit or cancelled. The
+    entries are evicted least recently used first once the arrays they
+    hold take more than `max_bytes`. A cache can be shared by the threads
+    of an executor, but not by worker processes.
+
+    Attributes:
+        max_bytes (int): The memory budget of the cached arrays in bytes.
+        hits (int): The number of solves answered from the cache.
+        misses (int): The number of solves that ran the solver.
+        warm_starts (int): The number of misses started from a cached basis.
+        evictions (int): The number of entries evicted to stay within the budget.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2 ** 20):
+        """
+        Initializes a new SolveCache instance.
+
+        Args:
+            max_bytes (int): The memory budget of the cached arrays in bytes.
+                Defaults to 64 MiB.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, form: MatrixForm, solver: str = "simplex", presolve: bool = True,
+            **options) -> Tuple[str, str]:
+        """
+        Hashes a solve.
+
+        Args:
+            form (MatrixForm): The matrix form of the problem.
+            solver (str): The name of the solver. Defaults to "simplex".
+            presolve (bool): Whether the problem is presolved. Defaults to True.
+            **options: The solver options.
+
+        Returns:
+            tuple[str, str]: The key of the solve and the key of the structure
+                of the problem.
+        """
+        A = _canonical_matrix(form)
+        senses = form.senses
+        codes = (senses == ">=").astype(np.int8) + 2 * ((senses == "=") | (senses == "==")).astype(np.int8)
+        structure = hashlib.blake2b(digest_size=16)
+        structure.update(np.array(A.shape, dtype=np.int64).tobytes())
+        structure.update(A.indptr.astype(np.int64).tobytes())
+        structure.update(A.indices.astype(np.int64).tobytes())
+        structure.update(codes.tobytes())
+        if form.integer is not None:
+            structure.update(np.flatnonzero(form.integer).astype(np.int64).tobytes())
+        structure.update(form.sense.encode())
+
+        solve = structure.copy()
+        for array in (A.data, form.b, form.c, form.lb, form.ub):
+            solve.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        if form.ranges is not None:
+            solve.update(np.ascontiguousarray(form.ranges, dtype=float).tobytes())
+        keyed = sorted((name, value) for name, value in options.items() if name not in _UNKEYED_OPTIONS)
+        solve.update(repr((float(form.objective_constant), solver, bool(presolve), keyed)).encode())
+        return solve.hexdigest(), structure.hexdigest()
+
+    def _lookup(self, form: MatrixForm, solver: str, presolve: bool, options: dict,
+                nearest: bool = True) -> Tuple[tuple, Optional[Solution], Optional[Basis]]:
+        """
+        Looks up a solve.
+
+        Returns:
+            tuple: The keys of the solve, to store its solution under, a copy of
+                the cached solution or None, and else, if `nearest` is set, the
+                basis of the nearest problem of the same structure or None.
+        """
+        key, structure = self.key(form, solver, presolve, **options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return (key, structure), copy.deepcopy(entry.solution), None
+            self.misses += 1
+            candidates = [entry for entry in self._entries.values() if nearest
+                          and entry.structure == structure and entry.solution.basis is not None]
+        if not candidates:
+            return (key, structure), None, None
+        values = _values(form, _canonical_matrix(form))
+        nearest = min(candidates, key=lambda entry: np.linalg.norm(entry.values - values))
+        with self._lock:
+            self.warm_starts += 1
+        return (key, structure), None, nearest.solution.basis
+
+    def _store(self, keys: tuple, form: MatrixForm, solution: Solution) -> None:
+        """
+        Caches the solution of a solve that finished optimal, evicting the
+        least recently used entries beyond the memory budget.
+        """
+        if solution.status != "optimal":
+            return
+        key, structure = keys
+        values = _values(form, _canonical_matrix(form))
+        solution = copy.copy(solution)
+        solution.names = None
+        solution._index_of = None
+        entry = _Entry(copy.deepcopy(solution), structure, values, _nbytes(solution) + values.nbytes)
+        if entry.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.warm_starts, self.evictions, len(self._entries), self.nbytes)
+
+    def clear(self) -> None:
+        """
+        Removes all entries. The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (f"SolveCache({len(self._entries)} entries, {self.nbytes} of {self.max_bytes} bytes, "
+                f"{self.hits} hits, {self.misses} misses)")
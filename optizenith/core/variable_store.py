@@ -0,0 +1,150 @@
+import numpy as np
+from typing import Optional, Sequence, Union
+
+VAR_TYPES = ("continuous", "integer")
+
+
+class VariableStore:
+    """
+    Stores the bounds, types and names of a set of variables in contiguous
+    NumPy arrays. Variables are referred to by their index into the arrays.
+
+    Attributes:
+        lb (np.ndarray): The lower bounds of the variables.
+        ub (np.ndarray): The upper bounds of the variables.
+        vtype (np.ndarray): The variable types as indices into VAR_TYPES.
+        names (np.ndarray): The names of the variables, None for unnamed ones.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initializes a new, empty VariableStore instance.
+
+        Args:
+            capacity (int): The number of variables to allocate room for. Defaults to 16.
+        """
+        self._size = 0
+        self._lb = np.zeros(capacity)
+        self._ub = np.zeros(capacity)
+        self._vtype = np.zeros(capacity, dtype=np.int8)
+        self._names = np.empty(capacity, dtype=object)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def lb(self) -> np.ndarray:
+        return self._lb[:self._size]
+
+    @property
+    def ub(self) -> np.ndarray:
+        return self._ub[:self._size]
+
+    @property
+    def vtype(self) -> np.ndarray:
+        return self._vtype[:self._size]
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names[:self._size]
+
+    def name(self, index: int) -> str:
+        """
+        Returns the name of a variable, defaulting to x<index + 1> for unnamed variables.
+
+        Args:
+            index (int): The index of the variable.
+
+        Returns:
+            str: The name of the variable.
+        """
+        name = self._names[index]
+        return f"x{index + 1}" if name is None else name
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._lb)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for attribute in ("_lb", "_ub", "_vtype", "_names"):
+            old = getattr(self, attribute)
+            new = np.zeros(capacity, dtype=old.dtype) if old.dtype != object else np.empty(capacity, dtype=object)
+            new[:self._size] = old[:self._size]
+            setattr(self, attribute, new)
+
+    def adopt(self, lb: np.ndarray, ub: np.ndarray, vtype: np.ndarray, names: np.ndarray) -> None:
+        """
+        Replaces the contents of the store with the given arrays, which are
+        used as they are without copying, e.g. arrays memory-mapped from a
+        snapshot. They are copied once the store grows.
+
+        Args:
+            lb (np.ndarray): The lower bounds of the variables.
+            ub (np.ndarray): The upper bounds of the variables.
+            vtype (np.ndarray): The variable types as indices into VAR_TYPES.
+            names (np.ndarray): The names of the variables, None for unnamed ones.
+        """
+        self._lb, self._ub, self._vtype, self._names = lb, ub, vtype, names
+        self._size = len(lb)
+
+    def append(self, name: Optional[str], lb: float, ub: float, var_type: str) -> int:
+        """
+        Adds a variable to the store.
+
+        Args:
+            name (str): The name of the variable.
+            lb (float): The lower bound of the variable.
+            ub (float): The upper bound of the variable.
+            var_type (str): The type of the variable.
+
+        Returns:
+            int: The index of the new variable.
+        """
+        index = self._size
+        self._reserve(index + 1)
+        self._lb[index] = lb
+        self._ub[index] = ub
+        self._vtype[index] = self.type_code(var_type)
+        self._names[index] = name
+        self._size = index + 1
+        return index
+
+    def extend(self, n: int, lb: Union[float, np.ndarray], ub: Union[float, np.ndarray],
+               var_type: str, names: Optional[Sequence[str]] = None) -> int:
+        """
+        Adds n variables to the store.
+
+        Args:
+            n (int): The number of variables to add.
+            lb (float | np.ndarray): The lower bound(s) of the variables.
+            ub (float | np.ndarray): The upper bound(s) of the variables.
+            var_type (str): The type of the variables.
+            names (Sequence[str]): The names of the variables. Defaults to None.
+
+        Returns:
+            int: The index of the first new variable.
+        """
+        start = self._size
+        stop = start + n
+        self._reserve(stop)
+        self._lb[start:stop] = lb
+        self._ub[start:stop] = ub
+        self._vtype[start:stop] = self.type_code(var_type)
+        if names is not None:
+            self._names[start:stop] = np.fromiter(names, dtype=object, count=n)
+        self._size = stop
+        return start
+
+    @staticmethod
+    def type_code(var_type: str) -> int:
+        """
+        Args:
+            var_type (str): The type of a variable.
+
+        Returns:
+            int: The index of the type in VAR_TYPES.
+        """
+        try:
+            return VAR_TYPES.index(var_type)
+        except ValueError:
+            raise ValueError(f"Unknown variable type: {var_type}") from None
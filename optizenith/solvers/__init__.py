@@ -1,5 +1,28 @@
+import importlib
+
 from .base_solver import BaseSolver
-from .simplex import SimplexSolver
-from .interior_point import InteriorPointSolver
+from .basis import Basis
+from .solution import Solution
+from .cancellation import CancellationToken
+from .instrumentation import SolveEvent, SolveProfile
+from .registry import register_solver, get_solver, available_solvers
+
+__all__ = ["BaseSolver", "Basis", "Solution", "SimplexSolver", "DualSimplexSolver", "InteriorPointSolver",
+           "BatchSimplexSolver", "Sensitivity", "ParametricPath", "SolveEvent", "SolveProfile",
+           "register_solver", "get_solver", "available_solvers", "CancellationToken"]
+
+# The solvers import SciPy, so they are imported on first access
+_LAZY = {
+    "SimplexSolver": ".simplex",
+    "Sensitivity": ".simplex",
+    "ParametricPath": ".simplex",
+    "DualSimplexSolver": ".dual_simplex",
+    "InteriorPointSolver": ".interior_point",
+    "BatchSimplexSolver": ".batch_simplex",
+}
+
 
-__all__ = ["BaseSolver", "SimplexSolver", "InteriorPointSolver"]
+def __getattr__(name: str):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
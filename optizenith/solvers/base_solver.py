@@ -1,17 +1,131 @@
+from .solution import Solution
+from .instrumentation import SolveEvent, SolveProfile, log_event, log_profile, print_event
+
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Callable, Tuple
 
 
 class BaseSolver(ABC):
-    def __init__(self, model: "Model"):
+    """
+    The base class of the solvers. Solvers read the model through its
+    to_matrix_form() method, so a MatrixForm, e.g. a presolved one, can be
+    solved in place of a Model.
+
+    Callables passed as the `callbacks` keyword argument, or added with
+    subscribe(), are called with a SolveEvent after every iteration. With
+    `verbose=True` the iterations are printed as a table, and with `log=True`
+    they are logged as JSON records on the "optizenith.solvers" logger,
+    followed by the profile of the solve. Events are only built when a
+    callback is subscribed. The time spent and the work done in each phase
+    of the solve are always recorded and returned as the `profile` of the
+    Solution.
+
+    A solve stops early after `max_iterations` iterations, at the
+    `time_limit` in seconds, counted from the creation of the solver, or
+    once the CancellationToken passed as `cancel` is cancelled. These are
+    checked once per iteration, and the solve then returns the point and
+    the basis it has reached with the status "iteration_limit",
+    "time_limit" or "cancelled".
+    """
+
+    def __init__(self, model: "Model", **kwargs):
         self.model = model
+        self._max_iterations = kwargs.get("max_iterations", None)
+        self._cancel = kwargs.get("cancel", None)
+        time_limit = kwargs.get("time_limit", None)
+        self._deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.status = "optimal"
+        callbacks = kwargs.get("callbacks", ())
+        self._callbacks = [callbacks] if callable(callbacks) else list(callbacks)
+        if kwargs.get("verbose", False):
+            self._callbacks.append(print_event)
+        self._log = kwargs.get("log", False)
+        if self._log:
+            self._callbacks.append(log_event)
+        self._timings = {}
+        self._counters = {}
 
     @abstractmethod
-    def solve(self) -> Tuple[float, dict]:
+    def solve(self) -> Tuple[float, Solution]:
         """
         Solve the linear programming problem defined by the model.
 
         Returns:
-            Tuple[float, dict]: A tuple containing the optimal value and the optimal solution.
+            Tuple[float, Solution]: A tuple containing the optimal value and the optimal solution.
         """
         pass
+
+    def subscribe(self, callback: Callable[[SolveEvent], None]) -> None:
+        """
+        Adds a callable that is called with a SolveEvent after every iteration.
+
+        Args:
+            callback (Callable[[SolveEvent], None]): The callable.
+        """
+        self._callbacks.append(callback)
+
+    @property
+    def profile(self) -> SolveProfile:
+        """
+        The seconds spent and the counts of the work done in each phase of the last solve.
+        """
+        return SolveProfile(dict(self._timings), dict(self._counters))
+
+    def _interrupted(self) -> bool:
+        """
+        Checks the cancellation token, the time limit and the iteration
+        limit, and sets the status if the solve has to stop. Solvers call it
+        after their optimality test, so that a solve which reaches the
+        optimum in its last allowed iteration is still reported optimal.
+        """
+        if self._cancel is not None and self._cancel.cancelled:
+            self.status = "cancelled"
+        elif self._deadline is not None and time.perf_counter() >= self._deadline:
+            self.status = "time_limit"
+        elif self._max_iterations is not None and self.iterations >= self._max_iterations:
+            self.status = "iteration_limit"
+        else:
+            return False
+        return True
+
+    def _timed(self, phase: str, started: float) -> None:
+        """
+        Adds the time since `started`, a time.perf_counter() value, to a phase.
+        """
+        self._timings[phase] = self._timings.get(phase, 0.0) + time.perf_counter() - started
+
+    def _count(self, counter: str, k: int = 1) -> None:
+        """
+        Adds k to a counter.
+        """
+        self._counters[counter] = self._counters.get(counter, 0) + k
+
+    def _emit(self, phase: str, objective: float, infeasibility: float, entering=None, leaving=None) -> None:
+        """
+        Calls the callbacks with an event for the current iteration. Callers
+        check `self._callbacks` first, so that no event is built unless one
+        is subscribed.
+        """
+        event = SolveEvent(type(self).__name__, phase, self.iterations, float(objective), float(infeasibility),
+                           None if entering is None else int(entering), None if leaving is None else int(leaving))
+        for callback in self._callbacks:
+            callback(event)
+
+    def _result(self, objective: float, n: int, started: float) -> Tuple[float, Solution]:
+        """
+        Packs the `x`, `y`, `z`, `iterations`, `basis` and `status` attributes
+        set by a solve of a problem with n variables into a Solution, together
+        with the profile of the solve, which is logged if `log=True`.
+
+        Args:
+            objective (float): The optimal value.
+            n (int): The number of variables, which precede the slacks in `x`.
+            started (float): The time.perf_counter() value at the start of the solve.
+        """
+        profile = self.profile
+        if self._log:
+            log_profile(type(self).__name__, profile, self.iterations)
+        solution = Solution(objective, self.x[:n], self.x[n:], self.y, self.z[:n], self.status, self.iterations,
+                            time.perf_counter() - started, basis=self.basis, profile=profile)
+        return objective, solution
@@ -0,0 +1,92 @@
+import numpy as np
+
+AT_LOWER = 0
+BASIC = 1
+AT_UPPER = 2
+
+
+class Basis:
+    """
+    The basic/nonbasic status of every variable and constraint of a model,
+    as left by a simplex solve. The status of a constraint is the status of
+    its slack variable. Non-basis variables are at their lower bound, or at
+    zero if they are free, unless their status is AT_UPPER.
+
+    Attributes:
+        variable_status (np.ndarray): The status (BASIC, AT_LOWER or AT_UPPER) of each variable.
+        constraint_status (np.ndarray): The status (BASIC, AT_LOWER or AT_UPPER) of each constraint.
+    """
+
+    def __init__(self, variable_status: np.ndarray, constraint_status: np.ndarray):
+        """
+        Initializes a new Basis instance.
+
+        Args:
+            variable_status (np.ndarray): The status of each variable.
+            constraint_status (np.ndarray): The status of each constraint.
+        """
+        self.variable_status = np.asarray(variable_status, dtype=np.int8)
+        self.constraint_status = np.asarray(constraint_status, dtype=np.int8)
+
+    @classmethod
+    def from_indices(cls, basis: np.ndarray, n: int, m: int, at_upper: np.ndarray = None) -> "Basis":
+        """
+        Creates a basis from the indices of the basis variables.
+
+        Args:
+            basis (np.ndarray): The indices of the basis variables, where the
+                                slack of constraint i has index n + i.
+            n (int): The number of variables.
+            m (int): The number of constraints.
+            at_upper (np.ndarray): A mask of the n + m variables and slacks that
+                are at their upper bound. Defaults to None.
+
+        Returns:
+            Basis: The basis.
+        """
+        status = np.full(n + m, AT_LOWER, dtype=np.int8)
+        if at_upper is not None:
+            status[at_upper] = AT_UPPER
+        status[basis] = BASIC
+        return cls(status[:n], status[n:])
+
+    def status(self, n: int, m: int) -> np.ndarray:
+        """
+        Returns the status of the variables followed by the slacks in a model
+        with n variables and m constraints. Variables added since the basis
+        was computed are at their lower bound, and constraints added since
+        then have a basic slack.
+
+        Args:
+            n (int): The number of variables.
+            m (int): The number of constraints.
+
+        Returns:
+            np.ndarray: The status of each variable and slack.
+        """
+        variable_status = np.full(n, AT_LOWER, dtype=np.int8)
+        constraint_status = np.full(m, BASIC, dtype=np.int8)
+        k = min(n, len(self.variable_status))
+        variable_status[:k] = self.variable_status[:k]
+        k = min(m, len(self.constraint_status))
+        constraint_status[:k] = self.constraint_status[:k]
+        return np.concatenate([variable_status, constraint_status])
+
+    def indices(self, n: int, m: int) -> np.ndarray:
+        """
+        Returns the indices of the basis variables in a model with n variables
+        and m constraints, padded as by status().
+
+        Args:
+            n (int): The number of variables.
+            m (int): The number of constraints.
+
+        Returns:
+            np.ndarray: The indices of the basis variables, where the slack of
+                        constraint i has index n + i.
+        """
+        return np.flatnonzero(self.status(n, m) == BASIC)
+
+    def __repr__(self) -> str:
+        return (f"Basis({int(np.sum(self.variable_status == BASIC))} basic variables, "
+                f"{int(np.sum(self.constraint_status == BASIC))} basic slacks)")
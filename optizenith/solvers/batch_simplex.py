@@ -0,0 +1,143 @@
+from .dual_simplex import DualSimplexSolver
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+class BatchSimplexSolver(DualSimplexSolver):
+    """
+    The BatchSimplexSolver class solves a family of linear programming
+    problems that share the constraint matrix of a model and differ in the
+    right-hand side, the objective function coefficients or both.
+
+    Instances of such a family mostly share a handful of optimal bases.
+    The solver therefore solves one remaining instance with the simplex
+    method, factorizes its optimal basis once and checks all remaining
+    instances against it in one batched solve with the right-hand sides
+    and the objective coefficients as matrix columns: every instance whose
+    basic solution is primal feasible and whose reduced costs are dual
+    feasible is optimal with that basis. Only the instances left over are
+    pivoted individually, each starting from the latest optimal basis.
+
+    Constraints are handled as by the DualSimplexSolver, and it accepts
+    the same keyword arguments. After solving, `bases` holds the distinct
+    optimal bases, `basis_of` the index into `bases` for each instance (-1
+    if it could not be solved) and `individual_solves` the number of
+    instances solved by pivoting.
+    """
+
+    def __init__(self, model: "Model", rhs: Optional[np.ndarray] = None,
+                 costs: Optional[np.ndarray] = None, **kwargs):
+        """
+        Initializes a new BatchSimplexSolver instance.
+
+        Args:
+            model (Model): The linear programming model whose constraint matrix is shared.
+            rhs (np.ndarray): A k x m stack of right-hand side vectors, or None for
+                the right-hand side of the model.
+            costs (np.ndarray): A k x n stack of objective function coefficients,
+                or None for the objective of the model.
+            kwargs (dict): A dictionary of keyword arguments.
+        """
+        super().__init__(model, **kwargs)
+        self._rhs = None if rhs is None else np.atleast_2d(np.asarray(rhs, dtype=float))
+        self._costs = None if costs is None else np.atleast_2d(np.asarray(costs, dtype=float))
+        self.bases = []
+        self.basis_of = None
+        self.individual_solves = 0
+
+    def solve(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solves all instances.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The k optimal values, NaN for infeasible
+                or unbounded instances and for those stopped by a limit or
+                cancelled, and a k x (n + m) array with the values of the variables
+                followed by the slacks, in the order of the positional names of a
+                Solution.
+        """
+        A, b, c, non_basis, basis = self._build_matrices()
+        m = len(basis)
+        n = len(non_basis)
+        R, C = self._stacks(b, c, m, n)
+        k = len(R)
+
+        objectives = np.full(k, np.nan)
+        solutions = np.full((k, n + m), np.nan)
+        self.basis_of = np.full(k, -1)
+        self.bases = []
+        self.individual_solves = 0
+        warm_start = self._warm_start
+        fixed = self._lower == self._upper
+
+        remaining = np.arange(k)
+        while len(remaining) > 0:
+            i = remaining[0]
+            remaining = remaining[1:]
+            self._warm_start = warm_start
+            self.individual_solves += 1
+            try:
+                objectives[i], solutions[i] = self._run_simplex(A, R[i].copy(), C[i], non_basis, basis.copy())
+            except ValueError:
+                continue
+            if self.status != "optimal":
+                # Stopped at a limit or cancelled, so neither the point nor the basis is optimal
+                objectives[i] = np.nan
+                solutions[i] = np.nan
+                continue
+            objectives[i] *= self._sign
+            warm_start = self.basis
+            self.bases.append(self.basis)
+            self.basis_of[i] = len(self.bases) - 1
+            if len(remaining) == 0:
+                break
+
+            # Check the remaining instances against the new basis in one batch,
+            # with the non-basis variables at the same bounds
+            optimal_basis = self.basis.indices(n, m)
+            factor = self._factorize(A, optimal_basis)
+            X_B = factor.ftran(R[remaining].T - (A @ self._value)[:, None])
+            lower = self._lower[optimal_basis][:, None]
+            upper = self._upper[optimal_basis][:, None]
+            primal = np.all((X_B >= lower - self._feasibility_tolerance)
+                            & (X_B <= upper + self._feasibility_tolerance), axis=0)
+            Y = factor.btran(C[remaining][:, optimal_basis].T)
+            Z = A.T @ Y - C[remaining].T
+            Z[optimal_basis] = 0
+            Z[fixed] = 0
+            Z[self._at_upper] *= -1
+            Z[self._free] = -np.abs(Z[self._free])
+            dual = np.all(Z >= -self._tolerance, axis=0)
+
+            optimal = primal & dual
+            solved = remaining[optimal]
+            X = np.tile(self._value, (len(solved), 1))
+            X[:, optimal_basis] = X_B[:, optimal].T
+            solutions[solved] = X
+            objectives[solved] = self._sign * np.einsum("ij,ij->i", C[solved], X)
+            self.basis_of[solved] = len(self.bases) - 1
+            remaining = remaining[~optimal]
+
+        self._warm_start = warm_start
+        return objectives + self._objective_constant, solutions
+
+    def _stacks(self, b: np.ndarray, c: np.ndarray, m: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Broadcasts the stacks of right-hand sides and objective coefficients
+        to the same number of instances and pads the latter with zeros for
+        the slack columns.
+        """
+        R = b[None, :] if self._rhs is None else self._rhs
+        C = c[None, :n] if self._costs is None else self._costs
+        if R.shape[1] != m:
+            raise ValueError(f"Expected right-hand sides of length {m}, got {R.shape[1]}")
+        if C.shape[1] != n:
+            raise ValueError(f"Expected objective coefficients of length {n}, got {C.shape[1]}")
+        k = max(len(R), len(C))
+        if len(R) not in (1, k) or len(C) not in (1, k):
+            raise ValueError("The stacks of right-hand sides and objective coefficients differ in length")
+        R = np.broadcast_to(R, (k, m))
+        C = np.hstack([np.broadcast_to(self._sign * C if self._costs is not None else C, (k, n)),
+                       np.zeros((k, m))])
+        return R, C
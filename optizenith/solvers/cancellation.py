@@ -0,0 +1,39 @@
+import threading
+
+
+class CancellationToken:
+    """
+    Asks a running solve to stop. The solvers check the token, passed as the
+    `cancel` keyword argument, once per iteration and return the point and
+    the basis they have reached with the status "cancelled". The token can
+    be cancelled from any thread, e.g. from an event loop while the solve
+    runs in an executor. A token sent to another process is a copy that
+    only carries whether it was cancelled at the time.
+    """
+
+    def __init__(self, cancelled: bool = False):
+        """
+        Initializes a new CancellationToken instance.
+
+        Args:
+            cancelled (bool): Whether the token starts out cancelled. Defaults to False.
+        """
+        self._event = threading.Event()
+        if cancelled:
+            self._event.set()
+
+    def cancel(self) -> None:
+        """
+        Asks the solves that check the token to stop.
+        """
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def __reduce__(self):
+        return CancellationToken, (self.cancelled,)
+
+    def __repr__(self) -> str:
+        return f"CancellationToken(cancelled={self.cancelled})"
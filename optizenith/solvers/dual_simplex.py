@@ -0,0 +1,41 @@
+from .simplex import SimplexSolver
+
+
+class DualSimplexSolver(SimplexSolver):
+    """
+    The DualSimplexSolver class implements the dual Simplex method for
+    solving linear programming problems.
+
+    Constraints and bounds are handled as by the SimplexSolver: every
+    constraint gets one slack column whose bounds follow the type of the
+    constraint, and no row is duplicated or negated, so the starting slack
+    basis stays an identity up to signs and a Basis from an earlier solve
+    of the same model can be reused as is.
+
+    The solver keeps the basis dual feasible and pivots out primal
+    infeasible basis variables, which makes it the method of choice for
+    re-optimizing after the right-hand side, the bounds or the set of
+    constraints change. A starting basis that is not dual feasible has the
+    objective coefficients of its offending columns shifted until it is,
+    and the primal Simplex method removes the shifts at the end. A start
+    that is already primal feasible is finished by the primal Simplex method.
+
+    A cold start puts the variables with two finite bounds at the bound
+    their objective coefficient favours, which makes the slack basis dual
+    feasible, so the dual Simplex method does the work from the start.
+
+    It accepts the same keyword arguments as SimplexSolver, with `start`
+    defaulting to "dual", and after solving, the final basis is available
+    as the `basis` attribute.
+    """
+
+    def __init__(self, model: "Model", **kwargs):
+        """
+        Initializes a new DualSimplexSolver instance.
+
+        Args:
+            model (Model): The linear programming model to be solved.
+            kwargs (dict): A dictionary of keyword arguments.
+        """
+        kwargs.setdefault("start", "dual")
+        super().__init__(model, **kwargs)
@@ -0,0 +1,142 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+
+class LUFactorization:
+    """
+    Maintains an LU factorization of the simplex basis matrix.
+
+    Column replacements are recorded as eta vectors (product form of the
+    inverse) on top of the last factorization, and the basis is refactorized
+    from scratch every `refactor_frequency` updates to bound the length of the
+    eta file and the accumulated rounding error. Sparse constraint matrices
+    are factorized with SuperLU, dense ones with LAPACK.
+
+    Attributes:
+        size (int): The number of rows of the basis matrix.
+        refactor_frequency (int): The number of updates between refactorizations.
+        num_updates (int): The number of eta updates since the last refactorization.
+    """
+
+    def __init__(self, A: np.ndarray, basis: np.ndarray, refactor_frequency: int = 50):
+        """
+        Initializes a new LUFactorization instance.
+
+        Args:
+            A (np.ndarray | sp.csc_matrix): The constraint matrix, including slack columns.
+            basis (np.ndarray): The column indices of the basis variables.
+            refactor_frequency (int): The number of updates between refactorizations.
+        """
+        self._A = A
+        self.size = len(basis)
+        self.refactor_frequency = refactor_frequency
+        self.refactor(basis)
+
+    def refactor(self, basis: np.ndarray) -> None:
+        """
+        Factorizes the basis matrix from scratch and clears the eta file.
+
+        Args:
+            basis (np.ndarray): The column indices of the basis variables.
+        """
+        if sp.issparse(self._A):
+            splu_factor = splu(sp.csc_matrix(self._A[:, basis]))
+            self._solve = lambda a, trans=0: splu_factor.solve(a, trans="T" if trans else "N")
+        else:
+            lu = lu_factor(self._A[:, basis])
+            self._solve = lambda a, trans=0: lu_solve(lu, a, trans=trans)
+        self._etas = []
+        self.num_updates = 0
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """
+        Solves B w = a.
+
+        Args:
+            a (np.ndarray): The right-hand side vector.
+
+        Returns:
+            np.ndarray: The solution vector w.
+        """
+        w = self._solve(np.asarray(a, dtype=float))
+        for r, eta in self._etas:
+            w_r = w[r]
+            if w_r != 0:
+                w[r] = 0
+                w += w_r * eta
+        return w
+
+    def btran(self, a: np.ndarray) -> np.ndarray:
+        """
+        Solves B^T y = a.
+
+        Args:
+            a (np.ndarray): The right-hand side vector.
+
+        Returns:
+            np.ndarray: The solution vector y.
+        """
+        y = np.array(a, dtype=float)
+        for r, eta in reversed(self._etas):
+            y[r] = eta @ y
+        return self._solve(y, trans=1)
+
+    def update(self, r: int, alpha: np.ndarray, basis: np.ndarray) -> bool:
+        """
+        Replaces the basis column in position r.
+
+        Args:
+            r (int): The position in the basis of the leaving variable.
+            alpha (np.ndarray): The entering column in terms of the old basis, B^-1 a_q.
+            basis (np.ndarray): The column indices of the basis variables after the update.
+
+        Returns:
+            bool: True if the basis was refactorized from scratch.
+        """
+        if self.num_updates + 1 >= self.refactor_frequency:
+            self.refactor(basis)
+            return True
+        eta = -alpha / alpha[r]
+        eta[r] = 1 / alpha[r]
+        self._etas.append((r, eta))
+        self.num_updates += 1
+        return False
+
+
+class DenseInverse:
+    """
+    Keeps an explicit dense inverse of the basis matrix, recomputed with
+    np.linalg.inv after every column replacement.
+
+    This is the textbook representation the simplex solver originally used.
+    It costs O(m^3) per pivot and is kept as a reference for benchmarking and
+    testing the LU-based representation.
+    """
+
+    def __init__(self, A: np.ndarray, basis: np.ndarray):
+        """
+        Initializes a new DenseInverse instance.
+
+        Args:
+            A (np.ndarray | sp.csc_matrix): The constraint matrix, including slack columns.
+            basis (np.ndarray): The column indices of the basis variables.
+        """
+        self._A = A
+        self.size = len(basis)
+        self.refactor(basis)
+
+    def refactor(self, basis: np.ndarray) -> None:
+        B = self._A[:, basis]
+        self._B_inv = np.linalg.inv(B.toarray() if sp.issparse(B) else B)
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        return self._B_inv @ a
+
+    def btran(self, a: np.ndarray) -> np.ndarray:
+        return self._B_inv.T @ a
+
+    def update(self, r: int, alpha: np.ndarray, basis: np.ndarray) -> bool:
+        self.refactor(basis)
+        return True
@@ -0,0 +1,47 @@
+import json
+import logging
+from collections import namedtuple
+
+# An iteration of a solver, as passed to the callbacks of a solve. The phase
+# is "dual" or "primal" for the Simplex methods, "parametric" for a
+# parametric sweep and "interior" for the interior point method. The
+# objective is that of the current point in the sense of the model, and the
+# infeasibility the sum of the bound violations of the basis variables, or
+# the norm of the primal residual for the interior point method. Entering and
+# leaving are columns, counting the variables followed by the slacks, equal
+# for a bound flip and None where the method has no basis.
+SolveEvent = namedtuple("SolveEvent", ["solver", "phase", "iteration", "objective", "infeasibility",
+                                       "entering", "leaving"])
+
+# Seconds and counts per phase of a solve, as dictionaries keyed by phase
+SolveProfile = namedtuple("SolveProfile", ["timings", "counters"])
+
+logger = logging.getLogger("optizenith.solvers")
+
+
+def log_event(event: SolveEvent):
+    """
+    Logs an iteration as a JSON record at level INFO on the "optizenith.solvers"
+    logger. The fields are also attached to the record as `optizenith`.
+    """
+    fields = {"event": "iteration", **event._asdict()}
+    logger.info(json.dumps(fields), extra={"optizenith": fields})
+
+
+def log_profile(solver: str, profile: SolveProfile, iterations: int):
+    """
+    Logs the profile of a finished solve as a JSON record, as log_event does.
+    """
+    fields = {"event": "profile", "solver": solver, "iterations": iterations,
+              "timings": profile.timings, "counters": profile.counters}
+    logger.info(json.dumps(fields), extra={"optizenith": fields})
+
+
+def print_event(event: SolveEvent):
+    """
+    Prints an iteration as a line of a progress table.
+    """
+    entering = "-" if event.entering is None else event.entering
+    leaving = "-" if event.leaving is None else event.leaving
+    print(f"{event.phase:>10} {event.iteration:>7} {event.objective:>16.8g} {event.infeasibility:>11.3g} "
+          f"{entering:>7} {leaving:>7}")
@@ -1,13 +1,130 @@
 from .base_solver import BaseSolver
+from .solution import Solution
+from .basis import Basis, AT_LOWER, AT_UPPER, BASIC
+from .simplex import SLACK_SIGNS
+from .dual_simplex import DualSimplexSolver
 
+import time
 import numpy as np
-from numpy.linalg import solve
+import scipy.linalg as la
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
 from typing import Tuple
 
+
+class NormalEquations:
+    """
+    Factorizes the normal equations matrix A D A^T of an interior point
+    iteration once, so that the predictor and the corrector step are two
+    solves with the same factors.
+
+    The matrix is formed by scaling the columns of A with the vector d
+    rather than multiplying with a diagonal matrix, with a dense matrix
+    product if A is dense. It is factored with a dense Cholesky
+    factorization when it is small or dense, and with a sparse LU
+    factorization otherwise. A small multiple of the identity is
+    added if the matrix is numerically singular, e.g. for redundant rows,
+    or if regularization is asked for, in which case the solves are
+    refined against the unregularized matrix.
+    """
+
+    def __init__(self, A: sp.csc_matrix, dense_threshold: int = 2000):
+        """
+        Initializes a new NormalEquations instance.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            dense_threshold (int): The number of rows up to which A D A^T is
+                                   factored as a dense matrix. Defaults to 2000.
+        """
+        m, n = A.shape
+        self._dense_A = A.toarray() if A.nnz > 0.1 * m * n else None
+        self._A = A
+        self._AT = A.T.tocsr()
+        self._column_of = np.repeat(np.arange(n), np.diff(A.indptr))
+        self._dense_threshold = dense_threshold
+        self._M = None
+
+    def factor(self, d: np.ndarray, regularization: float = 0.0) -> None:
+        """
+        Factorizes A D A^T for D = diag(d).
+
+        Args:
+            d (np.ndarray): The column scaling.
+            regularization (float): The multiple of the largest diagonal entry
+                                    added to the diagonal. Defaults to 0.
+        """
+        m = self._A.shape[0]
+        if self._dense_A is not None:
+            M = (self._dense_A * d) @ self._dense_A.T
+            dense = True
+        else:
+            scaled = self._A.copy()
+            scaled.data *= d[self._column_of]
+            M = sp.csc_matrix(scaled @ self._AT)
+            dense = m <= self._dense_threshold or M.nnz > 0.1 * m * m
+        scale = max(np.max(M.diagonal()), 1.0)
+        regularization *= scale
+        self._M = M if regularization > 0 else None
+        for _ in range(8):
+            try:
+                if dense:
+                    M_dense = M.toarray() if sp.issparse(M) else M.copy()
+                    M_dense[np.diag_indices(m)] += regularization
+                    factors = la.cho_factor(M_dense, check_finite=False)
+                    self._solve = lambda rhs: la.cho_solve(factors, rhs, check_finite=False)
+                else:
+                    lu = splu(M + regularization * sp.identity(m, format="csc"), permc_spec="MMD_AT_PLUS_A")
+                    self._solve = lu.solve
+                return
+            except (la.LinAlgError, RuntimeError):
+                regularization = max(10 * regularization, 1e-12 * scale)
+        raise ValueError("The normal equations are singular.")
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """
+        Solves A D A^T v = rhs with the current factorization, with a few
+        steps of iterative refinement if it is regularized.
+        """
+        v = self._solve(rhs)
+        if self._M is not None:
+            for _ in range(3):
+                v += self._solve(rhs - self._M @ v)
+        return v
+
+
 class InteriorPointSolver(BaseSolver):
     """
-    The InteriorPointSolver class implements the Interior Point method for solving 
-    linear programming problems.
+    The InteriorPointSolver class implements Mehrotra's predictor-corrector
+    primal-dual Interior Point method for solving linear programming problems.
+
+    Every constraint gets a slack column as in the SimplexSolver, with ">="
+    rows getting a surplus and "=" rows none, and a minimization is solved
+    as the maximization of the negated objective. As the method works on
+    x >= 0, variables are shifted by their lower bound or reflected at
+    their upper bound if that is the only finite one, free variables are
+    split into two nonnegative parts, and the remaining finite upper bounds,
+    including those of the slacks of ranged rows, are added as rows. The
+    solution is mapped back to the variables and slacks of the model. Each
+    iteration factorizes the normal equations A D A^T once and solves them
+    twice, for the affine-scaling predictor and for the centering corrector.
+
+    After solving, the primal values, the duals and the reduced costs are
+    available as the `x`, `y` and `z` attributes, and `basis` holds the
+    Basis suggested by the interior solution, from which a simplex solve can
+    start. With `crossover=True` the solver runs that simplex solve itself
+    and returns a basic optimal solution. A solve stopped by the iteration
+    or time limit or by cancellation returns the last iterate, which need
+    not be feasible, and skips the crossover.
+
+    An infeasible or unbounded problem raises a ValueError as soon as an
+    iterate is a Farkas certificate of primal or dual infeasibility within
+    the tolerance. If the iterates break down otherwise, as they can once
+    the normal equations become ill-conditioned near the optimum, the
+    solver goes back to the best iterate so far and continues with a
+    regularized normal matrix, up to `fallbacks` times before it reports the
+    problem as infeasible or unbounded. A best iterate within
+    `acceptable_tolerance` that stops improving is returned as optimal.
     """
 
     def __init__(self, model: "Model", **kwargs):
@@ -18,70 +135,293 @@ class InteriorPointSolver(BaseSolver):
             model (Model): The linear programming model to be solved.
             kwargs (dict): A dictionary of keyword arguments.
         """
-        super().__init__(model)
+        super().__init__(model, **kwargs)
         self._max_iterations = kwargs.get("max_iterations", 100)
-        self._tolerance = kwargs.get("tolerance", 1e-6)
-        self._mu = kwargs.get("mu", 10)
-        self._alpha = kwargs.get("alpha", 0.01)
-        self._beta = kwargs.get("beta", 0.5)
+        self._tolerance = kwargs.get("tolerance", 1e-8)
+        self._step_factor = kwargs.get("step_factor", 0.995)
+        self._dense_threshold = kwargs.get("dense_threshold", 2000)
+        self._crossover = kwargs.get("crossover", False)
+        self._acceptable_tolerance = kwargs.get("acceptable_tolerance", 1e-6)
+        self._fallbacks = kwargs.get("fallbacks", 3)
+        self.iterations = 0
+        self.basis = None
 
-    def solve(self) -> Tuple[float, dict]:
-        A, b, c, x = self._build_matrices()
-        optimal_value, optimal_solution = self._run_interior_point(A, b, c, x)
-        return optimal_value, optimal_solution
+    def solve(self) -> Tuple[float, Solution]:
+        started = time.perf_counter()
+        self._timings, self._counters = {}, {}
+        A, b, c = self._build_matrices()
+        self._timed("build", started)
+        self._run_interior_point(A, b, c)
+        optimal_value = self._map_solution()
+        n = self._shape[1]
+        if self._crossover and self.status == "optimal":
+            crossover_started = time.perf_counter()
+            time_limit = None if self._deadline is None else max(0.0, self._deadline - time.perf_counter())
+            simplex = DualSimplexSolver(self.model, warm_start=self.basis, callbacks=self._callbacks,
+                                        cancel=self._cancel, time_limit=time_limit)
+            optimal_value, _ = simplex.solve()
+            self.status = simplex.status
+            self.basis = simplex.basis
+            self.x, self.y, self.z = simplex.x, simplex.y, simplex.z
+            self._timed("crossover", crossover_started)
+            self._count("crossover_pivots", simplex.iterations)
+            return self._result(optimal_value, n, started)
+        return self._result(optimal_value, n, started)
 
-    def _build_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    def _build_matrices(self) -> Tuple[sp.csc_matrix, np.ndarray, np.ndarray]:
         """
-        Builds the initial matrices for the Interior Point method.
+        Builds the standard form max c^T x, Ax = b, x >= 0 of the model.
 
         Returns:
-            Tuple[np.ndarray]: The constraint matrix A, the right-hand side vector b,
-                               the objective function coefficients c, and the initial
-                               solution x.
+            Tuple[np.ndarray]: The sparse constraint matrix A, the right-hand side vector b
+                               and the objective function coefficients c.
+        """
+        form = self.model.to_matrix_form()
+        self._form = form
+        m, n = form.shape
+        self._shape = (m, n)
+        self._sign = -1.0 if form.sense == "min" else 1.0
+
+        try:
+            signs = np.array([SLACK_SIGNS[sense] for sense in form.senses], dtype=float)
+        except KeyError as error:
+            raise ValueError(f"Unknown constraint type: {error.args[0]}") from None
+        rows = np.flatnonzero((form.senses != "=") & (form.senses != "=="))
+        self._slack_rows = rows
+
+        # Write x = shift + direction * x' with x' >= 0: shifted by a finite
+        # lower bound, or reflected at the upper bound if that is the only
+        # finite one, and split free variables into two nonnegative parts
+        lb, ub = form.lb.astype(float), form.ub.astype(float)
+        if np.any(lb > ub):
+            raise ValueError("The problem is infeasible.")
+        reflected = ~np.isfinite(lb) & np.isfinite(ub)
+        self._shift = np.where(np.isfinite(lb), lb, np.where(reflected, ub, 0.0))
+        self._direction = np.where(reflected, -1.0, 1.0)
+        self._free = np.flatnonzero(~np.isfinite(lb) & ~np.isfinite(ub))
+        structural = sp.csc_matrix(form.A) @ sp.diags(self._direction)
+        slacks = sp.csc_matrix((signs[rows], (rows, np.arange(len(rows)))), shape=(m, len(rows)))
+        A = sp.hstack([structural, -structural[:, self._free], slacks], format="csc")
+        c = self._sign * np.concatenate([form.c * self._direction, -form.c[self._free], np.zeros(len(rows))])
+        b = form.b - form.A @ self._shift
+
+        # Add the remaining finite upper bounds as rows with their own slacks
+        slack_upper = np.full(m, np.inf) if form.ranges is None else np.abs(form.ranges).astype(float)
+        upper = np.concatenate([np.where(reflected, np.inf, ub - self._shift),
+                                np.full(len(self._free), np.inf), slack_upper[rows]])
+        bounded = np.flatnonzero(np.isfinite(upper))
+        k = len(bounded)
+        N = A.shape[1]
+        bound_rows = sp.csc_matrix((np.ones(k), (np.arange(k), bounded)), shape=(k, N))
+        A = sp.bmat([[A, None], [bound_rows, sp.identity(k, format="csc")]], format="csc")
+        c = np.concatenate([c, np.zeros(k)])
+        b = np.concatenate([b, upper[bounded]])
+        return A, b, c
+
+    def _starting_point(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray,
+                        normal: NormalEquations) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        m = len(self.model.constraints)
-        n = len(self.model.variables)
+        Computes Mehrotra's starting point: the least-squares solutions of
+        Ax = b and A^T y + z = c, shifted into the positive orthant.
+        """
+        normal.factor(np.ones(A.shape[1]))
+        x = A.T @ normal.solve(b)
+        y = normal.solve(A @ c)
+        z = c - A.T @ y
 
-        A = np.zeros((m, n))
-        b = np.zeros((m, 1))
-        c = np.zeros((n, 1))
-        x = np.ones((n, 1))
+        x += max(-1.5 * x.min(), 0)
+        z += max(-1.5 * z.min(), 0)
+        xz = x @ z
+        x += 0.5 * xz / max(z.sum(), 1e-12)
+        z += 0.5 * xz / max(x.sum(), 1e-12)
+        return np.maximum(x, 1e-8), y, np.maximum(z, 1e-8)
 
-        for i, constraint in enumerate(self.model.constraints):
-            for j, coefficient in enumerate(constraint.expression.coefficients):
-                A[i, j] = coefficient
-            b[i] = constraint.rhs
+    def _max_step(self, v: np.ndarray, dv: np.ndarray) -> float:
+        """
+        Returns the largest step in [0, 1] that keeps v + step * dv nonnegative.
+        """
+        decreasing = dv < 0
+        if not np.any(decreasing):
+            return 1.0
+        return min(1.0, float(np.min(-v[decreasing] / dv[decreasing])))
 
-        for i, coefficient in enumerate(self.model.objective.expression.coefficients):
-            c[i] = coefficient
+    def _certificate(self, b: np.ndarray, c: np.ndarray, r_b: np.ndarray, r_c: np.ndarray,
+                     x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Tuple[float, str]:
+        """
+        Measures how close an iterate of min c^T x, Ax = b, x >= 0 is to a
+        Farkas certificate.
 
-        return A, b, c, x
+        A y with A^T y <= 0 and b^T y > 0 proves that no x >= 0 solves
+        Ax = b, and an x >= 0 with Ax = 0 and c^T x < 0 is a ray along which
+        the objective decreases without bound. The iterates of an infeasible
+        problem approach the first as y diverges, those of an unbounded
+        problem the second as x diverges. The violations are measured after
+        scaling to b^T y = 1 or c^T x = -1, with A^T y = c - z - r_c and
+        Ax = b - r_b.
 
-    def _run_interior_point(self, A: np.ndarray, b: np.ndarray,
-                             c: np.ndarray, x: np.ndarray) -> Tuple[float, dict]:
+        Returns:
+            Tuple[float, str]: The smaller violation, infinite if neither
+                               scaling exists, and the error message for it.
         """
-        Solves the linear programming problem using the Interior Point method.
+        dual, primal = b @ y, c @ x
+        infeasibility = np.max(c - r_c - z) / dual if dual > 0 else np.inf
+        unboundedness = np.max(np.abs(b - r_b), initial=0) / -primal if primal < 0 else np.inf
+        if unboundedness < infeasibility:
+            return unboundedness, "The problem is unbounded."
+        return infeasibility, "The problem is infeasible."
+
+    def _run_interior_point(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Solves the linear programming problem using Mehrotra's predictor-corrector method.
+
+        The problem is solved as min -c^T x, Ax = b, x >= 0 with duals y and
+        reduced costs z >= 0. The Newton system is reduced to the normal
+        equations A D A^T dy = r with D = diag(x / z).
 
         Args:
-            A (np.ndarray): The constraint matrix.
+            A (sp.csc_matrix): The constraint matrix.
             b (np.ndarray): The right-hand side vector.
             c (np.ndarray): The objective function coefficients.
-            x (np.ndarray): The initial solution.
         Returns:
-            Tuple[float, dict]: The optimal value and the optimal solution as a dictionary.
+            Tuple[float, np.ndarray]: The optimal value and the values of the standard form variables.
         """
-        m, n = A.shape
-        e = np.ones((n, 1))
-
-        for iteration in range(self._max_iterations):
-            # Calculate the Newton step
-            X_inv = np.diag(1 / x.flatten())
-            Z = np.diag((x * self._mu / e).flatten())
-            M = A @ X_inv @ Z @ A.T
-            r_dual = A.T @ Z @ e - c 
-            r_cent = -X_inv @ Z @ e - self._mu * e
-            delta_y = np.linalg.solve(M, A @ X_inv @ r_cent - r_dual)
-            delta_x = X_inv @ (Z @ delta_y - r_cent)
-
-            # Backtracking line search
-            t
+        m, N = A.shape
+        c = -c
+        started = time.perf_counter()
+        normal = NormalEquations(A, self._dense_threshold)
+        x, y, z = self._starting_point(A, b, c, normal)
+        self._timed("starting_point", started)
+        norm_b = 1 + np.linalg.norm(b)
+        norm_c = 1 + np.linalg.norm(c)
+        # The objective of the model differs from that of the standard form
+        # by the shift of the variables
+        offset = self._form.c @ self._shift + self._form.objective_constant
+
+        self.iterations = 0
+        # The iterate with the smallest error, and the iterations since it
+        best, stalled = None, 0
+        previous = np.inf
+        regularization, fallbacks = 0.0, 0
+        while True:
+            r_b = b - A @ x
+            r_c = c - A.T @ y - z
+            primal = c @ x
+            gap = abs(primal - b @ y) / (1 + abs(primal))
+            error = max(np.linalg.norm(r_b) / norm_b, np.linalg.norm(r_c) / norm_c, gap)
+            if error < self._tolerance:
+                break
+            if self._interrupted():
+                break
+            violation, message = self._certificate(b, c, r_b, r_c, x, y, z)
+            if violation <= self._tolerance:
+                raise ValueError(message)
+            # The error of iterates on their way to a certificate grows
+            # without a numerical breakdown
+            approaching = violation < min(1e-2, previous)
+            previous = violation
+            diverged = max(np.abs(x).max(), np.abs(y).max(initial=0)) > 1e12
+            if best is not None and (diverged or (error > 1e3 * best[0] and not approaching)
+                                     or (stalled >= 5 and best[0] < self._acceptable_tolerance)):
+                if violation <= self._acceptable_tolerance:
+                    raise ValueError(message)
+                if fallbacks < self._fallbacks:
+                    # Go back to the best iterate and regularize the normal equations
+                    fallbacks += 1
+                    self._count("fallbacks")
+                    regularization = max(100 * regularization, 1e-12)
+                    _, x, y, z = (np.copy(v) for v in best)
+                    stalled, previous = 0, np.inf
+                    continue
+                if best[0] < self._acceptable_tolerance:
+                    _, x, y, z = best
+                    primal = c @ x
+                    break
+                raise ValueError("The problem is infeasible or unbounded.")
+            if diverged:
+                raise ValueError("The problem is infeasible or unbounded.")
+            if best is None or error < best[0]:
+                best, stalled = (error, x.copy(), y.copy(), z.copy()), 0
+            else:
+                stalled += 1
+
+            started = time.perf_counter()
+            d = np.clip(x / z, 1e-14, 1e14)
+            normal.factor(d, regularization)
+            self._timed("factorize", started)
+            self._count("factorizations")
+
+            def direction(r_xz):
+                solve_started = time.perf_counter()
+                dy = normal.solve(r_b + A @ (d * r_c - r_xz / z))
+                dz = r_c - A.T @ dy
+                # With the clipped d, so that A dx = r_b holds for the direction
+                dx = r_xz / z - d * dz
+                self._timed("solve", solve_started)
+                return dx, dy, dz
+
+            # Affine-scaling predictor
+            mu = x @ z / N
+            dx, dy, dz = direction(-x * z)
+            alpha_p = self._max_step(x, dx)
+            alpha_d = self._max_step(z, dz)
+            mu_affine = (x + alpha_p * dx) @ (z + alpha_d * dz) / N
+            sigma = (mu_affine / mu) ** 3
+
+            # Centering corrector with the second-order term of the predictor
+            dx, dy, dz = direction(sigma * mu - x * z - dx * dz)
+            alpha_p = min(1.0, self._step_factor * self._max_step(x, dx))
+            alpha_d = min(1.0, self._step_factor * self._max_step(z, dz))
+
+            x += alpha_p * dx
+            y += alpha_d * dy
+            z += alpha_d * dz
+            self.iterations += 1
+            if self._callbacks:
+                self._emit("interior", self._sign * -(c @ x) + offset, np.linalg.norm(b - A @ x))
+
+        self._standard = (x, -y)
+        return float(-primal), x
+
+    def _map_solution(self) -> float:
+        """
+        Maps the solution of the standard form back to the variables and
+        slacks of the model and sets the `x`, `y`, `z` and `basis` attributes,
+        with the duals and the reduced costs z = A^T y - c of the objective in
+        its own sense.
+
+        Returns:
+            float: The optimal value.
+        """
+        form = self._form
+        m, n = self._shape
+        x_standard, y_standard = self._standard
+        values = self._shift + self._direction * x_standard[:n]
+        values[self._free] -= x_standard[n:n + len(self._free)]
+        slacks = np.zeros(m)
+        slacks[self._slack_rows] = x_standard[n + len(self._free):n + len(self._free) + len(self._slack_rows)]
+        self.x = np.concatenate([values, slacks])
+        self.y = self._sign * y_standard[:m]
+        signs = np.array([SLACK_SIGNS[sense] for sense in form.senses], dtype=float)
+        self.z = np.concatenate([form.A.T @ self.y - form.c, signs * self.y])
+        self.basis = self._suggest_basis()
+        return float(form.c @ values + form.objective_constant)
+
+    def _suggest_basis(self) -> Basis:
+        """
+        Suggests a basis for crossover: the m variables and slacks that are
+        farthest from their bounds relative to their reduced costs. The
+        others are placed at their nearer bound.
+        """
+        form = self._form
+        m, n = self._shape
+        slack_upper = np.full(m, np.inf) if form.ranges is None else np.abs(form.ranges).astype(float)
+        slack_upper[(form.senses == "=") | (form.senses == "==")] = 0
+        lower = np.concatenate([form.lb, np.zeros(m)])
+        upper = np.concatenate([form.ub, slack_upper])
+        above, below = self.x - lower, upper - self.x
+        with np.errstate(invalid="ignore"):
+            distance = np.minimum(above, below)
+        order = np.argsort(-(distance / (np.abs(self.z) + 1e-12)), kind="stable")
+        status = np.where(below < above, AT_UPPER, AT_LOWER).astype(np.int8)
+        status[order[:m]] = BASIC
+        return Basis(status[:n], status[n:])
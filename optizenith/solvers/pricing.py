@@ -0,0 +1,166 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import Optional
+
+
+class DantzigPricing:
+    """
+    Prices every non-basis column and selects the one with the most negative
+    reduced cost z_j = a_j^T y - c_j. The reduced costs of variables at their
+    upper bound, which improve the objective by decreasing, are negated
+    first, and those of free variables count with their negative magnitude.
+    """
+
+    needs_pivot_row = False
+
+    def __init__(self, A: sp.csc_matrix, c: np.ndarray, tolerance: float, slack_basis: bool = True):
+        """
+        Initializes a new pricing rule.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix, including slack columns.
+            c (np.ndarray): The objective function coefficients.
+            tolerance (float): The optimality tolerance on the reduced costs.
+            slack_basis (bool): Whether pricing starts from the slack basis.
+        """
+        self._A = A
+        self._c = c
+        self._tolerance = tolerance
+
+    def reduced_costs(self, y: np.ndarray, is_basic: np.ndarray) -> np.ndarray:
+        z = self._A.T @ y - self._c
+        z[is_basic] = 0
+        return z
+
+    @staticmethod
+    def _oriented(z: np.ndarray, at_upper: Optional[np.ndarray], free: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Orients the reduced costs in place so that negative values mark the
+        variables whose move away from their bound improves the objective.
+        """
+        if at_upper is not None:
+            z[at_upper] = -z[at_upper]
+        if free is not None:
+            z[free] = -np.abs(z[free])
+        return z
+
+    def select(self, y: np.ndarray, is_basic: np.ndarray, at_upper: Optional[np.ndarray] = None,
+               free: Optional[np.ndarray] = None) -> Optional[int]:
+        """
+        Selects the entering variable.
+
+        Args:
+            y (np.ndarray): The simplex multipliers B^-T c_B.
+            is_basic (np.ndarray): A mask of the basis variables.
+            at_upper (np.ndarray): A mask of the variables at their upper bound. Defaults to None.
+            free (np.ndarray): A mask of the free variables. Defaults to None.
+
+        Returns:
+            int | None: The entering variable, or None if the basis is optimal.
+        """
+        z = self._oriented(self.reduced_costs(y, is_basic), at_upper, free)
+        j = int(np.argmin(z))
+        return j if z[j] < -self._tolerance else None
+
+    def update(self, q: int, r: int, leaving: int, alpha: np.ndarray,
+               pivot_row: Optional[np.ndarray], factor) -> None:
+        """
+        Updates the state of the rule after a pivot.
+
+        Args:
+            q (int): The entering variable.
+            r (int): The position in the basis of the leaving variable.
+            leaving (int): The leaving variable.
+            alpha (np.ndarray): The entering column B^-1 a_q.
+            pivot_row (np.ndarray | None): Row r of B^-1 A, if the rule needs it.
+            factor (LUFactorization | DenseInverse): The basis before the pivot.
+        """
+        pass
+
+
+class PartialPricing(DantzigPricing):
+    """
+    Prices one segment of the columns at a time, cycling through the
+    segments, and selects the most negative reduced cost within the first
+    segment that has one.
+    """
+
+    def __init__(self, A: sp.csc_matrix, c: np.ndarray, tolerance: float, slack_basis: bool = True,
+                 segments: int = 8):
+        super().__init__(A, c, tolerance, slack_basis)
+        n = A.shape[1]
+        size = max(n // segments, min(n, 64))
+        self._bounds = [(start, min(start + size, n)) for start in range(0, n, size)]
+        self._segment = 0
+
+    def select(self, y, is_basic, at_upper=None, free=None) -> Optional[int]:
+        for k in range(len(self._bounds)):
+            segment = (self._segment + k) % len(self._bounds)
+            start, stop = self._bounds[segment]
+            z = self._A[:, start:stop].T @ y - self._c[start:stop]
+            z[is_basic[start:stop]] = 0
+            self._oriented(z, None if at_upper is None else at_upper[start:stop],
+                           None if free is None else free[start:stop])
+            j = int(np.argmin(z))
+            if z[j] < -self._tolerance:
+                self._segment = (segment + 1) % len(self._bounds)
+                return start + j
+        return None
+
+
+class DevexPricing(DantzigPricing):
+    """
+    Selects the column maximizing z_j^2 / w_j, where the weights w_j
+    approximate the steepest-edge norms relative to a reference framework
+    of the initial non-basis variables.
+    """
+
+    needs_pivot_row = True
+
+    def __init__(self, A: sp.csc_matrix, c: np.ndarray, tolerance: float, slack_basis: bool = True):
+        super().__init__(A, c, tolerance, slack_basis)
+        self._weights = np.ones(A.shape[1])
+
+    def select(self, y, is_basic, at_upper=None, free=None) -> Optional[int]:
+        z = self._oriented(self.reduced_costs(y, is_basic), at_upper, free)
+        candidates = z < -self._tolerance
+        if not np.any(candidates):
+            return None
+        scores = np.where(candidates, z * z / self._weights, -1.0)
+        return int(np.argmax(scores))
+
+    def update(self, q, r, leaving, alpha, pivot_row, factor) -> None:
+        ratios = pivot_row / alpha[r]
+        w_q = self._weights[q]
+        np.maximum(self._weights, ratios * ratios * w_q, out=self._weights)
+        self._weights[leaving] = max(w_q / alpha[r] ** 2, 1.0)
+
+
+class SteepestEdgePricing(DevexPricing):
+    """
+    Selects the column maximizing z_j^2 / gamma_j with the exact edge norms
+    gamma_j = ||B^-1 a_j||^2 + 1, updated after every pivot with the
+    Goldfarb-Reid recurrences. The norms are only known exactly for the
+    slack basis; from any other basis the weights start at 1 as in Devex.
+    """
+
+    def __init__(self, A: sp.csc_matrix, c: np.ndarray, tolerance: float, slack_basis: bool = True):
+        super().__init__(A, c, tolerance, slack_basis)
+        if slack_basis:
+            self._weights = np.asarray(A.multiply(A).sum(axis=0)).ravel() + 1
+
+    def update(self, q, r, leaving, alpha, pivot_row, factor) -> None:
+        ratios = pivot_row / alpha[r]
+        gamma_q = alpha @ alpha + 1
+        tau = self._A.T @ factor.btran(alpha)
+        weights = self._weights - 2 * ratios * tau + ratios * ratios * gamma_q
+        np.maximum(weights, 1 + ratios * ratios, out=self._weights)
+        self._weights[leaving] = max(gamma_q / alpha[r] ** 2, 1.0)
+
+
+PRICING_RULES = {
+    "dantzig": DantzigPricing,
+    "partial": PartialPricing,
+    "devex": DevexPricing,
+    "steepest-edge": SteepestEdgePricing,
+}
@@ -0,0 +1,103 @@
+import importlib
+from typing import Dict, List, Type, Union
+
+from .base_solver import BaseSolver
+
+ENTRY_POINT_GROUP = "optizenith.solvers"
+
+# Solvers by lower-case name. A "module:attribute" string is imported, and
+# replaced by the class it names, on the first solve that asks for it.
+_solvers: Dict[str, Union[str, Type[BaseSolver]]] = {
+    "simplex": "optizenith.solvers.simplex:SimplexSolver",
+    "dual-simplex": "optizenith.solvers.dual_simplex:DualSimplexSolver",
+    "interior-point": "optizenith.solvers.interior_point:InteriorPointSolver",
+}
+_entry_points_loaded = False
+
+
+def register_solver(name: str, solver: Union[str, Type[BaseSolver]]):
+    """
+    Registers a solver under a name, replacing any solver of that name.
+
+    A solver is a BaseSolver subclass that is constructed with the problem,
+    a `warm_start` keyword argument that may be None and the keyword
+    arguments of the solve, and whose solve() returns the objective value
+    and a Solution. Solvers can also be registered by other packages under
+    the "optizenith.solvers" entry point group, e.g. in setup.py:
+
+        entry_points={"optizenith.solvers": ["my-solver = my_package.solver:MySolver"]}
+
+    Args:
+        name (str): The name of the solver, as passed to Model.solve. Names are
+            case insensitive.
+        solver (type | str): The solver class, or a "module:attribute" reference
+            to it that is imported when the solver is first used.
+
+    Raises:
+        ValueError: If the solver is neither a BaseSolver subclass nor a reference.
+    """
+    if not isinstance(solver, str) and not (isinstance(solver, type) and issubclass(solver, BaseSolver)):
+        raise ValueError(f"A solver must be a BaseSolver subclass or a 'module:attribute' reference, got {solver!r}")
+    _solvers[name.lower()] = solver
+
+
+def get_solver(name: str) -> Type[BaseSolver]:
+    """
+    Returns the solver class registered under a name, importing it on first use.
+
+    Args:
+        name (str): The name of the solver.
+
+    Returns:
+        type: The solver class.
+
+    Raises:
+        ValueError: If no solver is registered under the name, or the
+            reference of a solver does not name a BaseSolver subclass.
+    """
+    key = name.lower()
+    if key not in _solvers:
+        _load_entry_points()
+    if key not in _solvers:
+        raise ValueError(f"Unknown solver: {name}")
+    solver = _solvers[key]
+    if isinstance(solver, str):
+        module, _, attribute = solver.partition(":")
+        solver = importlib.import_module(module)
+        for part in attribute.split("."):
+            solver = getattr(solver, part)
+        if not (isinstance(solver, type) and issubclass(solver, BaseSolver)):
+            raise ValueError(f"The solver {name} does not refer to a BaseSolver subclass: {_solvers[key]}")
+        _solvers[key] = solver
+    return solver
+
+
+def available_solvers() -> List[str]:
+    """
+    Returns the names of the registered solvers, including those of installed
+    plugins. No solver is imported.
+
+    Returns:
+        list: The sorted names.
+    """
+    _load_entry_points()
+    return sorted(_solvers)
+
+
+def _load_entry_points():
+    """
+    Adds the solvers of the "optizenith.solvers" entry point group, once.
+    Solvers registered by name, including the built-in ones, take precedence.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    try:
+        group = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        group = entry_points().get(ENTRY_POINT_GROUP, [])
+    for entry_point in group:
+        _solvers.setdefault(entry_point.name.lower(), entry_point.value.split("[")[0].strip())
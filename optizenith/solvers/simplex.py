@@ -1,13 +1,69 @@
 from .base_solver import BaseSolver
+from .basis import Basis, AT_UPPER, BASIC
+from .solution import Solution
+from .factorization import LUFactorization, DenseInverse
+from .pricing import PRICING_RULES
 
+import time
 import numpy as np
-from numpy.linalg import solve
-from typing import Tuple
+import scipy.sparse as sp
+from collections import namedtuple
+from typing import Optional, Tuple
+
+Sensitivity = namedtuple("Sensitivity", ["duals", "reduced_costs", "rhs_lower", "rhs_upper",
+                                         "cost_lower", "cost_upper"])
+ParametricPath = namedtuple("ParametricPath", ["t", "objectives", "solutions"])
+
+SLACK_SIGNS = {"<=": 1.0, ">=": -1.0, "=": 1.0, "==": 1.0}
+
+# The number of consecutive degenerate dual iterations after which the dual
+# Simplex method falls back to Bland's rule
+DEGENERATE_ITERATIONS = 50
 
 class SimplexSolver(BaseSolver):
     """
-    The SimplexSolver class implements the Simplex method for solving 
-    linear programming problems.
+    The SimplexSolver class implements the bounded-variable Simplex method
+    for solving linear programming problems.
+
+    Every constraint gets one slack column whose bounds follow the type of
+    the constraint: a "<=" row has a slack s >= 0 with a_i x + s = b_i, a
+    ">=" row a surplus with a_i x - s = b_i and s >= 0, and a "=" row a
+    slack fixed at zero. A ranged row, with a finite entry in the `ranges`
+    of the matrix form, has the width of its range as the upper bound of
+    its slack. The bounds of the variables are kept as they are: a
+    non-basis variable sits at its lower or its upper bound, or at zero if
+    it is free, and the ratio test stops basis variables at whichever bound
+    they approach. So the constraint matrix keeps its natural size and no
+    row is duplicated or negated.
+
+    The objective is maximized or minimized as given by the `sense` of the
+    matrix form; internally the solver maximizes and minimizing negates
+    the objective coefficients. A starting basis that is primal infeasible,
+    such as the slack basis of a problem with ">=" or "=" rows, is repaired
+    without artificial variables or a big-M penalty: the objective
+    coefficients of the non-basis variables that are not dual feasible are
+    shifted, with a small random perturbation, until they are, the dual
+    Simplex method restores primal feasibility and the primal Simplex
+    method then removes the shifts.
+
+    The default `method="revised"` keeps an LU factorization of the basis with
+    eta updates, while `method="dense"` recomputes an explicit inverse of the
+    basis after every pivot. The entering variable is chosen by the rule
+    given as `pricing`: "dantzig", "partial", "devex" or "steepest-edge"
+    (default). With `start="dual"` a cold start puts every non-basis
+    variable with two finite bounds at the bound where its reduced cost is
+    dual feasible, so that the dual Simplex method does the work, while the
+    default `start="primal"` keeps them at their lower bound. The solve stops with the status "iteration_limit" after
+    `max_iterations` iterations, by default ten per column including the
+    slacks and at least 1000.
+
+    A Basis from an earlier solve can be passed as `warm_start`. After
+    solving, the final basis is available as the `basis` attribute, and the
+    values of the variables and slacks, the duals and the reduced costs
+    z = A^T y - c as the `x`, `y` and `z` attributes, where the duals are
+    the change of the optimal value per unit of the right-hand side for
+    either sense. The factorization of the final basis is kept for
+    `sensitivity` and `parametric_solve`.
     """
 
     def __init__(self, model: "Model", **kwargs):
@@ -18,119 +74,859 @@ class SimplexSolver(BaseSolver):
             model (Model): The linear programming model to be solved.
             kwargs (dict): A dictionary of keyword arguments.
         """
-        super().__init__(model)
-        self._max_iterations = kwargs.get("max_iterations", 1000)
+        super().__init__(model, **kwargs)
+        self._iteration_limit = kwargs.get("max_iterations", None)
         self._tolerance = kwargs.get("tolerance", 1e-6)
-        self._verbose = kwargs.get("verbose", False)
-        self._max_pivots = kwargs.get("max_pivots", 1000)
+        self._method = kwargs.get("method", "revised")
+        self._start = kwargs.get("start", "primal")
+        self._refactor_frequency = kwargs.get("refactor_frequency", 50)
+        self._pricing = kwargs.get("pricing", "steepest-edge")
+        self._feasibility_tolerance = kwargs.get("feasibility_tolerance", 1e-9)
+        self._warm_start = kwargs.get("warm_start", None)
+        self.basis = None
+        self._matrices = None
+        self._final = None
+        self._phase = "primal"
 
-    def solve(self) -> Tuple[float, dict]:
+    def solve(self) -> Tuple[float, Solution]:
+        started = time.perf_counter()
+        self._timings, self._counters = {}, {}
         A, b, c, non_basis, basis = self._build_matrices()
-        optimal_value, optimal_solution = self._run_simplex(A, b, c, non_basis, basis)
-        return optimal_value, optimal_solution
+        self._timed("build", started)
+        self._matrices = (A, b, c, non_basis, basis.copy())
+        optimal_value, _ = self._run_simplex(A, b, c, non_basis, basis)
+        return self._result(self._sign * optimal_value + self._objective_constant, len(non_basis), started)
 
-    def _build_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    def _build_matrices(self) -> Tuple[sp.csc_matrix, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        Builds the initial tableau for the Simplex method.
+        Builds the constraint matrix with one slack column per constraint,
+        and the bounds of the variables and slacks.
 
         Returns:
-            Tuple[np.ndarray]: The constraint matrix A, the right-hand side vector b,
-                               the objective function coefficients c, and the sets of
-                               non-basis and basis variables.
+            Tuple[np.ndarray]: The sparse constraint matrix A, the right-hand side vector b,
+                               the objective function coefficients c to maximize, and the
+                               sets of non-basis and basis variables.
         """
-        # Assumes that the model is in standard form
-        m = len(self.model.constraints)
-        n = len(self.model.variables)
+        form = self.model.to_matrix_form()
+        self._objective_constant = form.objective_constant
+        self._sign = -1.0 if form.sense == "min" else 1.0
+        m, n = form.shape
 
-        # Set up the matrices
-        A = np.zeros((m, m + n))
-        c = np.zeros(n + m)
-        b = np.zeros((m, 1))
+        try:
+            signs = np.array([SLACK_SIGNS[sense] for sense in form.senses], dtype=float)
+        except KeyError as error:
+            raise ValueError(f"Unknown constraint type: {error.args[0]}") from None
 
-        # Fill in matrix B (basis matrix)
-        for i in range(m):
-            A[i, i + n] = 1
+        # Append the signed slack identity to the constraint matrix. CSC keeps
+        # column extraction for the entering variable and the basis cheap.
+        A = sp.hstack([form.A, sp.diags(signs, format="csc")], format="csc")
+        c = np.concatenate([self._sign * form.c, np.zeros(m)])
+        b = form.b.astype(float)
 
-        # Fill in matrix N (non-basis matrix)
-        for i, constraint in enumerate(self.model.constraints):
-            for j, coefficient in enumerate(constraint.expression.coefficients):
-                A[i, j] = coefficient
+        slack_upper = np.full(m, np.inf) if form.ranges is None else np.abs(form.ranges).astype(float)
+        slack_upper[(form.senses == "=") | (form.senses == "==")] = 0
+        self._lower = np.concatenate([form.lb, np.zeros(m)]).astype(float)
+        self._upper = np.concatenate([form.ub, slack_upper]).astype(float)
+        if np.any(self._lower > self._upper):
+            raise ValueError("The problem is infeasible.")
+        self._free = ~np.isfinite(self._lower) & ~np.isfinite(self._upper)
 
-        for i, constraint in enumerate(self.model.constraints):
-            b[i] = constraint.rhs
+        non_basis = np.arange(n)
+        basis = np.arange(n, n + m)
 
-        for i, coefficient in enumerate(self.model.objective.expression.coefficients):
-            c[i] = coefficient
+        return A, b, c, non_basis, basis
 
-        non_basis = np.array(list(range(0, n)))
-        basis = np.array(list(range(n, n + m)))
+    def _factorize(self, A: sp.csc_matrix, basis: np.ndarray):
+        """
+        Creates the basis representation selected by the `method` keyword.
 
-        return A, b, c, non_basis, basis
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            basis (np.ndarray): The set of basis variables.
 
-    def _run_simplex(self, A: np.ndarray, b: np.ndarray,
-                     c: np.ndarray, non_basis: np.ndarray,
-                     basis: np.ndarray) -> Tuple[float, dict]:
+        Returns:
+            LUFactorization | DenseInverse: The basis representation.
+        """
+        started = time.perf_counter()
+        if self._method == "revised":
+            factor = LUFactorization(A, basis, self._refactor_frequency)
+        elif self._method == "dense":
+            factor = DenseInverse(A, basis)
+        else:
+            raise ValueError(f"Unknown simplex method: {self._method}")
+        self._timed("factorize", started)
+        self._count("factorizations")
+        return factor
+
+    def _make_pricing(self, A: sp.csc_matrix, c: np.ndarray, slack_basis: bool = True):
+        """
+        Creates the pricing rule selected by the `pricing` keyword.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            c (np.ndarray): The objective function coefficients.
+            slack_basis (bool): Whether pricing starts from the slack basis.
+
+        Returns:
+            DantzigPricing: The pricing rule.
+        """
+        if self._pricing not in PRICING_RULES:
+            raise ValueError(f"Unknown pricing rule: {self._pricing}")
+        started = time.perf_counter()
+        pricing = PRICING_RULES[self._pricing](A, c, self._tolerance, slack_basis)
+        self._timed("pricing", started)
+        return pricing
+
+    def _ratio_test(self, x_B: np.ndarray, alpha: np.ndarray, l_B: np.ndarray,
+                    u_B: np.ndarray) -> Optional[int]:
+        """
+        Selects the leaving variable with the Harris two-pass ratio test.
+
+        The first pass computes the largest step that keeps every basis
+        variable within its bounds, relaxed by feasibility_tolerance. The
+        second pass picks, among the rows whose ordinary ratio is within that
+        step, the one with the largest pivot element, which avoids tiny pivots
+        on degenerate problems. Basis variables decrease towards their lower
+        bound where alpha > 0 and increase towards their upper bound where
+        alpha < 0.
+
+        Args:
+            x_B (np.ndarray): The values of the basis variables.
+            alpha (np.ndarray): The change of the basis variables per unit step,
+                                negated, i.e. B^-1 a_q for an increasing entering
+                                variable and -B^-1 a_q for a decreasing one.
+            l_B (np.ndarray): The lower bounds of the basis variables.
+            u_B (np.ndarray): The upper bounds of the basis variables.
+
+        Returns:
+            int | None: The position in the basis of the leaving variable,
+                        or None if the entering direction is unbounded.
+        """
+        decreasing = (alpha > self._tolerance) & np.isfinite(l_B)
+        increasing = (alpha < -self._tolerance) & np.isfinite(u_B)
+        rows = np.flatnonzero(decreasing | increasing)
+        if len(rows) == 0:
+            return None
+        alpha_rows = np.abs(alpha[rows])
+        room = np.where(decreasing[rows], x_B[rows] - l_B[rows], u_B[rows] - x_B[rows])
+        max_step = np.min((room + self._feasibility_tolerance) / alpha_rows)
+        eligible = room / alpha_rows <= max_step
+        return int(rows[eligible][np.argmax(alpha_rows[eligible])])
+
+    def _step(self, x_B: np.ndarray, alpha: np.ndarray, l_B: np.ndarray, u_B: np.ndarray, r: int) -> float:
+        """
+        Returns the step of the entering variable that takes the basis
+        variable in position r to the bound selected by the ratio test.
+        """
+        if alpha[r] > 0:
+            return max(x_B[r] - l_B[r], 0) / alpha[r]
+        return min(x_B[r] - u_B[r], 0) / alpha[r]
+
+    def _dual_ratio_test(self, z: np.ndarray, pivot_row: np.ndarray, blocked: np.ndarray,
+                         smallest_index: bool = False) -> Optional[int]:
+        """
+        Selects the entering variable of a dual simplex iteration with the
+        Harris two-pass ratio test on the reduced costs.
+
+        A variable at its lower bound can enter where the pivot row is
+        positive, one at its upper bound where it is negative, and a free
+        variable, whose reduced cost is zero, wherever it is nonzero.
+
+        Args:
+            z (np.ndarray): The reduced costs.
+            pivot_row (np.ndarray): Row r of B^-1 A for the leaving row r, negated
+                                    if the leaving variable moves to its lower bound.
+            blocked (np.ndarray): A mask of the variables that may not enter the basis.
+            smallest_index (bool): Whether to take the variable of smallest index
+                                   among the minimum ratios instead, as Bland's
+                                   rule does. Defaults to False.
+
+        Returns:
+            int | None: The entering variable, or None if the dual is unbounded,
+                        meaning that the problem is infeasible.
+        """
+        row = np.where(self._at_upper, -pivot_row, pivot_row)
+        z = np.where(self._at_upper, -z, z)
+        row[self._free] = np.abs(row[self._free])
+        z[self._free] = np.abs(z[self._free])
+        cols = np.flatnonzero((row > self._tolerance) & ~blocked)
+        if len(cols) == 0:
+            return None
+        alpha_cols = row[cols]
+        z_cols = np.maximum(z[cols], 0)
+        if smallest_index:
+            ratios = z_cols / alpha_cols
+            return int(cols[np.flatnonzero(ratios <= np.min(ratios) + self._feasibility_tolerance)[0]])
+        max_step = np.min((z_cols + self._tolerance) / alpha_cols)
+        eligible = z_cols / alpha_cols <= max_step
+        return int(cols[eligible][np.argmax(alpha_cols[eligible])])
+
+    def _pivot_row(self, A: sp.csc_matrix, factor, r: int) -> np.ndarray:
+        """
+        Computes row r of B^-1 A.
+        """
+        e_r = np.zeros(factor.size)
+        e_r[r] = 1
+        return A.T @ factor.btran(e_r)
+
+    def _reduced_costs(self, A: sp.csc_matrix, c: np.ndarray, basis: np.ndarray, factor) -> np.ndarray:
+        """
+        Computes the reduced costs z = A^T B^-T c_B - c, which are zero for the basis variables.
+        """
+        z = A.T @ factor.btran(c[basis]) - c
+        z[basis] = 0
+        return z
+
+    def _place_nonbasic(self, is_basic: np.ndarray, at_upper: Optional[np.ndarray] = None) -> None:
+        """
+        Puts every non-basis variable at a bound: at its upper bound where
+        requested or where it has no finite lower bound, and otherwise at its
+        lower bound, or at zero if it is free.
+
+        Args:
+            is_basic (np.ndarray): A mask of the basis variables.
+            at_upper (np.ndarray): A mask of the variables requested at their
+                upper bound. Defaults to None.
+        """
+        upper = np.isfinite(self._upper) & ~np.isfinite(self._lower)
+        if at_upper is not None:
+            upper |= at_upper & np.isfinite(self._upper)
+        self._at_upper = upper & ~is_basic & (self._lower < self._upper)
+        self._value = np.where(self._at_upper, self._upper, np.where(np.isfinite(self._lower), self._lower, 0.0))
+        self._value[is_basic] = 0
+
+    def _basic_values(self, A: sp.csc_matrix, b: np.ndarray, factor) -> np.ndarray:
+        """
+        Computes the values x_B = B^-1 (b - N x_N) of the basis variables.
+        """
+        return factor.ftran(b - A @ self._value)
+
+    def _pivot(self, A: sp.csc_matrix, b: np.ndarray, basis: np.ndarray, is_basic: np.ndarray, factor,
+               r: int, q: int, alpha: np.ndarray, x_B: np.ndarray, theta: float, to_lower: bool) -> np.ndarray:
+        """
+        Exchanges the basis variable in position r for variable q.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            basis (np.ndarray): The set of basis variables, updated in place.
+            is_basic (np.ndarray): A mask of the basis variables, updated in place.
+            factor (LUFactorization | DenseInverse): The basis representation, updated in place.
+            r (int): The position in the basis of the leaving variable.
+            q (int): The entering variable.
+            alpha (np.ndarray): The entering column B^-1 a_q.
+            x_B (np.ndarray): The values of the basis variables.
+            theta (float): The change of the entering variable.
+            to_lower (bool): Whether the leaving variable leaves at its lower
+                             rather than at its upper bound.
+
+        Returns:
+            np.ndarray: The values of the basis variables after the pivot.
+        """
+        x_B -= theta * alpha
+        x_B[r] = self._value[q] + theta
+
+        leaving_var = basis[r]
+        basis[r] = q
+        is_basic[q] = True
+        is_basic[leaving_var] = False
+        self._value[q] = 0
+        self._at_upper[q] = False
+        self._at_upper[leaving_var] = not to_lower and self._lower[leaving_var] < self._upper[leaving_var]
+        self._value[leaving_var] = self._lower[leaving_var] if to_lower else self._upper[leaving_var]
+
+        started = time.perf_counter()
+        if factor.update(r, alpha, basis):
+            # Recompute the basic solution from the fresh factorization
+            x_B = self._basic_values(A, b, factor)
+            self._count("refactorizations")
+        self._timed("update", started)
+
+        self.iterations += 1
+        self._count("pivots")
+        if self._callbacks:
+            self._notify(basis, x_B, q, leaving_var)
+        return x_B
+
+    def _notify(self, basis: np.ndarray, x_B: np.ndarray, entering: int, leaving: int) -> None:
+        """
+        Emits an event for the current basis, with the objective of the model
+        rather than the shifted one of phase one.
+        """
+        objective = self._sign * (self._c[basis] @ x_B + self._c @ self._value) + self._objective_constant
+        infeasibility = np.maximum(self._infeasibilities(x_B, basis), 0).sum()
+        self._emit(self._phase, objective, infeasibility, entering, leaving)
+
+    def _enter(self, A: sp.csc_matrix, b: np.ndarray, basis: np.ndarray, is_basic: np.ndarray, factor,
+               x_B: np.ndarray, j: int, direction: float, pricing=None) -> Optional[np.ndarray]:
+        """
+        Moves the non-basis variable j in the given direction until a basis
+        variable reaches a bound, which then leaves the basis, or until j
+        reaches its opposite bound first, which only flips its bound.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            basis (np.ndarray): The set of basis variables, updated in place.
+            is_basic (np.ndarray): A mask of the basis variables, updated in place.
+            factor (LUFactorization | DenseInverse): The basis representation, updated in place.
+            x_B (np.ndarray): The values of the basis variables.
+            j (int): The entering variable.
+            direction (float): 1 to increase the variable, -1 to decrease it.
+            pricing (DantzigPricing): The pricing rule to update on a pivot. Defaults to None.
+
+        Returns:
+            np.ndarray | None: The values of the basis variables, or None if the
+                               direction is unbounded.
+        """
+        started = time.perf_counter()
+        alpha = factor.ftran(A[:, [j]].toarray().ravel())
+        l_B, u_B = self._lower[basis], self._upper[basis]
+        i = self._ratio_test(x_B, direction * alpha, l_B, u_B)
+        step = np.inf if i is None else self._step(x_B, direction * alpha, l_B, u_B, i)
+        self._timed("ratio_test", started)
+
+        span = self._upper[j] - self._lower[j]
+        if np.isfinite(span) and span <= step:
+            x_B = x_B - direction * span * alpha
+            self._at_upper[j] = direction > 0
+            self._value[j] = self._upper[j] if direction > 0 else self._lower[j]
+            self.iterations += 1
+            self._count("bound_flips")
+            if self._callbacks:
+                self._notify(basis, x_B, j, j)
+            return x_B
+        if i is None:
+            return None
+
+        if pricing is not None:
+            started = time.perf_counter()
+            pivot_row = self._pivot_row(A, factor, i) if pricing.needs_pivot_row else None
+            pricing.update(j, i, basis[i], alpha, pivot_row, factor)
+            self._timed("pricing", started)
+        return self._pivot(A, b, basis, is_basic, factor, i, j, alpha, x_B, direction * step,
+                           direction * alpha[i] > 0)
+
+    def _infeasibilities(self, x_B: np.ndarray, basis: np.ndarray) -> np.ndarray:
+        """
+        Returns how far each basis variable lies outside its bounds.
+        """
+        return np.maximum(self._lower[basis] - x_B, x_B - self._upper[basis])
+
+    def _dual_infeasible(self, z: np.ndarray, is_basic: np.ndarray) -> np.ndarray:
+        """
+        Returns a mask of the non-basis variables whose reduced cost would
+        improve the objective: negative at the lower bound, positive at the
+        upper bound and nonzero for free variables. Fixed variables never are.
+        """
+        improving = np.where(self._at_upper, z > self._tolerance,
+                             np.where(self._free, np.abs(z) > self._tolerance, z < -self._tolerance))
+        return improving & ~is_basic & (self._lower < self._upper)
+
+    def _initial_basis(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray, basis: np.ndarray):
+        """
+        Factorizes the starting basis and places the non-basis variables at
+        their bounds.
+
+        A warm-start basis is used if it is nonsingular and either primal
+        feasible or dual feasible; otherwise the given slack basis is used.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            c (np.ndarray): The objective function coefficients.
+            basis (np.ndarray): The slack basis.
+
+        Returns:
+            Tuple[np.ndarray, LUFactorization | DenseInverse, np.ndarray]: The
+                basis, its representation and the values of the basis variables.
+        """
+        is_basic = np.zeros(A.shape[1], dtype=bool)
+        if self._warm_start is not None:
+            m = len(basis)
+            status = self._warm_start.status(A.shape[1] - m, m)
+            warm_basis = np.flatnonzero(status == BASIC)
+            if len(warm_basis) == m:
+                is_basic[warm_basis] = True
+                self._place_nonbasic(is_basic, status == AT_UPPER)
+                try:
+                    factor = self._factorize(A, warm_basis)
+                    x_B = self._basic_values(A, b, factor)
+                except (RuntimeError, np.linalg.LinAlgError):
+                    x_B = None
+                if x_B is not None and np.all(np.isfinite(x_B)):
+                    z = self._reduced_costs(A, c, warm_basis, factor)
+                    if (np.all(self._infeasibilities(x_B, warm_basis) <= self._feasibility_tolerance)
+                            or not np.any(self._dual_infeasible(z, is_basic))):
+                        return warm_basis, factor, x_B
+                is_basic[:] = False
+
+        is_basic[basis] = True
+        self._place_nonbasic(is_basic)
+        factor = self._factorize(A, basis)
+        return basis, factor, self._basic_values(A, b, factor)
+
+    def _dual_start(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray, basis: np.ndarray,
+                    is_basic: np.ndarray, factor, x_B: np.ndarray) -> np.ndarray:
+        """
+        Moves the non-basis variables whose reduced cost is not dual feasible
+        to their other bound where it is finite, so that the basis becomes
+        dual feasible at the price of primal feasibility.
+
+        Returns:
+            np.ndarray: The values of the basis variables.
+        """
+        z = self._reduced_costs(A, c, basis, factor)
+        other_bound = np.where(self._at_upper, np.isfinite(self._lower), np.isfinite(self._upper))
+        flip = self._dual_infeasible(z, is_basic) & other_bound
+        if not np.any(flip):
+            return x_B
+        self._place_nonbasic(is_basic, self._at_upper ^ flip)
+        return self._basic_values(A, b, factor)
+
+    def _run_dual_simplex(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray,
+                          basis: np.ndarray, is_basic: np.ndarray, factor, x_B: np.ndarray) -> np.ndarray:
+        """
+        Restores primal feasibility of a dual feasible basis with the dual
+        Simplex method. The leaving basis variable is chosen by dual steepest
+        edge pricing: the one whose infeasibility is largest relative to the
+        norm of its row of B^-1. The squared norms start at one, exact for
+        the slack basis, and are updated after every pivot from the row of
+        the leaving variable and one more solve with B.
+
+        A basis variable below its lower bound leaves at that bound, one
+        above its upper bound leaves at the upper bound. Fixed variables,
+        such as the slacks of equality constraints, never enter the basis.
+        An entering variable that the Harris ratio test picks although its
+        reduced cost is slightly infeasible gets its cost shifted to keep
+        the basis dual feasible. After a run of degenerate iterations, which
+        leave the dual objective unchanged, Bland's rule chooses both the
+        leaving and the entering variable by smallest index until the dual
+        objective moves again, so the method cannot cycle.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            c (np.ndarray): The objective function coefficients.
+            basis (np.ndarray): The set of basis variables, updated in place.
+            is_basic (np.ndarray): A mask of the basis variables, updated in place.
+            factor (LUFactorization | DenseInverse): The basis representation, updated in place.
+            x_B (np.ndarray): The values of the basis variables.
+
+        Returns:
+            np.ndarray: The values of the basis variables.
+        """
+        fixed = self._lower == self._upper
+        self._phase = "dual"
+        first = self.iterations
+        degenerate = 0
+        # The squared norms of the rows of B^-1
+        weights = np.ones(len(basis))
+        while True:
+            started = time.perf_counter()
+            infeasibilities = self._infeasibilities(x_B, basis)
+            if np.max(infeasibilities) <= self._feasibility_tolerance:
+                self._timed("pricing", started)
+                break
+            if self._interrupted():
+                self._timed("pricing", started)
+                break
+            bland = degenerate > DEGENERATE_ITERATIONS
+            r = int(np.argmax(np.maximum(infeasibilities, 0) ** 2 / weights))
+            if bland:
+                infeasible = np.flatnonzero(infeasibilities > self._feasibility_tolerance)
+                r = int(infeasible[np.argmin(basis[infeasible])])
+            to_lower = x_B[r] < self._lower[basis[r]]
+            delta = x_B[r] - (self._lower[basis[r]] if to_lower else self._upper[basis[r]])
+
+            z = self._reduced_costs(A, c, basis, factor)
+            e_r = np.zeros(len(basis))
+            e_r[r] = 1
+            rho = factor.btran(e_r)
+            pivot_row = A.T @ rho
+            self._timed("pricing", started)
+            started = time.perf_counter()
+            q = self._dual_ratio_test(z, -pivot_row if to_lower else pivot_row, is_basic | fixed, bland)
+            if q is None:
+                raise ValueError("The problem is infeasible.")
+            if not self._free[q] and (z[q] > 0 if self._at_upper[q] else z[q] < 0):
+                c[q] += z[q]
+                z[q] = 0
+            degenerate = degenerate + 1 if abs(z[q]) <= self._feasibility_tolerance else 0
+
+            alpha = factor.ftran(A[:, [q]].toarray().ravel())
+            self._timed("ratio_test", started)
+            started = time.perf_counter()
+            # The norm of the leaving row is recomputed exactly, since errors
+            # in the updated ones grow quickly over many pivots
+            tau = factor.ftran(rho)
+            ratio = alpha / alpha[r]
+            leaving_weight = rho @ rho
+            weights = np.maximum(weights - 2 * ratio * tau + ratio ** 2 * leaving_weight, 1e-4)
+            weights[r] = max(leaving_weight / alpha[r] ** 2, 1e-4)
+            self._timed("pricing", started)
+            x_B = self._pivot(A, b, basis, is_basic, factor, r, q, alpha, x_B, delta / alpha[r], to_lower)
+
+        self._count("dual_iterations", self.iterations - first)
+        return x_B
+
+    def _run_phase_one(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray,
+                       basis: np.ndarray, is_basic: np.ndarray, factor, x_B: np.ndarray) -> np.ndarray:
+        """
+        Makes a primal infeasible basis primal feasible with the dual Simplex
+        method. If the basis is not dual feasible either, the objective
+        coefficients of the offending non-basis variables are first shifted
+        so that their reduced costs are dual feasible; the primal Simplex
+        method then restores optimality for the original objective.
+
+        The shifted reduced costs, and those that are already zero, are set
+        to small random values of the dual feasible sign rather than to zero.
+        Without this perturbation every shifted variable would tie in the
+        dual ratio test, and the dual Simplex method stalls on long runs of
+        degenerate pivots.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            c (np.ndarray): The objective function coefficients.
+            basis (np.ndarray): The set of basis variables, updated in place.
+            is_basic (np.ndarray): A mask of the basis variables, updated in place.
+            factor (LUFactorization | DenseInverse): The basis representation, updated in place.
+            x_B (np.ndarray): The values of the basis variables.
+
+        Returns:
+            np.ndarray: The values of the basis variables.
         """
-        Solves the linear programming problem using the Simplex method.
+        z = self._reduced_costs(A, c, basis, factor)
+        movable = ~is_basic & ~self._free & (self._lower < self._upper)
+        shifted = self._dual_infeasible(z, is_basic) | (movable & (np.abs(z) <= self._tolerance))
+        margin = np.random.default_rng(0).uniform(0.5, 1, len(c)) * 1e-5 * (1 + np.abs(c))
+        margin[self._free] = 0
+        c = c + np.where(shifted, z + np.where(self._at_upper, margin, -margin), 0)
+        return self._run_dual_simplex(A, b, c, basis, is_basic, factor, x_B)
+
+    def _run_primal_simplex(self, A: sp.csc_matrix, b: np.ndarray, c: np.ndarray,
+                            basis: np.ndarray, is_basic: np.ndarray, factor, x_B: np.ndarray,
+                            pricing) -> np.ndarray:
+        """
+        Improves a primal feasible basis with the primal Simplex method until
+        no non-basis variable can improve the objective by moving away from
+        its bound.
 
         Args:
-            A (np.ndarray): The constraint matrix.
+            A (sp.csc_matrix): The constraint matrix.
             b (np.ndarray): The right-hand side vector.
             c (np.ndarray): The objective function coefficients.
+            basis (np.ndarray): The set of basis variables, updated in place.
+            is_basic (np.ndarray): A mask of the basis variables, updated in place.
+            factor (LUFactorization | DenseInverse): The basis representation, updated in place.
+            x_B (np.ndarray): The values of the basis variables.
+            pricing (DantzigPricing): The pricing rule.
+
+        Returns:
+            np.ndarray: The values of the basis variables.
+        """
+        fixed = self._lower == self._upper
+        has_fixed = np.any(fixed)
+        self._phase = "primal"
+        first = self.iterations
+        while True:
+            started = time.perf_counter()
+            y = factor.btran(c[basis])
+            j = pricing.select(y, is_basic | fixed if has_fixed else is_basic, self._at_upper, self._free)
+            self._timed("pricing", started)
+            if j is None or self._interrupted():
+                break
+
+            decreasing = self._at_upper[j] or (self._free[j] and (A[:, [j]].T @ y)[0] > c[j])
+            x_B = self._enter(A, b, basis, is_basic, factor, x_B, j, -1.0 if decreasing else 1.0, pricing)
+            if x_B is None:
+                raise ValueError("The problem is unbounded.")
+
+        self._count("primal_iterations", self.iterations - first)
+        return x_B
+
+    def _run_simplex(self, A: sp.csc_matrix, b: np.ndarray,
+                     c: np.ndarray, non_basis: np.ndarray,
+                     basis: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Solves the linear programming problem using the revised Simplex method.
+
+        Each iteration prices the non-basis columns against the simplex
+        multipliers y = B^-T c_B, computes only the entering column B^-1 a_q
+        and updates the basis representation in place of inverting B. A
+        starting basis that is primal infeasible, such as a warm-start basis
+        after a change of the right-hand side, is first repaired with the
+        dual Simplex method. An interrupted solve keeps the basis it has
+        reached, which is primal feasible if the dual Simplex method had
+        finished.
+
+        Args:
+            A (sp.csc_matrix): The constraint matrix.
+            b (np.ndarray): The right-hand side vector.
+            c (np.ndarray): The objective function coefficients to maximize.
             non_basis (np.ndarray): The set of non-basis variables.
             basis (np.ndarray): The set of basis variables.
         Returns:
-        Tuple[float, dict]: The optimal value and the optimal solution as a dictionary.
+            Tuple[float, np.ndarray]: The maximum of c^T x and the values of all variables.
         """
 
         # Initializing the variables
         n = len(non_basis) + len(basis)
+        self.iterations = 0
+        self.status = "optimal"
+        self._max_iterations = self._iteration_limit
+        if self._max_iterations is None:
+            self._max_iterations = max(1000, 10 * n)
+        self._c = c
+        slack_basis = basis.copy()
+        basis, factor, x_B = self._initial_basis(A, b, c, basis)
+        is_basic = np.zeros(n, dtype=bool)
+        is_basic[basis] = True
+        if self._start == "dual" and np.array_equal(basis, slack_basis):
+            x_B = self._dual_start(A, b, c, basis, is_basic, factor, x_B)
+        elif self._start not in ("primal", "dual"):
+            raise ValueError(f"Unknown simplex start: {self._start}")
+
+        if np.any(self._infeasibilities(x_B, basis) > self._feasibility_tolerance):
+            x_B = self._run_phase_one(A, b, c, basis, is_basic, factor, x_B)
+
+        if self.status == "optimal":
+            pricing = self._make_pricing(A, c, np.array_equal(np.sort(basis), slack_basis))
+            x_B = self._run_primal_simplex(A, b, c, basis, is_basic, factor, x_B, pricing)
+
+        x = self._store_result(A, c, basis, factor, x_B)
+        return float(c @ x), x
+
+    def _store_result(self, A: sp.csc_matrix, c: np.ndarray, basis: np.ndarray,
+                      factor, x_B: np.ndarray) -> np.ndarray:
+        """
+        Sets the `basis`, `x`, `y` and `z` attributes from a final basis and
+        keeps its factorization for sensitivity analysis. The duals and the
+        reduced costs are those of the objective in its own sense.
+
+        Returns:
+            np.ndarray: The values of all variables.
+        """
+        n = A.shape[1]
+        m = len(basis)
+        self.basis = Basis.from_indices(basis, n - m, m, self._at_upper)
+        self.x = self._value.copy()
+        self.x[basis] = x_B
+        y = factor.btran(c[basis])
+        z = A.T @ y - c
+        z[basis] = 0
+        self.y = self._sign * y
+        self.z = self._sign * z
+        self._final = (basis, factor, x_B)
+        return self.x
+
+    def _basis_inverse(self) -> np.ndarray:
+        """
+        Computes the explicit inverse of the final basis from a fresh factorization.
+        """
+        basis, factor, _ = self._final
+        factor.refactor(basis)
+        return factor.ftran(np.eye(len(basis)))
+
+    def sensitivity(self) -> Sensitivity:
+        """
+        Computes the duals, the reduced costs and the ranges over which each
+        right-hand side and each objective coefficient can vary, one at a
+        time, while the final basis stays optimal, from the factorization of
+        the final basis.
+
+        Within its range, changing a right-hand side b_i changes the optimal
+        value by y_i per unit. A non-basis variable stays at its bound while
+        its objective coefficient stays on the side of c_j + z_j that keeps
+        its reduced cost dual feasible.
+
+        Returns:
+            namedtuple[duals, reduced_costs, rhs_lower, rhs_upper, cost_lower, cost_upper]:
+                The duals and right-hand side ranges of the constraints, and the
+                reduced costs and objective coefficient ranges of the variables.
+        """
+        if self._final is None:
+            raise ValueError("The model has not been solved.")
+        A, b, c, non_basis, _ = self._matrices
+        basis, _, x_B = self._final
+        n = len(non_basis)
         m = len(basis)
-        B = A[:, basis]
-        N = A[:, non_basis]
-        B_inv = np.linalg.inv(B)
-        BN = B_inv @ N
-        x_B = B_inv @ b
-        z_N = (BN).T @ c[basis] - c[non_basis]
-        x = np.zeros((n, 1))
-        x[basis] = x_B
-        x[non_basis] = 0
-
-        for iteration in range(self._max_iterations):
-            if np.all(z_N >= self._tolerance):
+        B_inv = self._basis_inverse()
+        l_B = self._lower[basis][:, None]
+        u_B = self._upper[basis][:, None]
+        x_B = np.clip(x_B, self._lower[basis], self._upper[basis])[:, None]
+
+        # Right-hand side ranges keep every basis variable within its bounds
+        increasing = B_inv > self._tolerance
+        decreasing = B_inv < -self._tolerance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lower = np.max(np.where(increasing, (l_B - x_B) / B_inv,
+                                    np.where(decreasing, (u_B - x_B) / B_inv, -np.inf)), axis=0)
+            upper = np.min(np.where(increasing, (u_B - x_B) / B_inv,
+                                    np.where(decreasing, (l_B - x_B) / B_inv, np.inf)), axis=0)
+        rhs_lower = b + np.minimum(lower, 0)
+        rhs_upper = b + np.maximum(upper, 0)
+
+        # Objective ranges keep the reduced costs of the non-basis variables
+        # dual feasible, computed for the maximized objective c
+        z = self._sign * self.z
+        flip = np.where(self._at_upper, -1.0, 1.0)
+        cost_lower = np.full(n, -np.inf)
+        cost_upper = np.full(n, np.inf)
+        priced = ~np.isin(np.arange(n + m), basis) & (self._lower < self._upper)
+        nonbasic = np.flatnonzero(priced[:n])
+        at_upper = self._at_upper[nonbasic]
+        free = self._free[nonbasic]
+        cost_upper[nonbasic[~at_upper]] = c[nonbasic[~at_upper]] + z[nonbasic[~at_upper]]
+        cost_lower[nonbasic[at_upper | free]] = c[nonbasic[at_upper | free]] + z[nonbasic[at_upper | free]]
+        positions = np.flatnonzero(basis < n)
+        if len(positions) > 0:
+            rows = (A.T @ B_inv[positions].T).T[:, priced] * flip[priced]
+            z_N = np.maximum(flip[priced] * z[priced], 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                lower = np.max(np.where(rows > self._tolerance, -z_N / rows, -np.inf), axis=1, initial=-np.inf)
+                upper = np.min(np.where(rows < -self._tolerance, -z_N / rows, np.inf), axis=1, initial=np.inf)
+            # A free non-basis variable has a zero reduced cost that must stay zero
+            pinned = np.any(np.abs(rows[:, self._free[priced]]) > self._tolerance, axis=1)
+            lower[pinned] = 0
+            upper[pinned] = 0
+            variables = basis[positions]
+            cost_lower[variables] = c[variables] + np.minimum(lower, 0)
+            cost_upper[variables] = c[variables] + np.maximum(upper, 0)
+        if self._sign < 0:
+            cost_lower, cost_upper = -cost_upper, -cost_lower
+
+        return Sensitivity(self.y.copy(), self.z[:n].copy(), rhs_lower, rhs_upper, cost_lower, cost_upper)
+
+    def parametric_solve(self, direction: np.ndarray, t_range: Tuple[float, float] = (0.0, 1.0),
+                         target: str = "rhs") -> ParametricPath:
+        """
+        Solves the problems with the right-hand side b + t * direction, or the
+        objective coefficients c + t * direction, for t in t_range by pivoting
+        from the final basis rather than re-solving for each t.
+
+        The solver first re-optimizes for the start of the range from the
+        final basis. It then moves t towards the end of the range until a
+        basis variable reaches a bound, for a right-hand side sweep, or a
+        reduced cost reaches zero, for an objective sweep, and pivots with
+        the dual or the primal Simplex method respectively. The optimal value
+        is linear in t between these breakpoints. The sweep stops early at
+        the value of t beyond which the problem is infeasible or unbounded.
+        Afterwards the attributes of the solver describe the solution at the
+        last value of t.
+
+        Args:
+            direction (np.ndarray): The direction of the change, with one entry per
+                constraint for "rhs" or one per variable for "objective".
+            t_range (Tuple[float, float]): The start and the end of the sweep.
+                Defaults to (0.0, 1.0).
+            target (str): "rhs" or "objective". Defaults to "rhs".
+
+        Returns:
+            namedtuple[t, objectives, solutions]: The values of t at the start,
+                at each breakpoint and at the end of the sweep, the optimal values
+                there, and an optimal solution there with the values of the
+                variables followed by the slacks. For an objective sweep the
+                solution between two breakpoints is that of the later one.
+        """
+        if self._matrices is None:
+            raise ValueError("The model has not been solved.")
+        A, b, c, non_basis, slack_basis = self._matrices
+        n = len(non_basis)
+        m = len(slack_basis)
+        direction = np.asarray(direction, dtype=float)
+        t_start, t_end = map(float, t_range)
+
+        if target == "rhs":
+            if len(direction) != m:
+                raise ValueError(f"Expected a direction of length {m}, got {len(direction)}")
+            d_b, d_c = direction, np.zeros(n + m)
+        elif target == "objective":
+            if len(direction) != n:
+                raise ValueError(f"Expected a direction of length {n}, got {len(direction)}")
+            d_b, d_c = np.zeros(m), np.concatenate([self._sign * direction, np.zeros(m)])
+        else:
+            raise ValueError(f"Unknown parametric target: {target}")
+
+        self._warm_start = self.basis
+        self._run_simplex(A, b + t_start * d_b, c + t_start * d_c, non_basis, slack_basis.copy())
+        if self.status != "optimal":
+            raise ValueError(f"The parametric solve stopped with the status {self.status}.")
+        basis, factor, x_B = self._final
+        is_basic = np.zeros(n + m, dtype=bool)
+        is_basic[basis] = True
+        fixed = self._lower == self._upper
+        sign = 1.0 if t_end >= t_start else -1.0
+        self._phase = "parametric"
+
+        t = t_start
+        path = []
+        while True:
+            c_t = c + t * d_c
+            x = self._value.copy()
+            x[basis] = x_B
+            if not path or path[-1][0] != t:
+                path.append((t, self._sign * (c_t @ x) + self._objective_constant, x))
+            if t == t_end:
                 break
+            if self.iterations >= self._max_iterations:
+                raise ValueError("The parametric solve did not finish within max_iterations.")
 
-            j = np.argmin(z_N)
+            if target == "rhs":
+                # The basis variables move along B^-1 d as t changes
+                rate = sign * factor.ftran(d_b)
+                l_B, u_B = self._lower[basis], self._upper[basis]
+                decreasing = (rate < -self._tolerance) & np.isfinite(l_B)
+                increasing = (rate > self._tolerance) & np.isfinite(u_B)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    steps = np.where(decreasing, np.maximum(x_B - l_B, 0) / -rate,
+                                     np.where(increasing, np.maximum(u_B - x_B, 0) / rate, np.inf))
+            else:
+                # The reduced costs move along A^T B^-T d_B - d as t changes,
+                # oriented so that a negative value improves the objective
+                rate = sign * (A.T @ factor.btran(d_c[basis]) - d_c)
+                z = self._reduced_costs(A, c_t, basis, factor)
+                flip = np.where(self._at_upper, -1.0, 1.0)
+                z, oriented = flip * z, flip * rate
+                z[self._free] = 0
+                oriented[self._free] = -np.abs(rate[self._free])
+                decreasing = (oriented < -self._tolerance) & ~is_basic & ~fixed
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    steps = np.where(decreasing, np.maximum(z, 0) / -oriented, np.inf)
 
-            delta_x_B = BN[:, j]
+            k = int(np.argmin(steps)) if len(steps) > 0 else -1
+            if k < 0 or steps[k] >= abs(t_end - t):
+                if target == "rhs":
+                    x_B = x_B + abs(t_end - t) * rate
+                t = t_end
+                continue
 
-            if np.all(delta_x_B <= self._tolerance):
-                raise ValueError("The problem is unbounded.")
+            # Record the breakpoint before pivoting to the basis that is optimal beyond it
+            t = t + sign * steps[k]
+            if target == "rhs":
+                x_B = x_B + steps[k] * rate
+            x = self._value.copy()
+            x[basis] = x_B
+            path.append((t, self._sign * ((c + t * d_c) @ x) + self._objective_constant, x))
+
+            if target == "rhs":
+                to_lower = rate[k] < 0
+                pivot_row = self._pivot_row(A, factor, k)
+                q = self._dual_ratio_test(self._reduced_costs(A, c, basis, factor),
+                                          -pivot_row if to_lower else pivot_row, is_basic | fixed)
+                if q is None:
+                    break
+                alpha = factor.ftran(A[:, [q]].toarray().ravel())
+                delta = x_B[k] - (self._lower[basis[k]] if to_lower else self._upper[basis[k]])
+                x_B = self._pivot(A, b + t * d_b, basis, is_basic, factor, k, q, alpha, x_B,
+                                  delta / alpha[k], to_lower)
+            else:
+                decreasing = self._at_upper[k] or (self._free[k] and rate[k] > 0)
+                x_B = self._enter(A, b, basis, is_basic, factor, x_B, k, -1.0 if decreasing else 1.0)
+                if x_B is None:
+                    break
 
-            step_lengths = np.array([x_B[i] / delta_x_B[i] if delta_x_B[i] > 0 else np.inf for i in range(m)])
-            i = np.argmin(step_lengths)
-            t = step_lengths[i]
-
-            delta_z_N = -(BN).T[:, i]
-            s = z_N[j] / delta_z_N[j]
-
-            # Update primal and dual solution
-            x[non_basis[j]] = t  
-            x[basis] -= (t * delta_x_B).reshape(-1, 1)  
-            x[basis[i]] = 0  
-
-            entering_var = non_basis[j]
-            leaving_var = basis[i]
-            basis[i] = entering_var
-            non_basis[j] = leaving_var
-
-            B = A[:, basis]
-            N = A[:, non_basis]
-            B_inv = np.linalg.inv(B)
-            BN = B_inv @ N
-            x_B = B_inv @ b
-            z_N = (BN).T @ c[basis] - c[non_basis]
-
-        optimal_value = c.T @ x
-        optimal_solution = {f"x{i+1}": x[i, 0] for i in range(n)}
-        return float(optimal_value), optimal_solution
+        self._store_result(A, c + t * d_c, basis, factor, x_B)
+        t_values, objectives, solutions = zip(*path)
+        return ParametricPath(np.array(t_values), np.array(objectives), np.array(solutions))
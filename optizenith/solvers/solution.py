@@ -0,0 +1,139 @@
+from .basis import Basis
+
+import numpy as np
+from collections.abc import Mapping
+from typing import Iterator, Optional, Sequence
+
+
+class Solution(Mapping):
+    """
+    Holds the result of a solve as NumPy arrays.
+
+    Values are looked up lazily rather than copied into a dictionary. A
+    solution can be indexed with a Variable of the solved model, with the
+    name of a variable, or with the positional names x1, x2, ... that number
+    the variables followed by the slacks of the constraints. Iterating over
+    a solution yields the positional names, so it reads like the dictionary
+    the solvers used to return; to_dict() maps the names of the variables
+    to their values.
+
+    Attributes:
+        objective (float): The optimal value.
+        x (np.ndarray): The values of the variables.
+        slacks (np.ndarray): The values of the slacks of the constraints.
+        duals (np.ndarray): The duals of the constraints, or None.
+        reduced_costs (np.ndarray): The reduced costs z = A^T y - c of the variables, or None.
+        status (str): The status of the solve: "optimal", "iteration_limit",
+            "time_limit" or "cancelled" for a solve stopped early, with the point
+            and the basis reached by then, or "node_limit" for a mixed integer
+            program.
+        iterations (int): The number of iterations of the solver.
+        time (float): The time taken by the solve in seconds.
+        basis (Basis): The final basis, or None.
+        presolve (PresolveReport): What presolve removed, or None.
+        names (np.ndarray): The names of the variables, None for unnamed ones, or None.
+        mip (MIPReport): The nodes, best bound, gap and progress log of a
+            branch-and-bound solve, or None.
+        profile (SolveProfile): The seconds spent and the counts of the work
+            done in each phase of the solve, or None.
+    """
+
+    def __init__(self, objective: float, x: np.ndarray, slacks: np.ndarray,
+                 duals: Optional[np.ndarray] = None, reduced_costs: Optional[np.ndarray] = None,
+                 status: str = "optimal", iterations: int = 0, time: float = 0.0,
+                 basis: Optional[Basis] = None, presolve: Optional[tuple] = None,
+                 names: Optional[Sequence[str]] = None, mip: Optional[tuple] = None,
+                 profile: Optional[tuple] = None):
+        """
+        Initializes a new Solution instance.
+
+        Args:
+            objective (float): The optimal value.
+            x (np.ndarray): The values of the variables.
+            slacks (np.ndarray): The values of the slacks of the constraints.
+            duals (np.ndarray): The duals of the constraints. Defaults to None.
+            reduced_costs (np.ndarray): The reduced costs of the variables. Defaults to None.
+            status (str): The status of the solve. Defaults to "optimal".
+            iterations (int): The number of iterations. Defaults to 0.
+            time (float): The time taken by the solve in seconds. Defaults to 0.0.
+            basis (Basis): The final basis. Defaults to None.
+            presolve (PresolveReport): What presolve removed. Defaults to None.
+            names (Sequence[str]): The names of the variables, None for unnamed
+                ones. Defaults to None.
+            mip (MIPReport): The report of a branch-and-bound solve. Defaults to None.
+            profile (SolveProfile): The timings and counters of the solve. Defaults to None.
+        """
+        self.objective = float(objective)
+        self.x = x
+        self.slacks = slacks
+        self.duals = duals
+        self.reduced_costs = reduced_costs
+        self.status = status
+        self.iterations = iterations
+        self.time = time
+        self.basis = basis
+        self.presolve = presolve
+        self.names = names
+        self.mip = mip
+        self.profile = profile
+        self._index_of = None
+
+    @property
+    def solution(self) -> "Solution":
+        """
+        The solution itself, for code written against the named tuple that
+        Model.solve used to return.
+        """
+        return self
+
+    def _position(self, key) -> int:
+        """
+        Returns the position among the variables and slacks of a Variable, a
+        variable name or a positional name.
+        """
+        if hasattr(key, "_index"):
+            return key._index
+        if not isinstance(key, str):
+            raise KeyError(key)
+        if self.names is not None:
+            if self._index_of is None:
+                self._index_of = {name: j for j, name in enumerate(self.names) if name is not None}
+            if key in self._index_of:
+                return self._index_of[key]
+        if key[:1] == "x" and key[1:].isdigit() and 0 < int(key[1:]) <= len(self):
+            return int(key[1:]) - 1
+        raise KeyError(key)
+
+    def __getitem__(self, key) -> float:
+        j = self._position(key)
+        n = len(self.x)
+        return float(self.x[j] if j < n else self.slacks[j - n])
+
+    def __contains__(self, key) -> bool:
+        try:
+            self._position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"x{i+1}" for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.x) + len(self.slacks)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the values of the variables keyed by their names, with
+        unnamed variables named by position.
+
+        Returns:
+            dict: The values of the variables.
+        """
+        names = self.names if self.names is not None else [None] * len(self.x)
+        return {f"x{j+1}" if name is None else name: value
+                for j, (name, value) in enumerate(zip(names, self.x.tolist()))}
+
+    def __repr__(self) -> str:
+        return (f"Solution({self.status}, objective={self.objective:g}, {len(self.x)} variables, "
+                f"{len(self.slacks)} constraints, {self.iterations} iterations)")
@@ -14,7 +14,7 @@ setup(
         "optizenith.examples",
         "optizenith.solvers",
         ],
-    install_requires=["numpy", "matplotlib"],
+    install_requires=["numpy", "scipy", "matplotlib"],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Students",
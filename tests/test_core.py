@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+import numpy as np
 from optizenith import *
 
 class TestCore(unittest.TestCase):
@@ -38,6 +41,71 @@ class TestCore(unittest.TestCase):
         self.assertEqual(expr3[y], 8)
         self.assertEqual(expr3[z], 12)
     
+    def test_linear_expr_arithmetic(self):
+        x = Variable("x")
+        y = Variable("y")
+        expr = 2 * x + y - 3
+        self.assertEqual(expr.variables, [x, y])
+        self.assertEqual(expr.coefficients, [2, 1])
+        self.assertEqual(expr.constant, -3)
+        expr2 = 1 - expr
+        self.assertEqual(expr2[x], -2)
+        self.assertEqual(expr2[y], -1)
+        self.assertEqual(expr2.constant, 4)
+        self.assertEqual(expr[x], 2)
+
+        expr3 = LinearExpr.from_constant(5)
+        self.assertEqual(len(expr3), 0)
+        self.assertEqual(expr3.constant, 5)
+
+        expr4 = expr + x
+        expr.add_term(x, 10)
+        expr[y] = 7
+        self.assertEqual(expr4[x], 3)
+        self.assertEqual(expr4[y], 1)
+        self.assertEqual(expr[x], 12)
+
+        variables = [Variable(f"x{i}") for i in range(100)]
+        total = sum(i * variable for i, variable in enumerate(variables))
+        self.assertEqual(len(total), 100)
+        self.assertEqual(total[variables[42]], 42)
+
+    def test_linear_expr_in_place(self):
+        x = Variable("x")
+        y = Variable("y")
+        expr = LinearExpr([x], [1])
+        other = expr + y
+        same = expr
+        expr += 2 * y
+        expr -= x
+        expr += 3
+        self.assertIs(expr, same)
+        self.assertEqual(expr[x], 0)
+        self.assertEqual(expr[y], 2)
+        self.assertEqual(expr.constant, 3)
+        self.assertEqual(other[x], 1)
+        self.assertEqual(other[y], 1)
+
+        total = quicksum([x, 2 * y, 3, x - y])
+        self.assertEqual(total[x], 2)
+        self.assertEqual(total[y], 1)
+        self.assertEqual(total.constant, 3)
+
+    def test_linear_expr_from_arrays(self):
+        model = Model("test")
+        x = [model.add_variable(f"x{j}") for j in range(4)]
+        expr = LinearExpr.from_arrays(np.array([0, 2, 0]), np.array([1.0, 2.0, 3.0]), model)
+        model.add_constraint(expr + x[3], "<=", 1)
+        model.add_constraint(quicksum([expr, -1 * expr, x[1]]), "<=", 2)
+        model.set_objective(2 * expr, "max")
+        form = model.to_matrix_form()
+        self.assertEqual(form.A.toarray().tolist(), [[4, 0, 2, 1], [0, 1, 0, 0]])
+        self.assertEqual(form.c.tolist(), [8, 0, 4, 0])
+        self.assertEqual(expr[x[0]], 4)
+        self.assertEqual(expr.variables, [x[0], x[2]])
+        with self.assertRaises(ValueError):
+            LinearExpr.from_arrays([0, 1], [1.0], model)
+
     def test_constrain(self):
         x = Variable("x")
         y = Variable("y")
@@ -80,5 +148,287 @@ class TestCore(unittest.TestCase):
         self.assertEqual(model.objective.expression, expr2)
         self.assertEqual(model.objective.sense, "max")
 
+    def test_model_variable_storage(self):
+        model = Model("test")
+        x = model.add_variable("x", 1, 5)
+        block = model.add_variables(3, lb=np.array([0, 1, 2]), ub=10, name="y")
+        self.assertEqual(len(model.variables), 4)
+        self.assertEqual(model.variables[0], x)
+        self.assertEqual(hash(model.variables[0]), hash(x))
+        self.assertNotEqual(model.variables[1], x)
+        self.assertEqual(block[1].name, "y[1]")
+        self.assertEqual(block[2].lb, 2)
+        self.assertEqual(block[-1].ub, 10)
+        self.assertIn(block[0], model.variables)
+        self.assertNotIn(x, block)
+        self.assertEqual(model.add_variables(1)[0].name, "x5")
+
+        block[0].ub = 3
+        block.lb = 4
+        x.name = "z"
+        x.var_type = "integer"
+        self.assertEqual(model.variables[1].ub, 3)
+        self.assertEqual(model.variables[3].lb, 4)
+        self.assertEqual(model.variables[0].name, "z")
+        self.assertEqual(model.variables[0].var_type, "integer")
+        self.assertEqual(block.indices.tolist(), [1, 2, 3])
+        with self.assertRaises(AttributeError):
+            x.foo = 1
+        with self.assertRaises(ValueError):
+            model.add_variable("w", var_type="semicontinuous")
+
+        expr = block.dot(np.array([1.0, 2.0, 3.0])) + x
+        self.assertEqual(expr[block[2]], 3)
+        self.assertEqual(expr[model.variables[0]], 1)
+
+    def test_matrix_form(self):
+        model = Model("test")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        z = model.add_variable("z")
+        model.add_constraint(LinearExpr([z, x], [3, 1]), "<=", 4)
+        model.add_constraint(LinearExpr([y], [2]), "<=", 5)
+        model.set_objective(LinearExpr([y, x], [1, 2]), "max")
+        model.objective.expression += 7
+        form = model.to_matrix_form()
+        self.assertEqual(form.objective_constant, 7)
+        self.assertEqual(form.shape, (2, 3))
+        self.assertEqual(form.A.nnz, 3)
+        self.assertEqual(form.A.toarray().tolist(), [[1, 0, 3], [0, 2, 0]])
+        self.assertEqual(form.b.tolist(), [4, 5])
+        self.assertEqual(form.c.tolist(), [2, 1, 0])
+
+    def test_incremental_modification(self):
+        model = Model("incremental")
+        x = model.add_variables(3, 0, 10)
+        c1 = model.add_constraint(x[0] + x[1] + 1, "<=", 5)
+        c2 = model.add_constraint(x[1] + 2 * x[2], "<=", 8)
+        model.set_objective(x.dot(np.array([1.0, 1.0, 1.0])), "max")
+        self.assertIsNone(c1.index)
+        self.assertEqual(model.solve().objective, 8)
+        # Assembly moved the rows into the store, which keeps the constant on the right-hand side
+        self.assertEqual((c1.index, c2.index, c1.rhs, c1.expression.constant), (0, 1, 5, 1))
+        self.assertEqual(model.to_matrix_form().b.tolist(), [4, 8])
+
+        model.set_rhs(c1, 6)
+        model.set_coefficient(c2, x[0], 1.0)
+        model.set_coefficient(c2, x[2], 0)
+        model.set_bounds(x[2], ub=3)
+        c3 = model.add_constraint(x[0] - x[2], ">=", 1)
+        model.add_variable("w", 0, 2)
+        form = model.to_matrix_form()
+        self.assertEqual(form.A.toarray().tolist(), [[1, 1, 0, 0], [1, 1, 0, 0], [1, 0, -1, 0]])
+        self.assertEqual(form.b.tolist(), [5, 8, 1])
+        self.assertEqual(form.ub[2], 3)
+        self.assertEqual(c3.index, 2)
+
+        model.remove_constraint(c2)
+        self.assertEqual((c2.index, c3.index), (None, 1))
+        self.assertEqual(str(c2), str(x[1] + x[0]) + " <= 8")
+        with self.assertRaises(ValueError):
+            model.remove_constraint(c2)
+        model.constraints[0].expression = x[0] + 2 * x[1]
+        form = model.to_matrix_form()
+        self.assertEqual(form.A.toarray().tolist(), [[1, 2, 0, 0], [1, 0, -1, 0]])
+        self.assertEqual(form.b.tolist(), [6, 1])
+        self.assertEqual(model.solve().objective, 6 + 3)
+
+        model.add_constraint(LinearExpr([Variable("w")], [1]), "<=", 1)
+        with self.assertRaises(ValueError):
+            model.to_matrix_form()
+
+    def test_constraint_expression_changes(self):
+        model = Model("changes")
+        x = model.add_variables(3, 0, 10)
+        e = x[0] + x[1] + 1
+        c1 = model.add_constraint(e, "<=", 5)
+        c2 = model.add_constraint(x[2] <= 2)
+        model.set_objective(x.dot(np.ones(3)), "max")
+        self.assertEqual(model.solve().objective, 6)
+
+        # Changes to the expression passed in and to the one read back reach the row
+        e.add_term(x[1], 1)
+        self.assertIs(c1.expression, e)
+        self.assertEqual(model.to_matrix_form().A.toarray().tolist(), [[1, 2, 0], [0, 0, 1]])
+        c2.expression.add_term(x[0], 1)
+        e.constant = 2
+        form = model.to_matrix_form()
+        self.assertEqual(form.A.toarray().tolist(), [[1, 2, 0], [1, 0, 1]])
+        self.assertEqual((form.b.tolist(), c1.rhs), ([3, 2], 5))
+        self.assertEqual(model.solve().objective, 3.5)
+
+        # Rows added in bulk build their expression once and follow it
+        rows = model.add_constraints_from_matrix(np.array([[1.0, 1.0, 1.0]]), "<=", 4, x)
+        rows[0].expression[x[1]] = 0
+        rows[0].expression += 1
+        model.set_rhs(rows[0], 6)
+        form = model.to_matrix_form()
+        self.assertEqual((form.A.toarray()[2].tolist(), form.b[2], rows[0].rhs), ([1, 0, 1], 5, 6))
+
+        c1.expression = x[0] + 2
+        self.assertEqual(model.to_matrix_form().b.tolist(), [3, 2, 5])
+        e.add_term(x[2], 1)
+        self.assertEqual(model.to_matrix_form().A.toarray()[0].tolist(), [1, 0, 0])
+
+    def test_matrix_constraints(self):
+        import scipy.sparse as sp
+        model = Model("matrix")
+        x = model.add_variables(3, 0, 10)
+        A = np.array([[1.0, 0.0, 2.0], [0.0, 1.0, 1.0]])
+        c1 = model.add_constraint(x[0] + 2 * x[1] <= 4 + x[2], name="c1")
+        c2 = model.add_constraint(3 >= x[1])
+        rows = model.add_constraint(A @ x + 1 <= np.array([9.0, 7.0]))
+        model.add_constraints(sp.csr_matrix(A) @ x >= A @ x - 1, names=["d1", "d2"])
+        model.add_constraints_from_matrix(sp.csr_matrix([[1.0, 1.0]]), ["="], 5, x[1:3])
+        model.add_constraint(model.variables[0] + model.variables[1] == 1.5 * model.variables[2])
+        self.assertEqual((c1.name, c2.rhs, len(rows), rows[1].index), ("c1", 3, 2, 3))
+        self.assertEqual(model.constraints[5].name, "d2")
+
+        form = model.to_matrix_form()
+        self.assertEqual(form.A.toarray().tolist(), [[1, 2, -1], [0, 1, 0], [1, 0, 2], [0, 1, 1], [0, 0, 0],
+                                                     [0, 0, 0], [0, 1, 1], [1, 1, -1.5]])
+        self.assertEqual(form.b.tolist(), [4, 3, 8, 6, -1, -1, 5, 0])
+        self.assertEqual(form.senses.tolist(), ["<=", "<=", "<=", "<=", ">=", ">=", "=", "="])
+        self.assertIsInstance(np.ones(3) @ x, LinearExpr)
+        self.assertTrue(x[0] == x[0])
+        self.assertFalse(x[0] == x[1])
+        self.assertEqual(((x[0] == 3).constrain_type, (x[0] == 3).rhs), ("=", 3))
+        self.assertIsInstance(x[0] == x[1] + 1, Constraint)
+        with self.assertRaises(TypeError):
+            bool(x[0] + 1 <= x[1])
+        with self.assertRaises(TypeError):
+            bool(A @ x <= 1)
+
+        with self.assertRaises(ValueError):
+            model.add_constraints_from_matrix(A, "<", 1)
+        with self.assertRaises(ValueError):
+            model.add_constraints_from_matrix(A, "<=", 1, x[0:2])
+        with self.assertRaises(ValueError):
+            Model().add_constraints(A @ x <= 1)
+        with self.assertRaises(ValueError):
+            model.add_constraint(x[0] + x[1], "<=")
+        with self.assertRaisesRegex(ValueError, "x - y == 0"):
+            model.add_constraint(x[0] == x[1])
+
+    def test_presolve(self):
+        from optizenith.core.presolve import Presolve
+        model = Model("test")
+        x = model.add_variables(4)
+        model.variables[3].lb = model.variables[3].ub = 2
+        model.add_constraint(x[0] + x[1] + x[3], "<=", 6)
+        model.add_constraint(2 * x[0] + 2 * x[1] + 2 * x[3], "<=", 10)
+        model.add_constraint(LinearExpr(), "<=", 1)
+        model.add_constraint(3 * x[1], "<=", 3)
+        model.add_constraint(x[0] + x[2], "<=", 4)
+        model.set_objective(x[0] + 2 * x[1] - x[2] + x[3], "max")
+
+        presolved = Presolve(model.to_matrix_form())
+        # The merged row x0 + x1 <= 3 remains, with the bounds x0 <= 4 and x1 <= 1
+        self.assertEqual(presolved.report.rows, 4)
+        self.assertEqual(presolved.report.columns, 2)
+        self.assertEqual(presolved.form.shape, (1, 2))
+        self.assertEqual(presolved.form.ub.tolist(), [4, 1])
+        self.assertEqual(presolved.form.objective_constant, 2)
+        x_full = presolved.postsolve(np.array([2.0, 1.0]))
+        self.assertEqual(x_full.tolist(), [2, 1, 0, 2])
+
+        y = presolved.postsolve_dual(np.array([1.0]), x_full)
+        self.assertEqual(y.tolist(), [0, 0.5, 0, 1 / 3, 0])
+
+        infeasible = Model("infeasible")
+        infeasible.add_variables(1)
+        infeasible.add_constraint(LinearExpr(), ">=", 1)
+        with self.assertRaises(ValueError):
+            Presolve(infeasible.to_matrix_form())
+
+    def test_file_formats(self):
+        model = Model("files")
+        x = model.add_variable("x", 0, 4)
+        y = model.add_variable("y", -np.inf, np.inf)
+        z = model.add_variable("z", 1, 3, "integer")
+        model.add_constraint(x + 2 * y + z, "<=", 10, name="cap")
+        model.add_constraint(x - y, ">=", -2)
+        model.add_constraint(y + z, "=", 3)
+        model.set_objective(3 * x + y + 2 * z + 5, "max")
+        expected = model.solve().objective
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("model.mps", "model.mps.gz", "model.lp", "model.lp.gz"):
+                path = os.path.join(directory, name)
+                if ".mps" in name:
+                    model.write_mps(path)
+                    copy = Model.read_mps(path)
+                else:
+                    model.write_lp(path)
+                    copy = Model.read_lp(path)
+                self.assertEqual([c.name for c in copy.constraints], ["cap", "c2", "c3"])
+                self.assertEqual([c.constrain_type for c in copy.constraints], ["<=", ">=", "="])
+                self.assertEqual(copy.variables[1].lb, -np.inf)
+                self.assertEqual(copy.variables[2].var_type, "integer")
+                self.assertAlmostEqual(copy.solve().objective, expected)
+
+            # Variables keep their order, also those outside the objective or without bounds
+            order = Model("order")
+            a, b, c = order.add_variable("a", -np.inf, np.inf), order.add_variable("b"), order.add_variable("c", 0, 5)
+            order.add_constraint(c + b, "<=", 4)
+            order.add_constraint(a - c, ">=", -1)
+            order.set_objective(2 * c + 0, "max")
+            path = os.path.join(directory, "order.lp")
+            order.write_lp(path)
+            self.assertEqual([v.name for v in Model.read_lp(path).variables], ["a", "b", "c"])
+
+            path = os.path.join(directory, "ranges.mps")
+            with open(path, "w") as file:
+                file.write("NAME ranges\nROWS\n N cost\n L r1\n E r2\nCOLUMNS\n"
+                           "    a cost 1 r1 1\n    a r2 1\n"
+                           "    MARKER 'MARKER' 'INTORG'\n    b cost 1 r1 1\n    MARKER 'MARKER' 'INTEND'\n"
+                           "RHS\n    RHS r1 8 r2 2\nRANGES\n    RNG r1 5 r2 -1\nBOUNDS\n UP BND a -1\nENDATA\n")
+            model = Model.read_mps(path)
+            self.assertEqual(model.name, "ranges")
+            self.assertEqual(model.variables[0].lb, -np.inf)
+            self.assertEqual(model.variables[1].var_type, "integer")
+            # 3 <= a + b <= 8 and 1 <= a <= 2 are read as ranged rows
+            ranged = [(c.name, c.constrain_type, c.rhs, c.rhs_range) for c in model.constraints]
+            self.assertEqual(ranged, [("r1", "<=", 8, 5), ("r2", "<=", 2, 1)])
+            self.assertEqual(str(model.constraints[0].expression), str(model.variables[0] + model.variables[1]))
+            for name, write, read in (("copy.mps", Model.write_mps, Model.read_mps),
+                                      ("copy.lp", Model.write_lp, Model.read_lp)):
+                write(model, os.path.join(directory, name))
+                copy = read(os.path.join(directory, name))
+                self.assertEqual([(c.name, c.constrain_type, c.rhs, c.rhs_range) for c in copy.constraints], ranged)
+
+    def test_snapshot(self):
+        model = Model("snapshot")
+        x = model.add_variable("x", 0, 4)
+        y = model.add_variable("y", -np.inf, np.inf)
+        z = model.add_variable("z", 1, 3, "integer")
+        model.add_constraint(x + 2 * y + z, "<=", 10, name="cap")
+        model.add_constraint(x - y, ">=", -2)
+        model.add_constraint(y + z, "=", 3)
+        model.set_objective(3 * x + y + 2 * z + 5, "max")
+        expected = model.solve().objective
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "model.ozm")
+            model.save(path)
+            for mmap in (True, False):
+                copy = Model.load(path, mmap=mmap)
+                self.assertEqual(copy.name, "snapshot")
+                self.assertEqual([c.name for c in copy.constraints], ["cap", None, None])
+                self.assertEqual([(str(c.expression), c.rhs) for c in copy.constraints],
+                                 [(str(c.expression), c.rhs) for c in model.constraints])
+                self.assertEqual(copy.variables[2].var_type, "integer")
+                self.assertAlmostEqual(copy.solve().objective, expected)
+                # Changes stay in memory and the model can grow
+                copy.constraints[0].rhs = 4
+                copy.add_variable("w")
+                self.assertEqual(Model.load(path).constraints[0].rhs, 10)
+            del copy
+
+            with open(path, "wb") as file:
+                file.write(b"not a snapshot")
+            with self.assertRaises(ValueError):
+                Model.load(path)
+
 if __name__ == "__main__":
     unittest.main()
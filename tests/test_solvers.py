@@ -1,7 +1,54 @@
 from optizenith import *
 from optizenith.solvers import *
+from optizenith.core.matrix_form import MatrixForm
 
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import numpy as np
 import unittest
+from importlib.metadata import EntryPoint
+from unittest import mock
+
+from optizenith.solvers import registry
+
+
+def random_model(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(n / 4, n / 2, m)
+    c = rng.uniform(1, 2, n)
+    model = Model("Random")
+    x = [model.add_variable(f"x{j+1}") for j in range(n)]
+    for i in range(m):
+        model.add_constraint(LinearExpr(list(x), list(A[i])), "<=", b[i])
+    model.objective = Objective(LinearExpr(list(x), list(c)), "max")
+    return model
+
+def mixed_model(seed, m=30, n=40):
+    import scipy.sparse as sp
+    rng = np.random.default_rng(seed)
+    A = sp.random(m, n, density=0.15, random_state=rng).toarray() * rng.choice([-1, 1], (m, n)) * 3
+    x0 = rng.uniform(-2, 4, n)
+    # Boxed, lower bounded, upper bounded, free and fixed variables around a feasible point
+    kind = rng.integers(0, 5, n)
+    lb = np.where(kind < 2, x0 - rng.uniform(0, 3, n), np.where(kind == 4, x0, -np.inf))
+    ub = np.where((kind == 0) | (kind == 2), x0 + rng.uniform(0, 3, n), np.where(kind == 4, x0, np.inf))
+    senses = rng.choice(["<=", ">=", "="], m, p=[0.4, 0.4, 0.2])
+    slack = rng.uniform(0, 2, m) * (rng.uniform(size=m) < 0.5)
+    rhs = A @ x0 + np.select([senses == "<=", senses == ">="], [slack, -slack], 0)
+    model = Model(f"mixed_{seed}")
+    x = model.add_variables(n, lb, ub)
+    rows = model.add_constraints_from_matrix(A, list(senses), rhs, x)
+    for i in np.flatnonzero((senses != "=") & (rng.uniform(size=m) < 0.4)):
+        rows[i].rhs_range = rng.uniform(0, 5)
+    model.set_objective(x.dot(A.T @ rng.uniform(-1, 1, m) + rng.uniform(-1, 1, n) * (kind == 0)), "min")
+    return model
 
 class TestSolvers(unittest.TestCase):
 
@@ -61,6 +108,482 @@ class TestSolvers(unittest.TestCase):
         self.assertAlmostEqual(sol["x3"], 0.0)
         self.assertAlmostEqual(sol["x1"], 3.4)
 
+    def test_simplex_revised_matches_dense(self):
+        model = random_model(30, 40)
+        dense_obj, dense_sol = SimplexSolver(model, method="dense").solve()
+        for frequency in (1, 5, 50):
+            solver = SimplexSolver(model, method="revised", refactor_frequency=frequency)
+            obj, sol = solver.solve()
+            self.assertAlmostEqual(obj, dense_obj)
+            for name in dense_sol:
+                self.assertAlmostEqual(sol[name], dense_sol[name])
+
+    def test_simplex_pricing_rules(self):
+        model = random_model(40, 60, seed=1)
+        reference, _ = SimplexSolver(model, pricing="dantzig").solve()
+        for rule in ("partial", "devex", "steepest-edge"):
+            obj, _ = SimplexSolver(model, pricing=rule).solve()
+            self.assertAlmostEqual(obj, reference)
+        with self.assertRaises(ValueError):
+            SimplexSolver(model, pricing="random").solve()
+
+    def test_simplex_degenerate(self):
+        # Precedence rows with a zero right-hand side make every vertex degenerate
+        model = Model("Degenerate")
+        x = model.add_variables(6)
+        for j in range(6):
+            model.add_constraint(1 * x[j], "<=", 1)
+        for i, j in [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (0, 5)]:
+            model.add_constraint(x[i] - x[j], "<=", 0)
+        model.add_constraint(x.dot(np.array([1, 2, 3, 1, 2, 3])), "<=", 6)
+        model.objective = Objective(x.dot(np.array([6, 5, 4, 3, 2, 1])), "max")
+        for rule in ("dantzig", "partial", "devex", "steepest-edge"):
+            obj, _ = SimplexSolver(model, pricing=rule).solve()
+            self.assertAlmostEqual(obj, 21 / 2)
+
+    def test_simplex_phase_one(self):
+        # A quarter ">=" and a tenth "=" rows leave the slack basis far from feasible
+        import scipy.sparse as sp
+        rng = np.random.default_rng(0)
+        m, n = 200, 300
+        A = sp.random(m, n, density=0.05, random_state=rng, data_rvs=rng.standard_normal).toarray()
+        u = rng.uniform(size=m)
+        senses = np.where(u < 0.25, ">=", np.where(u < 0.35, "=", "<="))
+        x0 = rng.uniform(0, 1, n)
+        slack = rng.uniform(0, 1, m)
+        rhs = A @ x0 + np.select([senses == "<=", senses == ">="], [slack, -slack], 0)
+        model = Model("Phase one")
+        x = model.add_variables(n, 0, 10)
+        model.add_constraints_from_matrix(A, list(senses), rhs, x)
+        model.set_objective(x.dot(rng.standard_normal(n)), "min")
+        reference = model.solve(solver="interior-point")
+        for solver in ("simplex", "dual-simplex"):
+            result = model.solve(solver=solver, warm_start=False)
+            self.assertEqual(result.status, "optimal")
+            self.assertAlmostEqual(result.objective, reference.objective, places=5)
+
+    def test_simplex_warm_start(self):
+        model = random_model(30, 40)
+        cold = SimplexSolver(model)
+        cold.solve()
+        basis = cold.basis
+        self.assertEqual(int(np.sum(basis.variable_status == 1) + np.sum(basis.constraint_status == 1)), 30)
+
+        # Tightening right-hand sides makes the old basis primal infeasible
+        for constraint in model.constraints[::3]:
+            constraint.rhs *= 0.8
+        reference, _ = SimplexSolver(model).solve()
+        warm = SimplexSolver(model, warm_start=basis)
+        obj, _ = warm.solve()
+        self.assertAlmostEqual(obj, reference)
+        self.assertLess(warm.iterations, cold.iterations)
+
+        # A new constraint gets a basic slack in the old basis
+        model.add_constraint(model.variables.dot(np.ones(40)), "<=", 1)
+        reference, _ = SimplexSolver(model).solve()
+        obj, _ = SimplexSolver(model, warm_start=warm.basis).solve()
+        self.assertAlmostEqual(obj, reference)
+
+    def test_model_solve_warm_start(self):
+        model = random_model(10, 10)
+        first = model.solve()
+        self.assertIsNotNone(first.basis)
+        model.constraints[0].rhs += 1
+        warm = model.solve()
+        cold = model.solve(warm_start=False)
+        self.assertAlmostEqual(warm.objective, cold.objective)
+        self.assertAlmostEqual(model.solve(warm_start=first.basis).objective, cold.objective)
+
+    def test_simplex_warm_start_infeasible(self):
+        model = Model("Infeasible")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        model.objective = Objective(x + y, "max")
+        model.add_constraint(x + y, "<=", 2)
+        result = model.solve()
+        model.constraints[0].rhs = -1
+        with self.assertRaises(ValueError):
+            model.solve(warm_start=result.basis)
+
+    def test_dual_simplex(self):
+        model = Model("Diet")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        model.objective = Objective(-2 * x - 3 * y, "max")
+        model.add_constraint(x + y, ">=", 4)
+        model.add_constraint(x + 3 * y, ">=", 6)
+        obj, sol = DualSimplexSolver(model).solve()
+        self.assertAlmostEqual(obj, -9)
+        self.assertAlmostEqual(sol["x1"], 3)
+        self.assertAlmostEqual(sol["x2"], 1)
+
+        model.add_constraint(x - 3 * y, "=", 0)
+        result = model.solve(solver="dual-simplex")
+        self.assertAlmostEqual(result.objective, -9)
+        model.constraints[2].rhs = 2
+        self.assertAlmostEqual(model.solve(solver="dual-simplex").objective, -10)
+
+        model.add_constraint(x + y, "<=", 3)
+        with self.assertRaises(ValueError):
+            model.solve(solver="dual-simplex")
+
+        # A cold start puts boxed variables at the bound their cost favours
+        boxed = random_model(10, 15)
+        boxed.set_bounds(boxed.variables, ub=5)
+        primal, dual = SimplexSolver(boxed), DualSimplexSolver(boxed)
+        self.assertAlmostEqual(dual.solve()[0], primal.solve()[0])
+        self.assertEqual(dual.profile.counters["primal_iterations"], 0)
+        self.assertGreater(dual.profile.counters["dual_iterations"], 0)
+        with self.assertRaises(ValueError):
+            SimplexSolver(boxed, start="sideways").solve()
+
+    def test_dual_simplex_reoptimize(self):
+        model = random_model(30, 40)
+        cold = DualSimplexSolver(model)
+        obj, _ = cold.solve()
+        self.assertAlmostEqual(obj, SimplexSolver(model).solve()[0])
+
+        for constraint in model.constraints[::3]:
+            constraint.rhs *= 0.8
+        model.add_constraint(model.variables.dot(np.ones(40)), ">=", 1)
+        reference, _ = DualSimplexSolver(model).solve()
+        warm = DualSimplexSolver(model, warm_start=cold.basis)
+        obj, _ = warm.solve()
+        self.assertAlmostEqual(obj, reference)
+        self.assertLess(warm.iterations, cold.iterations)
+
+    def test_model_solve_presolve(self):
+        model = random_model(20, 25)
+        x = model.variables
+        model.add_constraint(2 * x[0], "<=", 1)
+        model.add_constraint(LinearExpr(list(x), [1] * 25), "<=", 100)
+        model.add_constraint(LinearExpr(list(x), [2] * 25), "<=", 150)
+        reference = model.solve(warm_start=False, presolve=False).objective
+
+        for solver in ("simplex", "dual-simplex", "interior-point"):
+            result = model.solve(solver=solver, warm_start=False)
+            self.assertEqual(result.presolve.rows, 2)
+            self.assertAlmostEqual(result.objective, reference, places=5)
+            self.assertLessEqual(result.solution["x1"], 0.5 + 1e-9)
+
+        # The fixed variable is substituted, which turns its row into a bound on x2
+        fixed = model.add_variable("fixed", lb=1, ub=1)
+        model.add_constraint(x[1] + fixed, "<=", 2)
+        model.objective.expression += 3 * fixed
+        result = model.solve()
+        self.assertEqual(result.presolve.rows, 3)
+        self.assertEqual(result.presolve.columns, 1)
+        self.assertEqual(result.solution["x26"], 1)
+        self.assertLessEqual(result.solution["x2"], 1 + 1e-9)
+
+    def test_presolve_duals(self):
+        # A singleton row whose bound holds the variable at an original bound
+        singleton = Model("Singleton")
+        x = singleton.add_variables(1)
+        singleton.add_constraint(-3 * x[0] >= 0)
+        singleton.set_objective(-3.993 * x[0], "min")
+
+        # A singleton row that becomes a bound, and a row that is one once a
+        # fixed variable is substituted
+        fixed = Model("Fixed")
+        x = fixed.add_variables(3)
+        fixed.variables[2].lb = fixed.variables[2].ub = 1
+        fixed.add_constraint(x[0] + x[1] <= 5)
+        fixed.add_constraint(3 * x[1] <= 6)
+        fixed.add_constraint(x[0] + x[2] <= 3)
+        fixed.set_objective(x[0] + 2 * x[1] + x[2], "max")
+
+        # Multiples of a row with the tightest bound on either side
+        duplicate = Model("Duplicate")
+        x = duplicate.add_variables(2)
+        duplicate.add_constraint(x[0] + 2 * x[1] >= 2)
+        duplicate.add_constraint(-2 * x[0] - 4 * x[1] >= -10)
+        duplicate.add_constraint(3 * x[0] + 6 * x[1] >= 9)
+        duplicate.add_constraint(x[0] - x[1] <= 1)
+        duplicate.set_objective(2 * x[0] + x[1], "min")
+
+        for model in (singleton, fixed, duplicate):
+            reference = model.solve(warm_start=False, presolve=False)
+            result = model.solve(warm_start=False)
+            self.assertGreater(result.presolve.rows, 0)
+            self.assertTrue(np.allclose(result.duals, reference.duals))
+            self.assertTrue(np.allclose(result.reduced_costs, reference.reduced_costs))
+        self.assertAlmostEqual(singleton.solve(warm_start=False).duals[0], 1.331)
+
+    def test_solve_many(self):
+        models = [random_model(8, 10, seed) for seed in range(6)]
+        expected = [model.solve(warm_start=False).objective for model in models]
+        results = list(solve_many(models, workers=2, warm_start=False))
+        self.assertEqual([result.objective for result in results], expected)
+        self.assertIs(models[0]._basis.__class__, Basis)
+
+        unordered = dict(solve_many(models, workers=2, ordered=False, chunksize=1))
+        self.assertEqual(sorted(unordered), list(range(6)))
+        self.assertAlmostEqual(unordered[3].objective, expected[3])
+
+        infeasible = Model("Infeasible")
+        x = infeasible.add_variable("x")
+        infeasible.add_constraint(x + 0, ">=", 1)
+        infeasible.add_constraint(x + 0, "<=", 0)
+        infeasible.objective = Objective(x + 0, "max")
+        results = list(solve_many([models[0], infeasible], workers=1, errors="return"))
+        self.assertIsInstance(results[1], ValueError)
+        with self.assertRaises(ValueError):
+            list(solve_many([infeasible], workers=1))
+
+    def test_branch_and_bound(self):
+        rng = np.random.default_rng(2)
+        weights = rng.integers(1, 20, (2, 10)).astype(float)
+        values = rng.integers(1, 30, 10).astype(float)
+        capacity = weights.sum(axis=1) * 0.4
+        model = Model("Knapsack")
+        x = model.add_variables(10, 0, 2, "integer")
+        y = model.add_variable("y", 0, 1.5)
+        for i in range(2):
+            model.add_constraint(x.dot(weights[i]) + y, "<=", capacity[i])
+        model.set_objective(x.dot(values) + 3 * y, "max")
+
+        best = -np.inf
+        for counts in itertools.product(range(3), repeat=10):
+            slack = np.min(capacity - weights @ counts)
+            if slack >= 0:
+                best = max(best, values @ counts + 3 * min(slack, 1.5))
+
+        for solver, workers in (("simplex", 1), ("dual-simplex", 2), ("dual-simplex", 1)):
+            result = model.solve(solver=solver, warm_start=False, workers=workers)
+            self.assertAlmostEqual(result.objective, best)
+            self.assertEqual(result.status, "optimal")
+            self.assertTrue(np.all(result.x[:10] == np.round(result.x[:10])))
+            self.assertGreater(result.mip.nodes, 1)
+            self.assertEqual(result.mip.gap, 0)
+        self.assertEqual(result.mip.log[-1].nodes, result.mip.nodes)
+
+        limited = model.solve(solver="dual-simplex", warm_start=False, node_limit=result.mip.nodes - 1)
+        self.assertEqual(limited.status, "node_limit")
+        self.assertLessEqual(limited.objective, best + 1e-9)
+        self.assertGreaterEqual(limited.mip.bound, best - 1e-9)
+        # A relaxation cut off by the iteration limit gives no bound to prune with
+        with self.assertRaisesRegex(ValueError, "iteration limit"):
+            model.solve(warm_start=False, presolve=False, max_iterations=1)
+
+        infeasible = Model("Infeasible")
+        x = infeasible.add_variables(2, 0, 10, "integer")
+        infeasible.add_constraint(x.dot(np.array([2.0, 2.0])), "<=", 1.8)
+        infeasible.add_constraint(x.dot(np.array([2.0, 2.0])), ">=", 1.5)
+        infeasible.set_objective(x.dot(np.ones(2)), "max")
+        with self.assertRaises(ValueError):
+            infeasible.solve(solver="dual-simplex")
+
+    def test_batch_simplex(self):
+        model = random_model(15, 20)
+        form = model.to_matrix_form()
+        rng = np.random.default_rng(1)
+        rhs = form.b * rng.uniform(0.95, 1.05, (12, 15))
+        rhs[5, 0] = -1
+        costs = form.c * rng.uniform(0.95, 1.05, (12, 20))
+
+        solver = BatchSimplexSolver(model, rhs=rhs, costs=costs)
+        objectives, solutions = solver.solve()
+        self.assertTrue(np.isnan(objectives[5]))
+        self.assertEqual(solver.basis_of[5], -1)
+        self.assertLess(solver.individual_solves, 12)
+        for k in (0, 4, 11):
+            obj, sol = DualSimplexSolver(MatrixForm(form.A, rhs[k], costs[k], 0.0)).solve()
+            self.assertAlmostEqual(objectives[k], obj)
+            self.assertAlmostEqual(solutions[k, 3], sol["x4"])
+
+        truncated = BatchSimplexSolver(model, rhs=rhs, costs=costs, max_iterations=1)
+        self.assertTrue(np.all(np.isnan(truncated.solve()[0])))
+        self.assertTrue(np.all(truncated.basis_of == -1))
+
+        result = model.solve_batch(costs=costs)
+        self.assertEqual(result.solutions.shape, (12, 35))
+        obj, _ = DualSimplexSolver(MatrixForm(form.A, form.b, costs[0], 0.0)).solve()
+        self.assertAlmostEqual(result.objectives[0], obj)
+
+    def test_sensitivity(self):
+        model = random_model(15, 20)
+        form = model.to_matrix_form()
+        solver = SimplexSolver(model)
+        obj, sol = solver.solve()
+        sensitivity = solver.sensitivity()
+        self.assertAlmostEqual(sensitivity.duals @ form.b, obj)
+        self.assertTrue(np.all(sensitivity.reduced_costs >= -1e-9))
+
+        # Within its range, a right-hand side changes the objective by its dual
+        i = int(np.argmax(sensitivity.duals))
+        b = form.b.copy()
+        b[i] = (sensitivity.rhs_lower[i] + b[i]) / 2
+        changed, _ = SimplexSolver(MatrixForm(form.A, b, form.c)).solve()
+        self.assertAlmostEqual(changed, obj + sensitivity.duals[i] * (b[i] - form.b[i]))
+        j = int(np.argmax(solver.x[:20]))
+        c = form.c.copy()
+        c[j] = sensitivity.cost_lower[j] + 1e-6
+        changed, _ = SimplexSolver(MatrixForm(form.A, form.b, c)).solve()
+        self.assertAlmostEqual(changed, obj + (c[j] - form.c[j]) * sol[f"x{j+1}"])
+
+        for target, direction, t_range in (("rhs", -np.ones(15), (0, 30)), ("objective", np.linspace(-1, 1, 20), (-3, 3))):
+            path = solver.parametric_solve(direction, t_range, target)
+            self.assertGreater(len(path.t), 2)
+            for t, objective in zip(path.t, path.objectives):
+                b, c = (form.b + t * direction, form.c) if target == "rhs" else (form.b, form.c + t * direction)
+                self.assertAlmostEqual(objective, SimplexSolver(MatrixForm(form.A, b, c)).solve()[0])
+        # Beyond the last breakpoint the right-hand side sweep is infeasible
+        self.assertLess(solver.parametric_solve(-np.ones(15), (0, 30)).t[-1], 30)
+
+        result = model.solve(warm_start=False)
+        self.assertAlmostEqual(result.duals @ form.b, result.objective)
+        self.assertEqual(model.parametric_solve(np.ones(15), (0, 1)).t[0], 0)
+        self.assertAlmostEqual(model.sensitivity().duals @ form.b, result.objective)
+
+    def test_bounds_and_senses(self):
+        rng = np.random.default_rng(4)
+        model = Model("Bounded")
+        x = model.add_variables(8, -3, 4)
+        free = model.add_variable("free", lb=-np.inf)
+        capped = model.add_variable("capped", lb=-np.inf, ub=2)
+        terms = list(x) + [free, capped]
+        A = rng.uniform(-1, 1, (6, 10))
+        for i in range(4):
+            model.add_constraint(LinearExpr(terms, list(A[i])), "<=", 3, rhs_range=5)
+        model.add_constraint(LinearExpr(terms, list(A[4])), ">=", -2)
+        model.add_constraint(free - capped, "=", 1)
+        cost = rng.uniform(-2, 2, 10)
+        model.set_objective(LinearExpr(terms, list(cost)) + 7, "min")
+
+        # Each ranged row -2 <= a x <= 3 and each bound stays a single row or column
+        form = model.to_matrix_form()
+        self.assertEqual(form.shape, (6, 10))
+        self.assertEqual(form.sense, "min")
+        lo, hi = form.row_bounds()
+        self.assertEqual((lo[0], hi[0]), (-2, 3))
+
+        # Every solver agrees on the optimum, with and without presolve
+        results = [model.solve(solver=solver, warm_start=False, presolve=presolve)
+                   for solver in ("simplex", "dual-simplex", "interior-point") for presolve in (False, True)]
+        reference = results[0]
+        activity = form.A @ reference.x
+        self.assertTrue(np.all(activity >= lo - 1e-9) and np.all(activity <= hi + 1e-9))
+        self.assertTrue(np.all(reference.x >= form.lb - 1e-9) and np.all(reference.x <= form.ub + 1e-9))
+        for result in results[1:]:
+            self.assertAlmostEqual(result.objective, reference.objective, places=5)
+        self.assertAlmostEqual(reference.objective, cost @ reference.x + 7)
+
+        # A maximized objective matches the minimum of its negation
+        model.set_objective(LinearExpr(terms, list(-cost)) - 7, "max")
+        self.assertAlmostEqual(model.solve(warm_start=False).objective, -reference.objective)
+
+    def test_solution(self):
+        model = Model("Named")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        model.objective = Objective(x + 2 * y, "max")
+        model.add_constraint(x + y, "<=", 4)
+        model.add_constraint(x + 3 * y, "<=", 6)
+        result = model.solve()
+        self.assertIsInstance(result, Solution)
+        self.assertAlmostEqual(result.objective, 5)
+        self.assertAlmostEqual(result[x], 3)
+        self.assertAlmostEqual(result["y"], 1)
+        self.assertAlmostEqual(result["x2"], 1)
+        self.assertAlmostEqual(result.solution["x3"], 0)
+        self.assertEqual(list(result), ["x1", "x2", "x3", "x4"])
+        self.assertEqual(result.to_dict(), {"x": result.x[0], "y": result.x[1]})
+        self.assertEqual(result.status, "optimal")
+        self.assertGreater(result.iterations, 0)
+        self.assertGreaterEqual(result.time, 0)
+        self.assertNotIn("z", result)
+        with self.assertRaises(KeyError):
+            result["x5"]
+
+    def test_solver_registry(self):
+        class CountingSolver(SimplexSolver):
+            calls = 0
+
+            def solve(self):
+                CountingSolver.calls += 1
+                return super().solve()
+
+        self.addCleanup(registry._solvers.pop, "counting", None)
+        self.addCleanup(registry._solvers.pop, "plugin", None)
+        register_solver("Counting", CountingSolver)
+        model = random_model(5, 6)
+        reference = model.solve(warm_start=False).objective
+        self.assertAlmostEqual(model.solve(solver="counting", warm_start=False).objective, reference)
+        self.assertEqual(CountingSolver.calls, 1)
+        with self.assertRaises(ValueError):
+            model.solve(solver="nonexistent")
+        with self.assertRaises(ValueError):
+            register_solver("object", object)
+
+        # Plugins are found through their entry points and imported on first use
+        plugin = EntryPoint("plugin", "optizenith.solvers.dual_simplex:DualSimplexSolver", registry.ENTRY_POINT_GROUP)
+        with mock.patch.object(registry, "_entry_points_loaded", False), \
+                mock.patch("importlib.metadata.entry_points", return_value=[plugin]):
+            self.assertIn("plugin", available_solvers())
+            self.assertIs(get_solver("Plugin"), DualSimplexSolver)
+        self.assertAlmostEqual(model.solve(solver="plugin", warm_start=False).objective, reference)
+
+        # Importing the package imports neither SciPy nor the solvers
+        code = "import sys, optizenith; print(sorted(m for m in sys.modules if m.startswith(('scipy', 'optizenith.solvers.'))))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(registry.__file__)))
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                env=dict(os.environ, PYTHONPATH=os.path.dirname(root))).stdout
+        self.assertNotIn("scipy", output)
+        self.assertNotIn("simplex", output)
+
+    def test_instrumentation(self):
+        model = random_model(15, 20)
+        x = model.variables
+        model.add_constraint(x[0] + x[1], ">=", 1)
+        events = []
+        result = model.solve(warm_start=False, presolve=False, callbacks=events.append)
+        self.assertEqual([event.iteration for event in events], list(range(1, result.iterations + 1)))
+        self.assertEqual({event.phase for event in events}, {"dual", "primal"})
+        self.assertAlmostEqual(events[-1].objective, result.objective)
+        self.assertEqual(events[-1].infeasibility, 0)
+        self.assertTrue(all(0 <= event.entering < 36 and 0 <= event.leaving < 36 for event in events))
+
+        timings, counters = result.profile
+        self.assertTrue({"assembly", "presolve", "build", "factorize", "pricing", "ratio_test", "update"} <= set(timings))
+        self.assertEqual(counters["pivots"] + counters.get("bound_flips", 0), result.iterations)
+        self.assertEqual(counters["dual_iterations"] + counters["primal_iterations"], result.iterations)
+
+        with self.assertLogs("optizenith.solvers", "INFO") as logs:
+            result = model.solve(solver="interior-point", log=True)
+        records = [json.loads(record.getMessage()) for record in logs.records]
+        self.assertEqual(records[-1]["event"], "profile")
+        self.assertEqual(records[-1]["counters"]["factorizations"], result.iterations)
+        self.assertEqual(records[-2]["phase"], "interior")
+        self.assertAlmostEqual(records[-2]["objective"], result.objective, places=5)
+
+    def test_simplex_unknown_method(self):
+        model = random_model(2, 2)
+        with self.assertRaises(ValueError):
+            SimplexSolver(model, method="tableau").solve()
+
+    def test_simplex_unbounded(self):
+        model = Model("Unbounded")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        model.objective = Objective(LinearExpr([x, y], [1, 1]), "max")
+        model.add_constraint(LinearExpr([x, y], [1, -1]), "<=", 1)
+        with self.assertRaises(ValueError):
+            SimplexSolver(model).solve()
+
+    def test_iteration_limit(self):
+        model = random_model(30, 40)
+        optimal = model.solve(warm_start=False, presolve=False)
+        self.assertEqual(optimal.status, "optimal")
+        result = model.solve(warm_start=False, presolve=False, max_iterations=2)
+        self.assertEqual((result.status, result.iterations), ("iteration_limit", 2))
+        self.assertLess(result.objective, optimal.objective - 1)
+        # Reaching the optimum in the last allowed iteration is not a stop
+        result = model.solve(warm_start=False, presolve=False, max_iterations=optimal.iterations)
+        self.assertEqual(result.status, "optimal")
+        result = model.solve(solver="interior-point", max_iterations=3)
+        self.assertEqual((result.status, result.iterations), ("iteration_limit", 3))
+
     def test_interior_point(self):
         model = Model("Interior Point Test")
         x = model.add_variable("x")
@@ -85,5 +608,127 @@ class TestSolvers(unittest.TestCase):
         obj, sol = solver.solve()
         self.assertAlmostEqual(obj, 40/3)
 
+    def test_interior_point_stall(self):
+        # Mixed senses, ranges and fixed variables on which the iterates used
+        # to break down near the optimum
+        for seed in (51, 139):
+            model = mixed_model(seed)
+            reference = model.solve(presolve=False, warm_start=False)
+            result = model.solve(solver="interior-point", presolve=False, warm_start=False)
+            self.assertEqual(result.status, "optimal")
+            self.assertAlmostEqual(result.objective, reference.objective, delta=1e-6 * abs(reference.objective))
+
+    def test_interior_point_infeasible(self):
+        model = Model("Infeasible")
+        x = model.add_variables(2)
+        model.add_constraint(x[0] + x[1] <= 1)
+        model.add_constraint(x[0] + x[1] >= 2)
+        model.set_objective(x[0] + 0, "max")
+        with self.assertRaisesRegex(ValueError, "The problem is infeasible."):
+            model.solve(solver="interior-point", presolve=False)
+
+        model = Model("Unbounded")
+        x = model.add_variables(3)
+        model.add_constraint(x[0] + x[1] <= 1)
+        model.add_constraint(x[2] - x[0] >= 2)
+        model.set_objective(x[2] - x[1], "max")
+        with self.assertRaisesRegex(ValueError, "The problem is unbounded."):
+            model.solve(solver="interior-point", presolve=False)
+
+    def test_interior_point_crossover(self):
+        model = Model("Diet")
+        x = model.add_variable("x")
+        y = model.add_variable("y")
+        model.objective = Objective(-2 * x - 3 * y, "max")
+        model.add_constraint(x + y, ">=", 4)
+        model.add_constraint(x + 3 * y, ">=", 6)
+        model.add_constraint(x - 3 * y, "=", 2)
+        result = model.solve(solver="interior-point")
+        self.assertAlmostEqual(result.objective, -10, places=6)
+        self.assertIsNotNone(result.basis)
+
+        solver = InteriorPointSolver(model, crossover=True)
+        obj, sol = solver.solve()
+        self.assertAlmostEqual(obj, -10)
+        self.assertAlmostEqual(sol["x2"], 2 / 3)
+
+        model = random_model(40, 60)
+        obj, _ = InteriorPointSolver(model).solve()
+        self.assertAlmostEqual(obj, SimplexSolver(model).solve()[0], places=5)
+
+    def test_interrupted_solve(self):
+        model = random_model(30, 40)
+        optimal = model.solve(warm_start=False).objective
+        result = model.solve(warm_start=False, presolve=False, time_limit=0)
+        self.assertEqual((result.status, result.iterations), ("time_limit", 0))
+        self.assertEqual(model.solve(solver="interior-point", time_limit=0).status, "time_limit")
+
+        token = CancellationToken()
+        result = model.solve(warm_start=False, presolve=False, cancel=token,
+                             callbacks=lambda event: event.iteration == 3 and token.cancel())
+        self.assertEqual((result.status, result.iterations), ("cancelled", 3))
+        self.assertLessEqual(result.objective, optimal + 1e-9)
+        # The next solve continues from the basis reached by the cancelled one
+        result = model.solve(presolve=False)
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, optimal)
+
+        async def solve_all(limiter):
+            models = [random_model(20, 30, seed) for seed in range(4)]
+            return await asyncio.gather(*(model.solve_async(limiter=limiter) for model in models))
+
+        limiter = SolveLimiter(2)
+        results = asyncio.run(solve_all(limiter))
+        self.assertEqual([result.status for result in results], ["optimal"] * 4)
+        self.assertEqual((limiter.running, limiter.waiting), (0, 0))
+
+        async def cancel_solve():
+            token = CancellationToken()
+            started = threading.Event()
+            task = asyncio.ensure_future(random_model(60, 80).solve_async(
+                cancel=token, callbacks=lambda event: (started.set(), time.sleep(0.01))))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return token
+
+        self.assertTrue(asyncio.run(cancel_solve()).cancelled)
+
+    def test_solve_cache(self):
+        cache = SolveCache()
+        first = random_model(20, 30).solve(cache=cache)
+        repeat = random_model(20, 30).solve(cache=cache)
+        self.assertEqual(cache.stats[:2], (1, 1))
+        self.assertAlmostEqual(repeat.objective, first.objective)
+        self.assertEqual(repeat["x3"], first["x3"])
+        self.assertIsNot(repeat.x, first.x)
+        # Other options miss, but start from the basis of the cached solve
+        random_model(20, 30).solve(cache=cache, presolve=False)
+        self.assertEqual(cache.stats[:3], (1, 2, 1))
+
+        # A model of the same structure starts from the nearest cached basis
+        model = random_model(20, 30)
+        model.set_rhs(model.constraints[0], model.constraints[0].rhs * 1.01)
+        warm = model.solve(cache=cache)
+        cold = model.solve(warm_start=False, presolve=True)
+        self.assertEqual(cache.warm_starts, 2)
+        self.assertAlmostEqual(warm.objective, cold.objective)
+        self.assertLess(warm.iterations, cold.iterations)
+
+        # Interrupted solves are not cached, and the budget evicts the oldest entries
+        random_model(20, 30, seed=1).solve(cache=cache, time_limit=0)
+        self.assertEqual(len(cache), 3)
+        hits = cache.hits
+        for _ in range(2):
+            truncated = random_model(20, 30, seed=1).solve(cache=cache, max_iterations=1)
+            self.assertEqual(truncated.status, "iteration_limit")
+        self.assertEqual((len(cache), cache.hits), (3, hits))
+        cache.max_bytes = cache.nbytes
+        random_model(20, 30, seed=2).solve(cache=cache)
+        self.assertEqual((len(cache), cache.evictions), (3, 1))
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
 if __name__ == "__main__":
     unittest.main()